@@ -0,0 +1,247 @@
+"""
+Single-pass span-splice anonymizer.
+
+Drop-in replacement for Presidio's AnonymizerEngine for the strategies this
+app uses (type_marker, redact, mask). Output is byte-identical to
+AnonymizerEngine with the operators the app used to build, but:
+
+- Replacement strings are precomputed per strategy instead of rebuilt
+  (with operator objects) on every call
+- Overlaps are resolved after one sort: pairwise conflict checks only run
+  within clusters of overlapping detections, not across the whole text
+- The output is built with a single join instead of re-slicing the whole
+  text once per entity
+- Each replacement reports its span in both the original and the clean
+  text, so callers can map offsets between them
+
+    anonymized = anonymize(text, analyzer_results, "type_marker")
+    anonymized.text          # "Call [NAME] at [PHONE]"
+    anonymized.replacements  # [Replacement("PERSON", 5, 12, 5, 11), ...]
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Callable
+
+from presidio_analyzer import RecognizerResult
+
+from .config import settings
+
+STRATEGIES = ("type_marker", "redact", "mask")
+
+# Readable markers for common entity types (others: "[Title Case Type]")
+MARKER_OVERRIDES = {
+    "PERSON": "[NAME]",
+    "PHONE_NUMBER": "[PHONE]",
+    "EMAIL_ADDRESS": "[EMAIL]",
+    "DATE_TIME": "[DATE]",
+    "MEDICAL_RECORD_NUMBER": "[MRN]",
+    "GUARDIAN_NAME": "[NAME]",
+    "PEDIATRIC_AGE": "[AGE]",
+    "ROOM": "[ROOM]",
+    "LOCATION": "[LOCATION]",
+}
+
+MASK_CHAR = "*"
+MASK_MAX_CHARS = 100  # Longer entities keep their tail (Presidio mask semantics)
+
+# Adjacent same-type entities separated only by spaces are replaced as one
+_SPACES_ONLY = re.compile(r"^( )+$")
+
+
+def type_marker(entity_type: str) -> str:
+    """Marker for an entity type, e.g. PERSON -> [NAME], ROOM -> [ROOM]."""
+    return MARKER_OVERRIDES.get(entity_type, f"[{entity_type.replace('_', ' ').title()}]")
+
+
+@dataclass(frozen=True)
+class Replacement:
+    """One replaced span, in original and clean text offsets."""
+    entity_type: str
+    original_start: int
+    original_end: int
+    clean_start: int
+    clean_end: int
+
+
+@dataclass
+class AnonymizedText:
+    """Anonymized text and where each replacement landed."""
+    text: str
+    replacements: list[Replacement] = field(default_factory=list)
+
+
+# Working span: [entity_type, start, end, score] (mutable, like Presidio's results)
+_Span = list
+
+
+def _replacer(strategy: str) -> Callable[[str, str], str]:
+    """Replacement function (entity_type, original_span_text) -> new text."""
+    if strategy == "type_marker":
+        # Types outside phi_entities get Presidio's default "<TYPE>"
+        markers = {entity_type: type_marker(entity_type) for entity_type in settings.phi_entities}
+        return lambda entity_type, _: markers.get(entity_type) or f"<{entity_type}>"
+    if strategy == "redact":
+        return lambda _, __: "[REDACTED]"
+    if strategy == "mask":
+        def mask(_: str, span_text: str) -> str:
+            count = min(len(span_text), MASK_MAX_CHARS)
+            return MASK_CHAR * count + span_text[count:]
+        return mask
+    return lambda _, __: "<PHI>"
+
+
+_replacers: dict[tuple[str, tuple[str, ...]], Callable[[str, str], str]] = {}
+
+
+def _get_replacer(strategy: str) -> Callable[[str, str], str]:
+    """Cached replacement function for a strategy (rebuilt if phi_entities changes)."""
+    key = (strategy, tuple(settings.phi_entities))
+    replacer = _replacers.get(key)
+    if replacer is None:
+        replacer = _replacers[key] = _replacer(strategy)
+    return replacer
+
+
+def _intersects(a: _Span, b: _Span) -> bool:
+    return not (a[2] < b[1] or b[2] < a[1]) and min(a[2], b[2]) - max(a[1], b[1]) > 0
+
+
+def _has_conflict(a: _Span, b: _Span) -> bool:
+    """a loses to b: same span with lower-or-equal score, or contained in b."""
+    if a[1] == b[1] and a[2] == b[2]:
+        return a[3] <= b[3]
+    return b[1] <= a[1] and b[2] >= a[2]
+
+
+def _resolve_cluster(spans: list[_Span]) -> list[_Span]:
+    """
+    Presidio's MERGE_SIMILAR_OR_CONTAINED conflict resolution.
+
+    Same-type overlapping spans merge (max score); spans contained in
+    another, or equal to a higher-scoring one, are dropped. Ties are broken
+    by input order exactly as AnonymizerEngine does. Quadratic, so only run
+    on clusters of mutually overlapping spans.
+    """
+    kept: list[_Span] = []
+    others = spans.copy()
+    for span in spans:
+        others.remove(span)
+        for other in others:
+            if other[0] == span[0] and _intersects(span, other):
+                other[1] = min(span[1], other[1])
+                other[2] = max(span[2], other[2])
+                other[3] = max(span[3], other[3])
+                break
+        else:
+            others.append(span)
+            kept.append(span)
+
+    unique: list[_Span] = []
+    others = kept.copy()
+    for span in kept:
+        others.remove(span)
+        if not any(_has_conflict(span, other) for other in others):
+            others.append(span)
+            unique.append(span)
+    return unique
+
+
+def resolve_spans(text: str, results: Iterable[RecognizerResult]) -> list[_Span]:
+    """
+    Final spans to replace, as [entity_type, start, end, score].
+
+    Args:
+        text: Text the results refer to
+        results: Analyzer results, in analyzer order (order breaks ties)
+
+    Returns:
+        Spans in resolution order (not sorted by position)
+    """
+    spans = [[r.entity_type, r.start, r.end, r.score] for r in results]
+    input_order = {id(span): i for i, span in enumerate(spans)}
+
+    # Spans only conflict with spans they overlap: one sort splits them into
+    # clusters, and non-overlapping spans (the common case) skip resolution.
+    # Empty spans can conflict by touching, so they resolve everything together.
+    if all(span[1] < span[2] for span in spans):
+        clusters: list[list[_Span]] = []
+        cluster_end = 0
+        for span in sorted(spans, key=lambda s: (s[1], s[2])):
+            if clusters and span[1] < cluster_end:
+                clusters[-1].append(span)
+                cluster_end = max(cluster_end, span[2])
+            else:
+                clusters.append([span])
+                cluster_end = span[2]
+    else:
+        clusters = [spans]
+
+    resolved: list[_Span] = []
+    for cluster in clusters:
+        if len(cluster) == 1:
+            resolved.extend(cluster)
+        else:
+            cluster.sort(key=lambda s: input_order[id(s)])
+            resolved.extend(_resolve_cluster(cluster))
+    # Survivors keep their input order (the engine's resolution order)
+    spans = sorted(resolved, key=lambda s: input_order[id(s)])
+
+    # Merge same-type neighbours (in resolution order) separated only by spaces
+    merged: list[_Span] = []
+    previous = None
+    for span in spans:
+        if (
+            previous is not None
+            and previous[0] == span[0]
+            and _SPACES_ONLY.search(text[previous[2]:span[1]])
+        ):
+            merged.remove(previous)
+            span[1] = previous[1]
+        merged.append(span)
+        previous = span
+    return merged
+
+
+def anonymize(
+    text: str,
+    results: Iterable[RecognizerResult],
+    strategy: str = "type_marker"
+) -> AnonymizedText:
+    """
+    Replace detected spans in text.
+
+    Args:
+        text: Original text
+        results: Analyzer results to replace (not modified)
+        strategy: "type_marker", "redact" or "mask" (anything else: <PHI>)
+
+    Returns:
+        AnonymizedText with the clean text and replacement offsets
+    """
+    replace = _get_replacer(strategy)
+    spans = sorted(resolve_spans(text, results), key=lambda s: (s[1], s[2]), reverse=True)
+
+    # Splice from the end so a span overlapping the next one is cut at its start
+    pieces: list[str] = []
+    placed: list[tuple[str, int, int, int]] = []
+    boundary = len(text)
+    for entity_type, start, end, _ in spans:
+        stop = min(end, boundary)
+        new_text = replace(entity_type, text[start:end])
+        pieces.append(text[stop:boundary])
+        pieces.append(new_text)
+        placed.append((entity_type, start, stop, len(new_text)))
+        boundary = start
+    pieces.append(text[:boundary])
+    pieces.reverse()
+
+    replacements = []
+    shift = 0
+    for entity_type, start, stop, length in reversed(placed):
+        clean_start = start + shift
+        replacements.append(Replacement(entity_type, start, stop, clean_start, clean_start + length))
+        shift += length - (stop - start)
+
+    return AnonymizedText(text="".join(pieces), replacements=replacements)
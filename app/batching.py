@@ -0,0 +1,315 @@
+"""
+Cross-request batched Whisper inference.
+
+Without batching, each request runs its own `model.transcribe()` and
+concurrent requests simply take turns on the CTranslate2 model. With
+batching enabled, every request still does its own decode, VAD and feature
+extraction, but the expensive encoder/decoder step is handed to a single
+scheduler thread. That thread gathers 30-second chunks from all in-flight
+requests into one batched `generate` call and routes each chunk's output
+back to the request that submitted it.
+
+Built on faster-whisper's BatchedInferencePipeline: its `transcribe()`
+(VAD chunking, language detection, timestamp restoration) runs per request
+and only the per-chunk forward pass is redirected to the shared scheduler.
+The scheduler holds one Whisper pool instance for its lifetime and every
+request uses that instance, without a checkout of its own: batching needs
+all chunks on one model, so further pool instances would sit idle.
+
+Trade-off: batched decoding does not condition on previous text and uses a
+single temperature (no fallback), so output can differ slightly from
+sequential `model.transcribe()`. Batching is therefore opt-in.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+from faster_whisper import BatchedInferencePipeline
+from faster_whisper.transcribe import Segment, Word
+
+from .config import settings
+from .model_pool import ModelPool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _ChunkRequest:
+    """One 30-second chunk waiting for batched inference."""
+    features: np.ndarray
+    tokenizer: Any
+    chunk_metadata: dict[str, Any]
+    options: Any  # faster_whisper TranscriptionOptions
+    future: Future
+
+
+def _batch_key(item: _ChunkRequest) -> tuple:
+    """
+    Chunks can share a generate() call only if decoding options match.
+
+    Covers every option read by BatchedInferencePipeline.forward and
+    generate_segment_batched; per-request fields such as clip_timestamps
+    don't affect the forward pass.
+    """
+    options = item.options
+    return (
+        id(item.tokenizer.tokenizer),
+        item.tokenizer.task,
+        item.tokenizer.language,
+        options.beam_size,
+        options.patience,
+        options.length_penalty,
+        options.repetition_penalty,
+        options.no_repeat_ngram_size,
+        options.temperatures[0],
+        options.initial_prompt,
+        options.hotwords,
+        options.max_new_tokens,
+        options.suppress_blank,
+        tuple(options.suppress_tokens or ()),
+        options.without_timestamps,
+        options.multilingual,
+        options.word_timestamps,
+    )
+
+
+class WhisperBatchScheduler:
+    """
+    Gathers chunks from concurrent requests into batched inference calls.
+
+    A batch is dispatched when it reaches `batch_size` chunks or when the
+    oldest chunk has waited `max_wait_ms`, whichever comes first.
+    """
+
+    def __init__(self, pipeline: Any, batch_size: int, max_wait_ms: float):
+        self.pipeline = pipeline
+        self.batch_size = max(1, batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_ms) / 1000
+        self.batches = 0
+        self.chunks = 0
+        self.largest_batch = 0
+        self._queue: queue.Queue[Optional[_ChunkRequest]] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def model(self) -> Any:
+        """The Whisper model batched forward passes run on."""
+        return self.pipeline.model
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="whisper-batcher", daemon=True
+                    )
+                    self._thread.start()
+                    logger.info(
+                        f"Started Whisper batch scheduler: batch_size={self.batch_size}, "
+                        f"max_wait={self.max_wait_seconds * 1000:.0f}ms"
+                    )
+
+    def submit(
+        self,
+        features: np.ndarray,
+        tokenizer: Any,
+        chunk_metadata: dict[str, Any],
+        options: Any
+    ) -> Future:
+        """
+        Queue one chunk for batched inference.
+
+        Returns:
+            Future resolving to the chunk's list of segment dicts
+        """
+        self._ensure_started()
+        future: Future = Future()
+        self._queue.put(_ChunkRequest(features, tokenizer, chunk_metadata, options, future))
+        return future
+
+    def _collect_batch(self, first: _ChunkRequest) -> tuple[list[_ChunkRequest], bool]:
+        """Wait up to max_wait for more chunks. Returns (batch, stop_requested)."""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait_seconds
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch, stop = self._collect_batch(first)
+
+            groups: dict[tuple, list[_ChunkRequest]] = {}
+            for item in batch:
+                groups.setdefault(_batch_key(item), []).append(item)
+            for group in groups.values():
+                self._infer(group)
+
+    def _infer(self, group: list[_ChunkRequest]) -> None:
+        try:
+            outputs = self.pipeline.forward(
+                np.stack([item.features for item in group]),
+                group[0].tokenizer,
+                [item.chunk_metadata for item in group],
+                group[0].options,
+            )
+        except Exception as e:
+            logger.error(f"Batched inference failed for {len(group)} chunks: {type(e).__name__}")
+            for item in group:
+                item.future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.chunks += len(group)
+        self.largest_batch = max(self.largest_batch, len(group))
+        for item, output in zip(group, outputs):
+            item.future.set_result(output)
+
+    def stats(self) -> dict[str, Any]:
+        """Batching statistics (no PHI)."""
+        return {
+            "batch_size": self.batch_size,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+            "queued_chunks": self._queue.qsize(),
+            "batches": self.batches,
+            "chunks": self.chunks,
+            "mean_batch_size": round(self.chunks / self.batches, 2) if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the scheduler thread after queued chunks are processed."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+class ScheduledBatchPipeline(BatchedInferencePipeline):
+    """
+    Per-request batched pipeline whose forward passes run on the scheduler.
+
+    Keeps at most `batch_size` chunks in flight per request so a long
+    recording cannot monopolise the scheduler queue, and yields segments in
+    order as their chunks complete.
+
+    Overrides BatchedInferencePipeline._batched_segments_generator
+    (faster-whisper 1.1+, see requirements.txt); keep it in step with
+    upstream when upgrading.
+    """
+
+    def __init__(self, model: Any, scheduler: WhisperBatchScheduler):
+        super().__init__(model)
+        self.scheduler = scheduler
+
+    def _batched_segments_generator(
+        self, features, tokenizer, chunks_metadata, batch_size, options, log_progress
+    ) -> Iterator[Segment]:
+        in_flight: deque[Future] = deque()
+        submitted = 0
+        seg_idx = 0
+
+        while submitted < len(features) or in_flight:
+            while submitted < len(features) and len(in_flight) < self.scheduler.batch_size:
+                in_flight.append(self.scheduler.submit(
+                    features[submitted], tokenizer, chunks_metadata[submitted], options
+                ))
+                submitted += 1
+
+            for segment in in_flight.popleft().result():
+                seg_idx += 1
+                yield Segment(
+                    seek=segment["seek"],
+                    id=seg_idx,
+                    text=segment["text"],
+                    start=round(segment["start"], 3),
+                    end=round(segment["end"], 3),
+                    words=(
+                        None
+                        if not options.word_timestamps
+                        else [Word(**word) for word in segment["words"]]
+                    ),
+                    tokens=segment["tokens"],
+                    avg_logprob=segment["avg_logprob"],
+                    no_speech_prob=segment["no_speech_prob"],
+                    compression_ratio=segment["compression_ratio"],
+                    temperature=options.temperatures[0],
+                )
+
+        # As BatchedInferencePipeline does after the last chunk
+        self.last_speech_timestamp = 0.0
+
+
+# Lazily created on first batched request, with the pool instance it holds
+_scheduler: Optional[WhisperBatchScheduler] = None
+_scheduler_checkout: Optional[ExitStack] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_batch_scheduler(pool: ModelPool) -> WhisperBatchScheduler:
+    """
+    Get (or create) the shared scheduler. Thread-safe.
+
+    On creation the scheduler checks out one instance from the pool and
+    keeps it until shutdown_batch_scheduler(); requests transcribe with
+    scheduler.model rather than checking out their own.
+
+    Args:
+        pool: Whisper model pool
+
+    Returns:
+        The shared WhisperBatchScheduler
+    """
+    global _scheduler, _scheduler_checkout
+
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                checkout = ExitStack()
+                model = checkout.enter_context(pool.checkout())
+                _scheduler_checkout = checkout
+                _scheduler = WhisperBatchScheduler(
+                    BatchedInferencePipeline(model),
+                    batch_size=settings.whisper_batch_size,
+                    max_wait_ms=settings.whisper_batch_max_wait_ms,
+                )
+    return _scheduler
+
+
+def batching_stats() -> Optional[dict[str, Any]]:
+    """Scheduler statistics, or None if batching has not been used."""
+    return _scheduler.stats() if _scheduler is not None else None
+
+
+def shutdown_batch_scheduler() -> None:
+    """Stop the shared scheduler thread and return its model to the pool (application shutdown)."""
+    global _scheduler, _scheduler_checkout
+
+    with _scheduler_lock:
+        if _scheduler is not None:
+            _scheduler.shutdown()
+            _scheduler = None
+        if _scheduler_checkout is not None:
+            _scheduler_checkout.close()
+            _scheduler_checkout = None
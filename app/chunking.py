@@ -0,0 +1,318 @@
+"""
+Parallel chunked transcription for long recordings.
+
+A single `model.transcribe()` call decodes a recording strictly in order,
+so a 20-minute unit handoff uses one model's worth of threads no matter
+how many cores are idle. For long recordings this module instead:
+
+1. Runs VAD over the whole recording and cuts it into chunks of roughly
+   parallel_chunk_seconds, cutting in the middle of silences
+2. Transcribes the chunks in parallel on a process pool where each worker
+   holds its own WhisperModel
+3. Stitches the chunk transcripts back together in order, shifting
+   timestamps to recording time
+
+Continuous speech with no usable silence is force-split with a short
+overlap; the words transcribed twice in the overlap are de-duplicated
+when stitching.
+"""
+
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Longest run of words compared when de-duplicating overlap text
+MAX_OVERLAP_WORDS = 30
+
+
+class AudioChunk(NamedTuple):
+    """A slice of the recording, in samples."""
+    start: int
+    end: int
+    overlaps_previous: bool = False  # Forced cut: starts inside the previous chunk
+
+
+class ChunkSegment(NamedTuple):
+    """A transcribed segment with recording-relative timestamps."""
+    start: float
+    end: float
+    text: str
+
+
+@dataclass
+class ChunkedTranscriptionInfo:
+    """Transcription info for a chunked run (filled in as chunks complete)."""
+    duration: float
+    chunks: int
+    language: Optional[str] = None
+    language_probability: float = 0.0
+
+
+def plan_chunks(
+    speech_timestamps: list[dict[str, int]],
+    total_samples: int,
+    sampling_rate: int,
+    target_seconds: float,
+    overlap_seconds: float
+) -> list[AudioChunk]:
+    """
+    Split a recording into chunks at silences.
+
+    Cuts are placed in the middle of the silence between two speech regions,
+    as soon as the current chunk reaches target_seconds. Chunks that still
+    exceed 1.5x the target (continuous speech) are force-split into
+    target-length pieces that overlap by overlap_seconds.
+
+    Args:
+        speech_timestamps: VAD speech regions ({"start", "end"} in samples)
+        total_samples: Length of the recording in samples
+        sampling_rate: Sample rate in Hz
+        target_seconds: Desired chunk length
+        overlap_seconds: Overlap used for forced cuts
+
+    Returns:
+        Chunks covering the whole recording, in order
+    """
+    target = int(target_seconds * sampling_rate)
+    overlap = int(overlap_seconds * sampling_rate)
+
+    cuts = [0]
+    for current, following in zip(speech_timestamps, speech_timestamps[1:]):
+        cut = (current["end"] + following["start"]) // 2
+        if cut - cuts[-1] >= target:
+            cuts.append(cut)
+    cuts.append(total_samples)
+
+    chunks = []
+    for start, end in zip(cuts, cuts[1:]):
+        if end - start <= target * 1.5:
+            chunks.append(AudioChunk(start, end))
+            continue
+        # No usable silence: hard cuts with overlap
+        piece_start = start
+        while piece_start < end:
+            piece_end = min(piece_start + target, end)
+            if end - piece_end < target // 2:
+                piece_end = end  # Don't leave a tiny tail chunk
+            chunks.append(AudioChunk(
+                max(start, piece_start - overlap), piece_end, overlaps_previous=piece_start > start
+            ))
+            piece_start = piece_end
+
+    return chunks
+
+
+def _normalize_word(word: str) -> str:
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def _overlap_length(previous_words: list[str], next_words: list[str]) -> int:
+    """Longest n where the last n previous words equal the first n next words."""
+    previous = [_normalize_word(w) for w in previous_words[-MAX_OVERLAP_WORDS:]]
+    following = [_normalize_word(w) for w in next_words[:MAX_OVERLAP_WORDS]]
+    for n in range(min(len(previous), len(following)), 0, -1):
+        if previous[-n:] == following[:n]:
+            return n
+    return 0
+
+
+def _drop_leading_words(segments: list[ChunkSegment], count: int) -> list[ChunkSegment]:
+    """Remove `count` words from the start of a chunk's segments."""
+    result = []
+    for segment in segments:
+        words = segment.text.split()
+        if count >= len(words):
+            count -= len(words)
+            continue
+        if count:
+            segment = segment._replace(text=" ".join(words[count:]))
+            count = 0
+        result.append(segment)
+    return result
+
+
+def stitch_segments(
+    previous_tail: list[str],
+    segments: list[ChunkSegment],
+    overlaps_previous: bool
+) -> list[ChunkSegment]:
+    """
+    De-duplicate text a forced-cut chunk shares with the previous chunk.
+
+    Args:
+        previous_tail: Trailing words already emitted
+        segments: The new chunk's segments (recording-relative timestamps)
+        overlaps_previous: Whether the chunk starts inside the previous one
+
+    Returns:
+        The chunk's segments with repeated leading words removed
+    """
+    if not overlaps_previous or not previous_tail:
+        return segments
+    next_words = " ".join(s.text for s in segments[:MAX_OVERLAP_WORDS]).split()
+    return _drop_leading_words(segments, _overlap_length(previous_tail, next_words))
+
+
+# =============================================================================
+# Worker process
+# =============================================================================
+
+_worker_model = None
+
+
+def _init_worker(model_name: str, device: str, compute_type: str, cpu_threads: int) -> None:
+    """Load this worker's own WhisperModel (runs once per pool process)."""
+    global _worker_model
+    from faster_whisper import WhisperModel
+
+    _worker_model = WhisperModel(
+        model_name, device=device, compute_type=compute_type, cpu_threads=cpu_threads
+    )
+
+
+def _transcribe_chunk(
+    pcm: np.ndarray,
+    offset_seconds: float,
+    transcribe_kwargs: dict[str, Any]
+) -> tuple[list[ChunkSegment], str, float]:
+    """Transcribe one chunk in a worker process."""
+    segments, info = _worker_model.transcribe(pcm, **transcribe_kwargs)
+    return (
+        [
+            ChunkSegment(s.start + offset_seconds, s.end + offset_seconds, s.text.strip())
+            for s in segments
+        ],
+        info.language,
+        info.language_probability,
+    )
+
+
+# =============================================================================
+# Pool
+# =============================================================================
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _worker_cpu_threads() -> int:
+    if settings.parallel_worker_cpu_threads > 0:
+        return settings.parallel_worker_cpu_threads
+    return max(1, (os.cpu_count() or 1) // settings.parallel_transcription_workers)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Lazy-create the worker pool. Thread-safe."""
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                cpu_threads = _worker_cpu_threads()
+                # spawn: forking a process with loaded CTranslate2 threads is unsafe
+                _pool = ProcessPoolExecutor(
+                    max_workers=settings.parallel_transcription_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(
+                        settings.whisper_model,
+                        settings.whisper_device,
+                        settings.whisper_compute_type,
+                        cpu_threads,
+                    ),
+                )
+                logger.info(
+                    f"Started chunked transcription pool: "
+                    f"workers={settings.parallel_transcription_workers}, cpu_threads={cpu_threads}"
+                )
+    return _pool
+
+
+def shutdown_chunk_pool() -> None:
+    """Stop the worker processes (application shutdown)."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def should_chunk(pcm: np.ndarray, sampling_rate: int) -> bool:
+    """Whether a recording is long enough for parallel chunked transcription."""
+    return (
+        settings.parallel_transcription_workers > 1
+        and len(pcm) / sampling_rate >= settings.parallel_min_duration_seconds
+    )
+
+
+def transcribe_chunked(
+    pcm: np.ndarray,
+    sampling_rate: int,
+    transcribe_kwargs: dict[str, Any]
+) -> tuple[Iterator[ChunkSegment], ChunkedTranscriptionInfo]:
+    """
+    Transcribe a long recording as parallel chunks.
+
+    All chunks are submitted up front; segments are yielded in recording
+    order as soon as each chunk (and every chunk before it) is done.
+
+    Args:
+        pcm: Mono float32 audio
+        sampling_rate: Sample rate in Hz
+        transcribe_kwargs: Keyword arguments for WhisperModel.transcribe
+            (applied to every chunk)
+
+    Returns:
+        Tuple of (segment_iterator, info); info.language is set once the
+        first chunk completes
+    """
+    vad_parameters = transcribe_kwargs.get("vad_parameters") or {}
+    speech = get_speech_timestamps(pcm, VadOptions(**vad_parameters), sampling_rate=sampling_rate)
+    chunks = plan_chunks(
+        speech,
+        len(pcm),
+        sampling_rate,
+        target_seconds=settings.parallel_chunk_seconds,
+        overlap_seconds=settings.parallel_chunk_overlap_seconds,
+    )
+    info = ChunkedTranscriptionInfo(duration=len(pcm) / sampling_rate, chunks=len(chunks))
+    logger.info(f"Transcribing {info.duration:.1f}s of audio as {len(chunks)} parallel chunks")
+
+    pool = _get_pool()
+    futures: list[Future] = [
+        pool.submit(
+            _transcribe_chunk, pcm[chunk.start:chunk.end], chunk.start / sampling_rate, transcribe_kwargs
+        )
+        for chunk in chunks
+    ]
+
+    def segments() -> Iterator[ChunkSegment]:
+        tail: list[str] = []
+        try:
+            for chunk, future in zip(chunks, futures):
+                chunk_segments, language, probability = future.result()
+                if info.language is None:
+                    info.language, info.language_probability = language, probability
+
+                for segment in stitch_segments(tail, chunk_segments, chunk.overlaps_previous):
+                    tail = (tail + segment.text.split())[-MAX_OVERLAP_WORDS:]
+                    yield segment
+        finally:
+            for future in futures:
+                future.cancel()
+
+    return segments(), info
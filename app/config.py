@@ -5,6 +5,7 @@ All settings can be overridden via environment variables or .env file.
 """
 
 from functools import lru_cache
+from typing import Any
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -28,6 +29,61 @@ class Settings(BaseSettings):
         default="int8",
         description="Compute type. Options: int8 (CPU), float16 (GPU)"
     )
+    # Decode profiles: selected per request with ?profile=<name>.
+    # "balanced" reproduces the original hard-coded decoding (beam 5,
+    # temperature fallback, VAD 500ms/0.5).
+    decode_profiles: dict[str, dict[str, Any]] = Field(
+        default={
+            # Greedy, no fallback: quick bedside notes, several times faster
+            "fast": {
+                "beam_size": 1,
+                "best_of": 1,
+                "temperature": [0.0],
+                "condition_on_previous_text": False,
+                "without_timestamps": True,
+                "vad_filter": True,
+                "vad_parameters": {"min_silence_duration_ms": 500, "threshold": 0.5},
+            },
+            "balanced": {
+                "beam_size": 5,
+                "best_of": 5,
+                "temperature": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+                "condition_on_previous_text": True,
+                "without_timestamps": False,
+                "vad_filter": True,
+                "vad_parameters": {"min_silence_duration_ms": 500, "threshold": 0.5},
+            },
+            # Wider beam, more sensitive VAD (keeps quiet speech)
+            "accurate": {
+                "beam_size": 8,
+                "best_of": 5,
+                "temperature": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+                "condition_on_previous_text": True,
+                "without_timestamps": False,
+                "vad_filter": True,
+                "vad_parameters": {"min_silence_duration_ms": 300, "threshold": 0.35},
+            },
+        },
+        description="Named Whisper decoding settings (faster-whisper transcribe() arguments)"
+    )
+    default_decode_profile: str = Field(
+        default="balanced",
+        description="Decode profile used when a request does not choose one"
+    )
+    # Model pool: N instances, each with its own CPU thread budget. Set
+    # TRANSCRIBE_MAX_CONCURRENCY to the pool size so every instance is used.
+    whisper_pool_size: int = Field(
+        default=1,
+        description="Number of Whisper model instances (memory scales with this)"
+    )
+    whisper_cpu_threads: int = Field(
+        default=0,
+        description="CPU threads per instance (0 = CTranslate2 default for one instance, cores / pool size otherwise)"
+    )
+    whisper_num_workers: int = Field(
+        default=1,
+        description="CTranslate2 workers per instance (parallel calls into the same instance)"
+    )
 
     # =========================================================================
     # Presidio Configuration
@@ -91,6 +147,33 @@ class Settings(BaseSettings):
         default=True,
         description="Enable pediatric-specific custom recognizers"
     )
+    pattern_scanner_enabled: bool = Field(
+        default=True,
+        description="Match all custom recognizer patterns in one pass instead of one scan per pattern"
+    )
+    guardian_token_matcher_enabled: bool = Field(
+        default=True,
+        description="Match guardian names on the spaCy tokens instead of per-relationship-word regexes"
+    )
+
+    # =========================================================================
+    # Name Propagation
+    # =========================================================================
+    # Redact every other occurrence of a name detected once with confidence
+    # ("mom Jessica ... jessica called back"). Only cue-based recognizers
+    # (guardian, baby name) seed propagation; spaCy NER hits never do.
+    name_propagation_enabled: bool = Field(
+        default=True,
+        description="Redact all occurrences of confidently detected PERSON/GUARDIAN_NAME names in a document"
+    )
+    name_propagation_min_score: float = Field(
+        default=0.8,
+        description="Minimum score of a guardian or baby-name hit for its other occurrences to be redacted"
+    )
+    name_propagation_min_chars: int = Field(
+        default=3,
+        description="Shortest name (or word of a multi-word name) propagated"
+    )
 
     # =========================================================================
     # Deny List - Medical terms that should NOT be flagged as PHI
@@ -358,13 +441,241 @@ class Settings(BaseSettings):
         default="/tmp/handoff-transcriber",
         description="Temporary directory for audio processing"
     )
+    audio_decode_in_memory: bool = Field(
+        default=True,
+        description="Decode uploads in-process without a temp file (falls back to temp file on failure)"
+    )
+    upload_spool_memory_mb: int = Field(
+        default=1,
+        description="Job uploads up to this size are copied in memory; larger ones spool to temp_dir"
+    )
+
+    # =========================================================================
+    # Processing Executor Configuration
+    # =========================================================================
+    # CPU-bound stages run off the event loop on bounded worker pools.
+    # When a stage's queue is full, requests get 503 + Retry-After.
+    executor_backend: str = Field(
+        default="thread",
+        description="Worker pool backend for CPU-bound stages. Options: thread, process"
+    )
+    transcribe_max_concurrency: int = Field(
+        default=1,
+        description="Maximum concurrent transcriptions"
+    )
+    deidentify_max_concurrency: int = Field(
+        default=2,
+        description="Maximum concurrent de-identification calls"
+    )
+    executor_queue_size: int = Field(
+        default=8,
+        description="Requests allowed to wait per stage before returning 503"
+    )
+    executor_retry_after_seconds: int = Field(
+        default=30,
+        description="Retry-After value (seconds) sent with 503 responses"
+    )
+
+    # =========================================================================
+    # Whisper Batching Configuration
+    # =========================================================================
+    # Opt-in: batches 30s chunks from concurrent requests into one inference
+    # call. Raise TRANSCRIBE_MAX_CONCURRENCY so several requests are in flight.
+    # All requests share one Whisper instance, so WHISPER_POOL_SIZE > 1 only
+    # adds memory in this mode.
+    whisper_batching: bool = Field(
+        default=False,
+        description="Batch Whisper inference across concurrent requests"
+    )
+    whisper_batch_size: int = Field(
+        default=8,
+        description="Maximum audio chunks per batched inference call"
+    )
+    whisper_batch_max_wait_ms: int = Field(
+        default=50,
+        description="How long a chunk may wait for others to fill a batch"
+    )
+
+    # =========================================================================
+    # Parallel Chunked Transcription Configuration
+    # =========================================================================
+    # Long recordings are split at silences and transcribed on a process
+    # pool; each worker loads its own Whisper model (memory x workers).
+    parallel_transcription_workers: int = Field(
+        default=0,
+        description="Worker processes for chunked transcription (0 or 1 disables)"
+    )
+    parallel_min_duration_seconds: float = Field(
+        default=300.0,
+        description="Only recordings at least this long are chunked"
+    )
+    parallel_chunk_seconds: float = Field(
+        default=120.0,
+        description="Target chunk length; cuts are placed in silences"
+    )
+    parallel_chunk_overlap_seconds: float = Field(
+        default=2.0,
+        description="Overlap for forced cuts in continuous speech (de-duplicated when stitching)"
+    )
+    parallel_worker_cpu_threads: int = Field(
+        default=0,
+        description="CPU threads per worker model (0 = cores / workers)"
+    )
+
+    # =========================================================================
+    # Streaming Pipeline Configuration
+    # =========================================================================
+    # De-identify Whisper segments as they are decoded instead of after the
+    # whole recording. Requires the thread executor backend. Off by default:
+    # NER then sees a rolling stream_context_chars window instead of the
+    # whole transcript, and accuracy parity hasn't been shown.
+    stream_deidentification: bool = Field(
+        default=False,
+        description="De-identify transcript segments while transcription is still running"
+    )
+    stream_context_chars: int = Field(
+        default=200,
+        description="Characters of preceding transcript re-analyzed with each segment (cross-segment names)"
+    )
+    incremental_tail_chars: int = Field(
+        default=200,
+        description="Trailing characters of a live transcript kept provisional (re-analyzed on each update)"
+    )
+    incremental_max_tail_chars: int = Field(
+        default=2000,
+        description="Provisional tail finalized at a space when it has no usable sentence boundary"
+    )
+
+    # =========================================================================
+    # Batch De-identification Configuration
+    # =========================================================================
+    # POST /api/deidentify/batch parses many texts in one spaCy nlp.pipe run.
+    deidentify_batch_size: int = Field(
+        default=32,
+        description="Texts per spaCy nlp.pipe batch"
+    )
+    deidentify_batch_n_process: int = Field(
+        default=1,
+        description="spaCy worker processes for batch parsing (each loads its own model)"
+    )
+    deidentify_batch_max_texts: int = Field(
+        default=1000,
+        description="Maximum texts accepted per batch request"
+    )
+
+    # =========================================================================
+    # Long Transcript Configuration
+    # =========================================================================
+    # Long texts are analyzed as overlapping sentence-aligned windows
+    # (bounded memory; parallel across worker processes when configured).
+    deidentify_window_chars: int = Field(
+        default=20000,
+        description="Texts longer than this are analyzed in windows of this size (0 = never)"
+    )
+    deidentify_window_overlap_chars: int = Field(
+        default=500,
+        description="Approximate overlap between consecutive windows (whole sentences)"
+    )
+    deidentify_window_workers: int = Field(
+        default=0,
+        description="Worker processes analyzing windows in parallel (each loads its own spaCy model; 0-1 = in-process)"
+    )
+
+    # =========================================================================
+    # De-identification Worker Pool Configuration
+    # =========================================================================
+    # spaCy holds the GIL, so de-identification threads share one core. The
+    # pool loads the models once at startup and forks workers that share
+    # them copy-on-write (fork start method only). Set
+    # DEIDENTIFY_MAX_CONCURRENCY to at least the worker count.
+    deidentify_pool_workers: int = Field(
+        default=0,
+        description="Forked de-identification worker processes (0-1 = in-process)"
+    )
+    deidentify_pool_short_chars: int = Field(
+        default=2000,
+        description="Texts up to this length may use the first worker, which never takes longer ones"
+    )
+    deidentify_pool_max_worker_mb: int = Field(
+        default=1024,
+        description="Restart a worker whose private (unshared) memory exceeds this (0 = no limit)"
+    )
+    deidentify_pool_max_tasks: int = Field(
+        default=0,
+        description="Restart a worker after this many texts (0 = no limit)"
+    )
+
+    # =========================================================================
+    # Validation Configuration
+    # =========================================================================
+    # Validation re-scans the cleaned text for leaked PHI. Incremental mode
+    # re-analyzes only windows around replaced spans and reuses detection's
+    # analysis for untouched text.
+    incremental_validation: bool = Field(
+        default=True,
+        description="Re-analyze only text around replacements during validation"
+    )
+    validation_context_chars: int = Field(
+        default=100,
+        description="Characters of context re-analyzed on each side of a replacement"
+    )
+    validation_max_window_fraction: float = Field(
+        default=0.5,
+        description="Fall back to a full rescan when windows cover more than this fraction of the text"
+    )
+
+    # =========================================================================
+    # Sentence Cache Configuration
+    # =========================================================================
+    # Memoizes analyzer results per sentence (keyed digests only, no text).
+    # Opt-in: sentences are analyzed without the surrounding document.
+    sentence_cache_enabled: bool = Field(
+        default=False,
+        description="Analyze text per sentence and cache each sentence's analyzer results"
+    )
+    sentence_cache_max_entries: int = Field(
+        default=10000,
+        description="Sentences cached before least recently used entries are evicted"
+    )
+
+    # =========================================================================
+    # Recognizer Instrumentation Configuration
+    # =========================================================================
+    # Per-recognizer latency and hit-rate statistics (GET /api/admin/recognizers).
+    # Read when the analyzer loads.
+    recognizer_metrics_enabled: bool = Field(
+        default=False,
+        description="Record call time, matches and kept matches for each recognizer"
+    )
+
+    # =========================================================================
+    # Asynchronous Job Configuration
+    # =========================================================================
+    job_store_max_jobs: int = Field(
+        default=32,
+        description="Maximum jobs held in memory (unfinished jobs are never evicted)"
+    )
+    job_ttl_seconds: int = Field(
+        default=600,
+        description="Seconds a finished job's result is kept before eviction"
+    )
 
     # =========================================================================
     # SpaCy Configuration
     # =========================================================================
+    # Presidio reads tokens, lemmas (tagger + attribute_ruler + lemmatizer)
+    # and entities; the dependency parser is never used.
     spacy_model: str = Field(
         default="en_core_web_lg",
-        description="SpaCy model for NER. Options: en_core_web_sm, en_core_web_md, en_core_web_lg"
+        description="SpaCy model for NER: sm, md, lg, trf, or any installed package name or path"
+    )
+    spacy_exclude: list[str] = Field(
+        default=["parser", "senter"],
+        description="Pipeline components not loaded at all (saves memory and load time)"
+    )
+    spacy_disable: list[str] = Field(
+        default=[],
+        description="Pipeline components loaded but not run"
     )
 
     # =========================================================================
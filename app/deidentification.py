@@ -5,26 +5,57 @@ Removes PHI from transcripts using:
 1. Standard Presidio NER (PERSON, PHONE, etc.)
 2. Custom pediatric recognizers (guardian names, detailed ages)
 3. Custom medical recognizers (MRN, room numbers)
+
+deidentify_text(mode="fast") skips spaCy entirely: only the regex pattern
+recognizers run, followed by the same thresholds, deny lists and name
+propagation. Much faster, with lower recall (no NER for bare names or
+locations); scripts/benchmark_fast_mode.py reports recall per entity.
 """
 
+import bisect
 import logging
 import threading
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from typing import Optional
 
-from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
-from presidio_analyzer.nlp_engine import NlpEngineProvider
-from presidio_anonymizer import AnonymizerEngine
-from presidio_anonymizer.entities import OperatorConfig
-
+import spacy
+from presidio_analyzer import (
+    AnalyzerEngine,
+    EntityRecognizer,
+    PatternRecognizer,
+    RecognizerRegistry,
+    RecognizerResult,
+)
+from presidio_analyzer import predefined_recognizers as predefined
+from presidio_analyzer.nlp_engine import NlpArtifacts, SpacyNlpEngine
+from spacy.language import Language
+
+from .anonymizer import AnonymizedText, anonymize
 from .config import settings
+from .deny_list import get_deny_list_index
+from .name_propagation import find_names, merge_name_forms, name_forms, propagate_names
+from .pattern_scanner import scan_pattern_recognizers
+from .recognizer_metrics import (
+    DROPPED_DENY_LIST,
+    DROPPED_THRESHOLD,
+    KEPT,
+    instrument_analyzer,
+    recognizer_metrics,
+    timed_docs,
+)
 from .recognizers import get_medical_recognizers, get_pediatric_recognizers
+from .sentence_cache import config_fingerprint, get_sentence_cache
+from .text_windows import analyze_windowed, sentence_spans, should_window
 
 logger = logging.getLogger(__name__)
 
+# De-identification tiers: "full" (NER + patterns), "fast" (patterns only)
+DEIDENTIFY_MODES = ("full", "fast")
+
 # Thread-safe engine loading
 _analyzer: Optional[AnalyzerEngine] = None
-_anonymizer: Optional[AnonymizerEngine] = None
+_fast_registry: Optional[RecognizerRegistry] = None
 _engine_lock = threading.Lock()
 
 
@@ -38,6 +69,20 @@ class EntityInfo:
     text_preview: str  # Partially masked for display
 
 
+@dataclass
+class DetectionTrace:
+    """
+    What detection saw and replaced, for incremental validation.
+
+    Offsets only (no text), so it is safe to keep alongside the result.
+    """
+    # Every analyzer candidate before thresholds/deny lists, in original
+    # text offsets: (entity_type, start, end, score)
+    detections: list[tuple[str, int, int, float]] = field(default_factory=list)
+    # Replaced spans: (original_start, original_end, clean_start, clean_end)
+    replacements: list[tuple[int, int, int, int]] = field(default_factory=list)
+
+
 @dataclass
 class DeidentificationResult:
     """Result of de-identification operation."""
@@ -47,6 +92,10 @@ class DeidentificationResult:
     entity_count: int = 0
     entity_counts_by_type: dict[str, int] = field(default_factory=dict)
     warnings: list[str] = field(default_factory=list)
+    # Tier that detected the entities (see DEIDENTIFY_MODES)
+    mode: str = "full"
+    # None when built outside deidentify_* (validation rescans fully)
+    trace: Optional[DetectionTrace] = field(default=None, repr=False, compare=False)
 
 
 def _mask_text_preview(text: str, max_reveal: int = 3) -> str:
@@ -70,54 +119,182 @@ def _mask_text_preview(text: str, max_reveal: int = 3) -> str:
     return f"{start}{middle}{end}"
 
 
-def _get_engines() -> tuple[AnalyzerEngine, AnonymizerEngine]:
+# Short names for the spaCy English pipelines (any installed package or path also works)
+SPACY_MODEL_ALIASES = {
+    "sm": "en_core_web_sm",
+    "md": "en_core_web_md",
+    "lg": "en_core_web_lg",
+    "trf": "en_core_web_trf",
+}
+
+
+def resolve_spacy_model(name: str) -> str:
+    """Resolve a model alias ("sm", "md", "lg", "trf") to its package name."""
+    return SPACY_MODEL_ALIASES.get(name, name)
+
+
+def load_spacy_pipeline(name: str) -> Language:
+    """
+    Load a spaCy pipeline with settings.spacy_exclude / spacy_disable applied.
+
+    Args:
+        name: Installed package name, alias or path
+
+    Returns:
+        Loaded pipeline
+
+    Raises:
+        RuntimeError: If the model isn't installed
+    """
+    model_name = resolve_spacy_model(name)
+    try:
+        nlp = spacy.load(model_name, exclude=settings.spacy_exclude, disable=settings.spacy_disable)
+    except OSError as e:
+        installed = ", ".join(spacy.util.get_installed_models()) or "none"
+        raise RuntimeError(
+            f"spaCy model '{model_name}' is not installed (installed: {installed}). "
+            f"Install it with: python -m spacy download {model_name}"
+        ) from e
+
+    logger.info(f"Loaded spaCy model {model_name}: components={nlp.pipe_names}")
+    return nlp
+
+
+# Presidio's predefined English recognizers, by the entity each produces
+PREDEFINED_RECOGNIZERS: dict[str, type[EntityRecognizer]] = {
+    "US_BANK_NUMBER": predefined.UsBankRecognizer,
+    "US_DRIVER_LICENSE": predefined.UsLicenseRecognizer,
+    "US_ITIN": predefined.UsItinRecognizer,
+    "US_PASSPORT": predefined.UsPassportRecognizer,
+    "US_SSN": predefined.UsSsnRecognizer,
+    "UK_NHS": predefined.NhsRecognizer,
+    "SG_NRIC_FIN": predefined.SgFinRecognizer,
+    "AU_ABN": predefined.AuAbnRecognizer,
+    "AU_ACN": predefined.AuAcnRecognizer,
+    "AU_TFN": predefined.AuTfnRecognizer,
+    "AU_MEDICARE": predefined.AuMedicareRecognizer,
+    "IN_PAN": predefined.InPanRecognizer,
+    "IN_AADHAAR": predefined.InAadhaarRecognizer,
+    "IN_VEHICLE_REGISTRATION": predefined.InVehicleRegistrationRecognizer,
+    "CREDIT_CARD": predefined.CreditCardRecognizer,
+    "CRYPTO": predefined.CryptoRecognizer,
+    "DATE_TIME": predefined.DateRecognizer,
+    "EMAIL_ADDRESS": predefined.EmailRecognizer,
+    "IBAN_CODE": predefined.IbanRecognizer,
+    "IP_ADDRESS": predefined.IpRecognizer,
+    "MEDICAL_LICENSE": predefined.MedicalLicenseRecognizer,
+    "PHONE_NUMBER": predefined.PhoneRecognizer,
+    "URL": predefined.UrlRecognizer,
+}
+
+
+def _build_registry(nlp_engine: Optional[SpacyNlpEngine], entities: list[str]) -> RecognizerRegistry:
+    """
+    Build a registry with only the recognizers that produce the given entities.
+
+    Equivalent to load_predefined_recognizers() plus the custom recognizers
+    for analysis restricted to these entities, without constructing (and
+    iterating on every call) recognizers for entities never requested.
+
+    Args:
+        nlp_engine: Loaded NLP engine (its NER labels feed SpacyRecognizer).
+            None builds the fast tier: regex PatternRecognizers only, with
+            the regex guardian recognizer (no tokens to match on) and
+            regexes for the phone formats PhoneRecognizer would catch
+        entities: Entity types to detect (settings.phi_entities)
+
+    Returns:
+        RecognizerRegistry for English
+    """
+    wanted = set(entities)
+    registry = RecognizerRegistry()
+
+    for entity_type, recognizer_class in PREDEFINED_RECOGNIZERS.items():
+        if entity_type in wanted:
+            recognizer = recognizer_class(supported_language="en")
+            if isinstance(recognizer, PatternRecognizer):
+                recognizer.global_regex_flags = registry.global_regex_flags
+            elif nlp_engine is None:
+                # e.g. PhoneRecognizer (phonenumbers): ~2ms per call
+                continue
+            registry.add_recognizer(recognizer)
+
+    if nlp_engine is not None:
+        ner_entities = [e for e in nlp_engine.get_supported_entities() if e in wanted]
+        if ner_entities:
+            registry.add_recognizer(
+                predefined.SpacyRecognizer(supported_language="en", supported_entities=ner_entities)
+            )
+
+    # Add custom recognizers, their patterns matched in one pass
+    if settings.enable_custom_recognizers:
+        guardian_token_matcher = nlp_engine is not None and settings.guardian_token_matcher_enabled
+        custom = [
+            recognizer
+            for recognizer in get_medical_recognizers(standard_phone_patterns=nlp_engine is None)
+            + get_pediatric_recognizers(guardian_token_matcher=guardian_token_matcher)
+            if wanted.intersection(recognizer.supported_entities)
+        ]
+        if settings.pattern_scanner_enabled:
+            custom = scan_pattern_recognizers(custom)
+        for recognizer in custom:
+            registry.add_recognizer(recognizer)
+            logger.debug(f"Added recognizer: {recognizer.name}")
+
+    logger.info(f"Registered recognizers: {[r.name for r in registry.recognizers]}")
+    return registry
+
+
+def _get_analyzer() -> AnalyzerEngine:
     """
-    Lazy-load and cache Presidio engines. Thread-safe.
+    Lazy-load and cache the Presidio analyzer. Thread-safe.
+
+    Anonymization doesn't need an engine (see app.anonymizer).
 
     Returns:
-        Tuple of (AnalyzerEngine, AnonymizerEngine)
+        AnalyzerEngine with the custom recognizers registered
     """
-    global _analyzer, _anonymizer
+    global _analyzer
 
-    if _analyzer is None or _anonymizer is None:
+    if _analyzer is None:
         with _engine_lock:
             if _analyzer is None:
                 logger.info("Loading Presidio engines...")
 
-                # Configure NLP engine with spaCy
-                nlp_config = {
-                    "nlp_engine_name": "spacy",
-                    "models": [{"lang_code": "en", "model_name": settings.spacy_model}]
-                }
+                # spaCy pipeline trimmed to what Presidio reads (tokens,
+                # lemmas, entities); loaded here because Presidio's own
+                # loader can't exclude components
+                nlp_engine = SpacyNlpEngine(
+                    models=[{"lang_code": "en", "model_name": resolve_spacy_model(settings.spacy_model)}]
+                )
+                nlp_engine.nlp = {"en": load_spacy_pipeline(settings.spacy_model)}
 
-                provider = NlpEngineProvider(nlp_configuration=nlp_config)
-                nlp_engine = provider.create_engine()
+                registry = _build_registry(nlp_engine, settings.phi_entities)
+                analyzer = AnalyzerEngine(nlp_engine=nlp_engine, registry=registry)
+                if settings.recognizer_metrics_enabled:
+                    instrument_analyzer(analyzer)
+                _analyzer = analyzer
 
-                # Create registry with predefined recognizers
-                registry = RecognizerRegistry()
-                registry.load_predefined_recognizers(nlp_engine=nlp_engine)
+                logger.info("Presidio engines loaded successfully")
 
-                # Add custom recognizers
-                if settings.enable_custom_recognizers:
-                    for recognizer in get_medical_recognizers():
-                        registry.add_recognizer(recognizer)
-                        logger.debug(f"Added recognizer: {recognizer.name}")
+    return _analyzer
 
-                    for recognizer in get_pediatric_recognizers():
-                        registry.add_recognizer(recognizer)
-                        logger.debug(f"Added recognizer: {recognizer.name}")
 
-                _analyzer = AnalyzerEngine(nlp_engine=nlp_engine, registry=registry)
-                _anonymizer = AnonymizerEngine()
+def _get_fast_registry() -> RecognizerRegistry:
+    """Lazy-load and cache the fast tier's pattern-only registry. Thread-safe."""
+    global _fast_registry
 
-                logger.info("Presidio engines loaded successfully")
+    if _fast_registry is None:
+        with _engine_lock:
+            if _fast_registry is None:
+                _fast_registry = _build_registry(None, settings.phi_entities)
 
-    return _analyzer, _anonymizer
+    return _fast_registry
 
 
 def is_engines_loaded() -> bool:
     """Check if Presidio engines are loaded."""
-    return _analyzer is not None and _anonymizer is not None
+    return _analyzer is not None
 
 
 def _get_entity_threshold(entity_type: str) -> float:
@@ -139,35 +316,110 @@ def _get_entity_threshold(entity_type: str) -> float:
     )
 
 
-def deidentify_text(
+def _analyze_and_filter(
+    analyzer: AnalyzerEngine,
     text: str,
-    strategy: str = "type_marker"
-) -> DeidentificationResult:
+    nlp_artifacts: Optional[NlpArtifacts] = None
+) -> list[RecognizerResult]:
     """
-    Remove PHI from text using Presidio.
+    Detect PHI candidates and apply per-entity thresholds and deny lists.
 
     Args:
-        text: The transcript to de-identify
-        strategy: Replacement approach
-            - "type_marker": [NAME], [PHONE], [DATE], etc. (default, most readable)
-            - "redact": [REDACTED] for all PHI
-            - "mask": **** asterisks
+        analyzer: Presidio analyzer engine
+        text: Text to analyze
+        nlp_artifacts: Pre-computed spaCy parse of text (None = parse here)
 
     Returns:
-        DeidentificationResult with clean text and entity details
+        Filtered analyzer results (offsets relative to text)
     """
-    analyzer, anonymizer = _get_engines()
+    return _filter_results(text, _analyze(analyzer, text, nlp_artifacts))
+
+
+def _analyze(
+    analyzer: AnalyzerEngine,
+    text: str,
+    nlp_artifacts: Optional[NlpArtifacts] = None
+) -> list[RecognizerResult]:
+    """Run every recognizer and return all candidates (no thresholds applied)."""
+    if nlp_artifacts is None:
+        if settings.sentence_cache_enabled:
+            return _analyze_sentences(analyzer, text)
+        if should_window(text):
+            return analyze_windowed(analyzer, text)
 
     # Analyze text for PHI entities with minimum threshold (get all candidates)
-    # We filter by per-entity thresholds below
-    raw_results = analyzer.analyze(
+    # Per-entity thresholds are applied by the caller
+    return analyzer.analyze(
         text=text,
         language="en",
         entities=settings.phi_entities,
-        score_threshold=0.0  # Get all, filter by per-entity threshold below
+        score_threshold=0.0,  # Get all, filter by per-entity threshold later
+        nlp_artifacts=nlp_artifacts
     )
 
+
+def _analyze_fast(text: str) -> list[RecognizerResult]:
+    """
+    Run the fast tier's pattern recognizers and return all candidates.
+
+    No spaCy parse, so no NER and no context-word score boosts.
+    """
+    results = []
+    for recognizer in _get_fast_registry().recognizers:
+        results.extend(recognizer.analyze(text, settings.phi_entities, None))
+    return EntityRecognizer.remove_duplicates(results)
+
+
+def _analyze_sentences(analyzer: AnalyzerEngine, text: str) -> list[RecognizerResult]:
+    """
+    Analyze text sentence by sentence, memoizing each sentence's results.
+
+    Sentences missing from the cache are parsed in one nlp.pipe batch.
+    Entities can't span sentences here, and NER sees one sentence of
+    context at a time, which is why the cache is opt-in.
+    """
+    cache = get_sentence_cache()
+    fingerprint = config_fingerprint(analyzer.registry.recognizers)
+
+    spans = sentence_spans(text)
+    keys = [cache.key(text[start:end], fingerprint) for start, end in spans]
+    cached = [cache.get(key) for key in keys]
+
+    missing = [i for i, entry in enumerate(cached) if entry is None]
+    if missing:
+        nlp_engine = analyzer.nlp_engine
+        sentences = [text[spans[i][0]:spans[i][1]] for i in missing]
+        docs = timed_docs(nlp_engine.nlp["en"].pipe(sentences))
+        for i, sentence, doc in zip(missing, sentences, docs):
+            nlp_artifacts = nlp_engine._doc_to_nlp_artifact(doc, "en")
+            entry = tuple(
+                (r.entity_type, r.start, r.end, r.score, r.recognition_metadata)
+                for r in _analyze(analyzer, sentence, nlp_artifacts)
+            )
+            cache.put(keys[i], entry)
+            cached[i] = entry
+
+    results = [
+        RecognizerResult(
+            entity_type=entity_type,
+            start=offset + start,
+            end=offset + end,
+            score=score,
+            recognition_metadata=metadata,
+        )
+        for (offset, _), entry in zip(spans, cached)
+        for entity_type, start, end, score, metadata in entry
+    ]
+    # Same order the analyzer returns for a whole document
+    results.sort(key=lambda r: (-r.score, r.start, -(r.end - r.start)))
+    return results
+
+
+def _filter_results(text: str, raw_results: list[RecognizerResult]) -> list[RecognizerResult]:
+    """Apply per-entity thresholds and deny lists to analyzer candidates."""
     # Filter by per-entity thresholds, then deny lists
+    deny_list = get_deny_list_index()
+    instrumented = settings.recognizer_metrics_enabled
     results = []
     for result in raw_results:
         # Apply per-entity threshold (Phase 2 calibration)
@@ -177,43 +429,53 @@ def deidentify_text(
                 f"Filtered by threshold: {result.entity_type} "
                 f"(score: {result.score:.2f} < threshold: {entity_threshold:.2f})"
             )
+            if instrumented:
+                recognizer_metrics.record_outcome(result, DROPPED_THRESHOLD)
             continue
 
-        detected_text = text[result.start:result.end].strip()
+        # Deny lists: exact match for names/ages, substring match for
+        # LOCATION and DATE_TIME (e.g., "5 months old" matches "months old")
+        detected_text = text[result.start:result.end]
+        if deny_list.is_denied(result.entity_type, detected_text):
+            logger.debug(f"Filtered out deny-listed {result.entity_type}: {detected_text.strip()}")
+            if instrumented:
+                recognizer_metrics.record_outcome(result, DROPPED_DENY_LIST)
+            continue
 
-        # Check LOCATION deny list (uses substring matching like DATE_TIME)
-        if result.entity_type == "LOCATION":
-            detected_lower = detected_text.lower()
-            is_denied = any(term.lower() in detected_lower for term in settings.deny_list_location)
-            if is_denied:
-                logger.debug(f"Filtered out deny-listed LOCATION: {detected_text}")
-                continue
+        if instrumented:
+            recognizer_metrics.record_outcome(result, KEPT)
+        results.append(result)
 
-        # Check PERSON deny list
-        if result.entity_type == "PERSON" and detected_text.lower() in [w.lower() for w in settings.deny_list_person]:
-            logger.debug(f"Filtered out deny-listed PERSON: {detected_text}")
-            continue
+    return results
 
-        # Check GUARDIAN_NAME deny list
-        if result.entity_type == "GUARDIAN_NAME" and detected_text.lower() in [w.lower() for w in settings.deny_list_guardian_name]:
-            logger.debug(f"Filtered out deny-listed GUARDIAN_NAME: {detected_text}")
-            continue
 
-        # Check PEDIATRIC_AGE deny list
-        if result.entity_type == "PEDIATRIC_AGE" and detected_text.lower() in [w.lower() for w in settings.deny_list_pediatric_age]:
-            logger.debug(f"Filtered out deny-listed PEDIATRIC_AGE: {detected_text}")
-            continue
+def _detection_trace(
+    raw_results: list[RecognizerResult],
+    anonymized: AnonymizedText
+) -> DetectionTrace:
+    """Build the trace for incremental validation."""
+    return DetectionTrace(
+        detections=[(r.entity_type, r.start, r.end, r.score) for r in raw_results],
+        replacements=[
+            (r.original_start, r.original_end, r.clean_start, r.clean_end)
+            for r in anonymized.replacements
+        ]
+    )
 
-        # Check DATE_TIME deny list (uses substring match for clinical timeline patterns)
-        # e.g., "5 months old" matches "months old" in deny list
-        if result.entity_type == "DATE_TIME":
-            detected_lower = detected_text.lower()
-            if any(term.lower() in detected_lower for term in settings.deny_list_date_time):
-                logger.debug(f"Filtered out deny-listed DATE_TIME: {detected_text}")
-                continue
 
-        results.append(result)
+def _build_result(
+    text: str,
+    results: list[RecognizerResult],
+    strategy: str,
+    raw_results: Optional[list[RecognizerResult]] = None,
+    mode: str = "full"
+) -> DeidentificationResult:
+    """
+    Anonymize text and collect entity details for filtered analyzer results.
 
+    When raw_results (all candidates) are given, the result carries a
+    DetectionTrace so validation can skip re-analyzing untouched text.
+    """
     # Build entity info list and count by type
     entities_found = []
     entity_counts: dict[str, int] = {}
@@ -236,70 +498,718 @@ def deidentify_text(
         # Count by type
         entity_counts[result.entity_type] = entity_counts.get(result.entity_type, 0) + 1
 
-    # Configure replacement operator based on strategy
-    if strategy == "type_marker":
-        # Replace with type marker: [NAME], [PHONE], etc.
-        operators = {}
-        for entity_type in settings.phi_entities:
-            # Create readable marker
-            marker = f"[{entity_type.replace('_', ' ').title()}]"
-            # Simplify common markers
-            marker_map = {
-                "[Person]": "[NAME]",
-                "[Phone Number]": "[PHONE]",
-                "[Email Address]": "[EMAIL]",
-                "[Date Time]": "[DATE]",
-                "[Medical Record Number]": "[MRN]",
-                "[Guardian Name]": "[NAME]",
-                "[Pediatric Age]": "[AGE]",
-                "[Room]": "[ROOM]",
-                "[Location]": "[LOCATION]",
-            }
-            marker = marker_map.get(marker, marker)
-            operators[entity_type] = OperatorConfig("replace", {"new_value": marker})
-
-    elif strategy == "redact":
-        operators = {
-            "DEFAULT": OperatorConfig("replace", {"new_value": "[REDACTED]"})
-        }
-
-    elif strategy == "mask":
-        operators = {
-            "DEFAULT": OperatorConfig("mask", {
-                "type": "mask",
-                "masking_char": "*",
-                "chars_to_mask": 100,  # Mask entire entity
-                "from_end": False
-            })
-        }
-
-    else:
-        # Default to type_marker
-        operators = {
-            "DEFAULT": OperatorConfig("replace", {"new_value": "<PHI>"})
-        }
-
     # Anonymize the text
-    anonymized = anonymizer.anonymize(
-        text=text,
-        analyzer_results=results,
-        operators=operators
-    )
+    anonymized = anonymize(text, results, strategy)
 
-    logger.info(f"De-identification complete: {len(results)} PHI entities found")
+    trace = None
+    if raw_results is not None:
+        trace = _detection_trace(raw_results, anonymized)
 
     return DeidentificationResult(
         clean_text=anonymized.text,
         original_text=text,
         entities_found=entities_found,
         entity_count=len(results),
-        entity_counts_by_type=entity_counts
+        entity_counts_by_type=entity_counts,
+        mode=mode,
+        trace=trace
     )
 
 
+def deidentify_text(
+    text: str,
+    strategy: str = "type_marker",
+    mode: str = "full"
+) -> DeidentificationResult:
+    """
+    Remove PHI from text using Presidio.
+
+    Args:
+        text: The transcript to de-identify
+        strategy: Replacement approach
+            - "type_marker": [NAME], [PHONE], [DATE], etc. (default, most readable)
+            - "redact": [REDACTED] for all PHI
+            - "mask": **** asterisks
+        mode: Detection tier
+            - "full": spaCy NER plus all recognizers (default)
+            - "fast": regex pattern recognizers only; sub-millisecond on
+              short notes, but bare names and locations are missed
+
+    Returns:
+        DeidentificationResult with clean text and entity details
+
+    Raises:
+        ValueError: If mode is not one of DEIDENTIFY_MODES
+    """
+    if mode == "fast":
+        raw_results = _analyze_fast(text)
+    elif mode == "full":
+        raw_results = _analyze(_get_analyzer(), text)
+    else:
+        raise ValueError(f"Unknown de-identification mode {mode!r}. Available: {', '.join(DEIDENTIFY_MODES)}")
+
+    results = _filter_results(text, raw_results)
+    if settings.name_propagation_enabled:
+        propagated = propagate_names(text, results)
+        results = sorted(results + propagated, key=lambda r: r.start)
+        raw_results = raw_results + propagated
+
+    logger.info(f"De-identification complete ({mode}): {len(results)} PHI entities found")
+
+    return _build_result(text, results, strategy, raw_results, mode)
+
+
+def deidentify_batch(
+    texts: list[str],
+    strategy: str = "type_marker",
+    batch_size: Optional[int] = None,
+    n_process: Optional[int] = None
+) -> list[DeidentificationResult]:
+    """
+    Remove PHI from many texts at once.
+
+    spaCy parsing (the dominant per-call cost) runs for all texts through
+    one nlp.pipe call, with texts sorted by length so each batch holds
+    similarly sized documents. Pattern recognizers, thresholds, deny lists
+    and name propagation are then applied per text exactly as in
+    deidentify_text.
+
+    Args:
+        texts: Texts to de-identify
+        strategy: Replacement approach (see deidentify_text)
+        batch_size: Texts per nlp.pipe batch (None = settings.deidentify_batch_size)
+        n_process: spaCy worker processes (None = settings.deidentify_batch_n_process)
+
+    Returns:
+        One DeidentificationResult per text, in input order
+    """
+    analyzer = _get_analyzer()
+    nlp_engine = analyzer.nlp_engine
+    nlp = nlp_engine.nlp["en"]
+
+    # Similar lengths per batch keep padding and per-batch latency down
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    docs = timed_docs(nlp.pipe(
+        (texts[i] for i in order),
+        batch_size=batch_size or settings.deidentify_batch_size,
+        n_process=n_process or settings.deidentify_batch_n_process,
+    ))
+
+    results: list[Optional[DeidentificationResult]] = [None] * len(texts)
+    for i, doc in zip(order, docs):
+        nlp_artifacts = nlp_engine._doc_to_nlp_artifact(doc, "en")
+        raw_results = _analyze(analyzer, texts[i], nlp_artifacts)
+        filtered = _filter_results(texts[i], raw_results)
+        if settings.name_propagation_enabled:
+            propagated = propagate_names(texts[i], filtered)
+            filtered = sorted(filtered + propagated, key=lambda r: r.start)
+            raw_results = raw_results + propagated
+        results[i] = _build_result(texts[i], filtered, strategy, raw_results)
+
+    logger.info(f"Batch de-identification complete: {len(texts)} texts")
+    return results
+
+
+def _clip_results(results: list[RecognizerResult], offset: int) -> list[RecognizerResult]:
+    """Drop results ending before offset; clip the rest and make them relative to it."""
+    return [
+        RecognizerResult(
+            entity_type=result.entity_type,
+            start=max(result.start, offset) - offset,
+            end=result.end - offset,
+            score=result.score,
+            analysis_explanation=result.analysis_explanation,
+            recognition_metadata=result.recognition_metadata,
+        )
+        for result in results
+        if result.end > offset
+    ]
+
+
+def _piecewise_result(
+    text: str,
+    clean_text: str,
+    entities: list[EntityInfo],
+    entity_counts: dict[str, int],
+    trace: DetectionTrace,
+    strategy: str
+) -> DeidentificationResult:
+    """
+    Result for a transcript de-identified in pieces.
+
+    Names confirmed in a later piece are propagated back over the whole
+    transcript (one pass); if that finds more, the text is re-anonymized.
+    """
+    results = [RecognizerResult(e.entity_type, e.start, e.end, e.score) for e in entities]
+    propagated = propagate_names(text, results) if settings.name_propagation_enabled else []
+    if propagated:
+        raw_results = [RecognizerResult(*detection) for detection in trace.detections] + propagated
+        return _build_result(text, sorted(results + propagated, key=lambda r: r.start), strategy, raw_results)
+
+    return DeidentificationResult(
+        clean_text=clean_text,
+        original_text=text,
+        entities_found=list(entities),
+        entity_count=len(entities),
+        entity_counts_by_type=dict(entity_counts),
+        trace=DetectionTrace(list(trace.detections), list(trace.replacements))
+    )
+
+
+@dataclass
+class DeidentifiedSegment:
+    """De-identified text for one transcript segment."""
+    index: int
+    clean_text: str
+    entities_found: list[EntityInfo] = field(default_factory=list)
+
+
+class StreamingDeidentifier:
+    """
+    De-identifies a transcript segment by segment as it is decoded.
+
+    Each segment is analyzed together with the tail of the preceding
+    transcript (a rolling context window), so names split across segment
+    boundaries ("... mom is" / "Jessica ...") are still caught. Only
+    entities that reach into the new segment are redacted; the context
+    itself was already emitted with the previous segment.
+
+    Segments are joined with single spaces, matching transcribe_audio, so
+    finish() returns offsets relative to the full transcript.
+
+    Not thread-safe: feed segments from one caller at a time.
+    """
+
+    def __init__(
+        self,
+        strategy: str = "type_marker",
+        context_chars: Optional[int] = None
+    ):
+        self.strategy = strategy
+        self.context_chars = (
+            settings.stream_context_chars if context_chars is None else context_chars
+        )
+        self._raw_parts: list[str] = []
+        self._clean_parts: list[str] = []
+        self._raw_length = 0
+        self._clean_length = 0
+        self._entities: list[EntityInfo] = []
+        self._entity_counts: dict[str, int] = {}
+        # Detection trace for the whole transcript, in transcript offsets
+        self._trace = DetectionTrace()
+        # Confirmed names of all segments so far (see name_propagation)
+        self._name_forms: dict[str, tuple[str, float]] = {}
+
+    def _context(self) -> str:
+        """Tail of the transcript so far, starting on a word boundary."""
+        if not self._raw_parts or self.context_chars <= 0:
+            return ""
+
+        # Walk back only as far as needed (cost independent of transcript length)
+        parts: list[str] = []
+        length = -1
+        for part in reversed(self._raw_parts):
+            parts.append(part)
+            length += len(part) + 1
+            if length >= self.context_chars:
+                break
+        tail = " ".join(reversed(parts))
+
+        if len(tail) > self.context_chars:
+            tail = tail[-self.context_chars:]
+            # Don't start the context mid-word
+            if " " in tail:
+                tail = tail[tail.index(" ") + 1:]
+        return tail + " "
+
+    def feed(self, text: str) -> Optional[DeidentifiedSegment]:
+        """
+        De-identify the next transcript segment.
+
+        Args:
+            text: Segment text (already cleaned); empty segments are skipped
+
+        Returns:
+            DeidentifiedSegment, or None if the segment was empty
+        """
+        if not text:
+            return None
+
+        analyzer = _get_analyzer()
+
+        context = self._context()
+        window = context + text
+        offset = len(context)
+
+        # Keep entities (and all candidates, for the trace) reaching into
+        # the new segment, clipped to it
+        window_results = _analyze(analyzer, window)
+        kept = _filter_results(window, window_results)
+        if settings.name_propagation_enabled:
+            # Names confirmed in this window or any earlier segment
+            self._name_forms = merge_name_forms(self._name_forms, name_forms(window, kept))
+            propagated = find_names(window, self._name_forms, kept)
+            kept = sorted(kept + propagated, key=lambda r: r.start)
+            window_results = window_results + propagated
+        raw_results = _clip_results(window_results, offset)
+        results = _clip_results(kept, offset)
+
+        # Offset of this segment within the full transcript
+        base = self._raw_length + (1 if self._raw_parts else 0)
+
+        entities = []
+        for result in results:
+            entities.append(EntityInfo(
+                entity_type=result.entity_type,
+                score=result.score,
+                start=base + result.start,
+                end=base + result.end,
+                text_preview=_mask_text_preview(text[result.start:result.end])
+            ))
+            self._entity_counts[result.entity_type] = (
+                self._entity_counts.get(result.entity_type, 0) + 1
+            )
+
+        anonymized = anonymize(text, results, self.strategy)
+        clean_text = anonymized.text
+        clean_base = self._clean_length + (1 if self._clean_parts else 0)
+
+        self._trace.detections.extend(
+            (result.entity_type, base + result.start, base + result.end, result.score)
+            for result in raw_results
+        )
+        self._trace.replacements.extend(
+            (base + r.original_start, base + r.original_end,
+             clean_base + r.clean_start, clean_base + r.clean_end)
+            for r in anonymized.replacements
+        )
+
+        segment = DeidentifiedSegment(
+            index=len(self._raw_parts),
+            clean_text=clean_text,
+            entities_found=entities
+        )
+        self._raw_parts.append(text)
+        self._raw_length = base + len(text)
+        self._clean_parts.append(clean_text)
+        self._clean_length = clean_base + len(clean_text)
+        self._entities.extend(entities)
+        return segment
+
+    def feed_many(self, texts: list[str]) -> list[DeidentifiedSegment]:
+        """Feed several segments in order (one executor hop for a backlog)."""
+        return [segment for segment in map(self.feed, texts) if segment is not None]
+
+    def finish(self) -> DeidentificationResult:
+        """
+        Assemble the result for the whole transcript fed so far.
+
+        Names first confirmed in a later segment are also redacted in the
+        earlier ones, so the result may redact more than the segments did.
+        """
+        result = _piecewise_result(
+            " ".join(self._raw_parts), " ".join(self._clean_parts),
+            self._entities, self._entity_counts, self._trace, self.strategy
+        )
+        logger.info(
+            f"Streaming de-identification complete: {len(self._raw_parts)} segments, "
+            f"{result.entity_count} PHI entities found"
+        )
+        return result
+
+
+def deidentify_stream(
+    segments: Iterable[str],
+    strategy: str = "type_marker",
+    context_chars: Optional[int] = None
+) -> Iterator[DeidentifiedSegment]:
+    """
+    Generator form of StreamingDeidentifier.
+
+    Consumes segment texts lazily (e.g., straight from a transcription
+    generator) and yields each de-identified segment as soon as it is ready.
+
+    Args:
+        segments: Iterable of cleaned segment texts
+        strategy: Replacement approach (see deidentify_text)
+        context_chars: Rolling context size (default: settings.stream_context_chars)
+
+    Yields:
+        DeidentifiedSegment for each non-empty segment
+    """
+    deidentifier = StreamingDeidentifier(strategy, context_chars)
+    for text in segments:
+        segment = deidentifier.feed(text)
+        if segment is not None:
+            yield segment
+
+
+@dataclass
+class IncrementalUpdate:
+    """Change to an incrementally de-identified transcript after one update."""
+    # Clean text that became final; append it to the finalized text so far
+    finalized: str
+    # Clean text of the provisional tail; replaces the previous tail
+    tail: str
+    # Clean characters finalized so far (where tail starts)
+    finalized_length: int
+    # Whether the previous tail was revised rather than only extended
+    corrected: bool = False
+    # Entities in the newly finalized text (transcript offsets)
+    entities_found: list[EntityInfo] = field(default_factory=list)
+
+
+class IncrementalDeidentifier:
+    """
+    De-identifies an append-only transcript as it grows.
+
+    The transcript is split into a finalized prefix, whose de-identified
+    text never changes, and a provisional tail. Each update re-analyzes
+    only the tail plus some finalized context before it (whole sentences,
+    about context_chars), so its cost follows the new text rather than the
+    transcript length. Sentences then become final once they are at least
+    tail_chars from the end of the transcript and no entity crosses their
+    start; the last sentence always stays provisional, since it may still
+    be growing. A tail longer than max_tail_chars without a usable sentence
+    boundary is finalized at a space instead.
+
+        session = IncrementalDeidentifier()
+        for transcript in live_transcripts:       # each extends the last
+            update = session.update(transcript)
+            final += update.finalized
+            shown = final + update.tail
+        result = session.finish()
+
+    Not thread-safe: update from one caller at a time.
+    """
+
+    def __init__(
+        self,
+        strategy: str = "type_marker",
+        context_chars: Optional[int] = None,
+        tail_chars: Optional[int] = None,
+        max_tail_chars: Optional[int] = None
+    ):
+        self.strategy = strategy
+        self.context_chars = settings.stream_context_chars if context_chars is None else context_chars
+        self.tail_chars = settings.incremental_tail_chars if tail_chars is None else tail_chars
+        self.max_tail_chars = (
+            settings.incremental_max_tail_chars if max_tail_chars is None else max_tail_chars
+        )
+        self._raw_parts: list[str] = []
+        self._clean_parts: list[str] = []
+        self._raw_length = 0
+        self._clean_length = 0
+        # Unfinalized transcript text, its last provisional clean text, and
+        # the finalized text analyzed with it
+        self._pending = ""
+        self._tail_clean = ""
+        self._context = ""
+        self._entities: list[EntityInfo] = []
+        self._entity_counts: dict[str, int] = {}
+        self._trace = DetectionTrace()
+        # Confirmed names of the finalized text (see name_propagation)
+        self._name_forms: dict[str, tuple[str, float]] = {}
+
+    @property
+    def length(self) -> int:
+        """Characters of transcript received so far."""
+        return self._raw_length + len(self._pending)
+
+    def update(self, transcript: str) -> IncrementalUpdate:
+        """
+        De-identify the transcript as it stands now.
+
+        Only its unfinalized part is compared with the previous update;
+        the finalized prefix is assumed unchanged.
+
+        Args:
+            transcript: The whole transcript so far
+
+        Returns:
+            IncrementalUpdate
+
+        Raises:
+            ValueError: If the transcript doesn't extend the previous one
+        """
+        if len(transcript) < self.length or not transcript.startswith(self._pending, self._raw_length):
+            raise ValueError("Transcript changed before its end; incremental updates must only append text")
+        return self.append(transcript[self.length:])
+
+    def append(self, text: str) -> IncrementalUpdate:
+        """
+        Extend the transcript and de-identify the new text.
+
+        Args:
+            text: Text appended to the transcript (including any separating space)
+
+        Returns:
+            IncrementalUpdate
+        """
+        self._pending += text
+        return self._advance(final=False)
+
+    def flush(self) -> IncrementalUpdate:
+        """Finalize the whole transcript, tail included."""
+        return self._advance(final=True)
+
+    def _advance(self, final: bool) -> IncrementalUpdate:
+        """Re-analyze the tail with its context and finalize what became stable."""
+        pending = self._pending
+        previous_tail = self._tail_clean
+        if not pending:
+            self._tail_clean = ""
+            return IncrementalUpdate("", "", self._clean_length, corrected=bool(previous_tail))
+
+        window = self._context + pending
+        offset = len(self._context)
+        window_results = _analyze(_get_analyzer(), window)
+        kept = _filter_results(window, window_results)
+        if settings.name_propagation_enabled:
+            # Names confirmed in this window or in finalized text
+            forms = merge_name_forms(self._name_forms, name_forms(window, kept))
+            propagated = find_names(window, forms, kept)
+            kept = sorted(kept + propagated, key=lambda r: r.start)
+            window_results = window_results + propagated
+        raw_results = _clip_results(window_results, offset)
+        results = _clip_results(kept, offset)
+
+        cut = len(pending) if final else self._stable_end(pending, results)
+        finalized = anonymize(pending[:cut], [r for r in results if r.end <= cut], self.strategy)
+        tail = anonymize(pending[cut:], _clip_results(results, cut), self.strategy)
+
+        entities = []
+        for result in results:
+            if result.end > cut:
+                continue
+            entities.append(EntityInfo(
+                entity_type=result.entity_type,
+                score=result.score,
+                start=self._raw_length + result.start,
+                end=self._raw_length + result.end,
+                text_preview=_mask_text_preview(pending[result.start:result.end])
+            ))
+            self._entity_counts[result.entity_type] = self._entity_counts.get(result.entity_type, 0) + 1
+
+        self._trace.detections.extend(
+            (r.entity_type, self._raw_length + r.start, self._raw_length + min(r.end, cut), r.score)
+            for r in raw_results
+            if r.start < cut
+        )
+        self._trace.replacements.extend(
+            (self._raw_length + r.original_start, self._raw_length + r.original_end,
+             self._clean_length + r.clean_start, self._clean_length + r.clean_end)
+            for r in finalized.replacements
+        )
+
+        if cut:
+            if settings.name_propagation_enabled:
+                self._name_forms = merge_name_forms(
+                    self._name_forms, name_forms(pending, [r for r in results if r.end <= cut])
+                )
+            self._raw_parts.append(pending[:cut])
+            self._clean_parts.append(finalized.text)
+            self._raw_length += cut
+            self._clean_length += len(finalized.text)
+            self._context = self._context_tail(window[:offset + cut])
+        self._entities.extend(entities)
+        self._pending = pending[cut:]
+        self._tail_clean = tail.text
+
+        return IncrementalUpdate(
+            finalized=finalized.text,
+            tail=tail.text,
+            finalized_length=self._clean_length,
+            corrected=not (finalized.text + tail.text).startswith(previous_tail),
+            entities_found=entities,
+        )
+
+    def _stable_end(self, pending: str, results: list[RecognizerResult]) -> int:
+        """Offset in pending up to which text can be finalized (0 = none)."""
+        limit = len(pending) - self.tail_chars
+        if limit <= 0:
+            return 0
+
+        def crossed(position: int) -> bool:
+            return any(r.start < position < r.end for r in results)
+
+        # Latest sentence start far enough from the end, with no entity across it
+        cut = 0
+        for start, _ in sentence_spans(pending)[1:]:
+            if start > limit:
+                break
+            if not crossed(start):
+                cut = start
+
+        if cut == 0 and len(pending) > self.max_tail_chars:
+            # No usable sentence boundary: finalize up to a space
+            space = pending.rfind(" ", 0, limit)
+            while space > 0 and crossed(space + 1):
+                space = pending.rfind(" ", 0, space)
+            cut = max(space + 1, 0)
+        return cut
+
+    def _context_tail(self, text: str) -> str:
+        """Finalized text analyzed with the tail: whole sentences, about context_chars."""
+        if self.context_chars <= 0:
+            return ""
+        if len(text) <= self.context_chars:
+            return text
+        tail = text[-self.context_chars:]
+        spans = sentence_spans(tail)
+        if len(spans) > 1:
+            return tail[spans[1][0]:]
+        # Don't start the context mid-word
+        return tail[tail.index(" ") + 1:] if " " in tail else tail
+
+    def finish(self) -> DeidentificationResult:
+        """
+        Finalize the transcript and assemble the result for all of it.
+
+        Names first confirmed after earlier text was finalized are also
+        redacted there, so the result may redact more than the updates did.
+        """
+        self.flush()
+        result = _piecewise_result(
+            "".join(self._raw_parts), "".join(self._clean_parts),
+            self._entities, self._entity_counts, self._trace, self.strategy
+        )
+        logger.info(
+            f"Incremental de-identification complete: {self._raw_length} chars, "
+            f"{result.entity_count} PHI entities found"
+        )
+        return result
+
+
+def _leak_warning(entity_type: str, score: float, threshold: float, start: int, end: int) -> str:
+    return (
+        f"Potential PHI leak: {entity_type} "
+        f"(score: {score:.2f}, threshold: {threshold:.2f}) "
+        f"at position {start}-{end}"
+    )
+
+
+def _in_marker(start: int, end: int, markers: list[tuple[int, int]], marker_starts: list[int]) -> bool:
+    """True if [start, end) lies within one replacement marker."""
+    i = bisect.bisect_right(marker_starts, start) - 1
+    return i >= 0 and markers[i][0] <= start and end <= markers[i][1]
+
+
+def _validation_windows(
+    cleaned: str,
+    trace: DetectionTrace,
+    detections: list[tuple[str, int, int, float]]
+) -> list[tuple[int, int]]:
+    """
+    Regions of the cleaned text to re-analyze: each marker plus context.
+
+    Windows are widened to word boundaries and to cover any detection they
+    cut through, then merged.
+    """
+    context = settings.validation_context_chars
+    windows = []
+    for _, _, clean_start, clean_end in trace.replacements:
+        start = max(0, clean_start - context)
+        end = min(len(cleaned), clean_end + context)
+        start = cleaned.rfind(" ", 0, start) + 1 if start > 0 else 0
+        end = cleaned.find(" ", end) if end < len(cleaned) else end
+        windows.append((start, len(cleaned) if end == -1 else end))
+
+    while True:
+        windows.sort()
+        merged: list[list[int]] = []
+        for start, end in windows:
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        # Don't cut a detection in half at a window edge
+        grown = False
+        for _, start, end, _ in detections:
+            for window in merged:
+                if start < window[1] and end > window[0] and (start < window[0] or end > window[1]):
+                    window[0], window[1] = min(window[0], start), max(window[1], end)
+                    grown = True
+        windows = [(start, end) for start, end in merged]
+        if not grown:
+            return windows
+
+
+def _validate_incremental(
+    analyzer: AnalyzerEngine,
+    cleaned: str,
+    trace: DetectionTrace
+) -> Optional[list[str]]:
+    """
+    Leak warnings for the cleaned text, re-analyzing only around replacements.
+
+    Text more than validation_context_chars from any replacement is
+    identical to the original, so detection's candidates there are reused
+    (mapped to cleaned offsets) instead of re-running the analyzer.
+
+    Returns:
+        Warnings, or None if windows would cover most of the text (a full
+        rescan is cheaper)
+    """
+    replacements = trace.replacements
+    original_starts = [r[0] for r in replacements]
+    markers = [(r[2], r[3]) for r in replacements]
+    marker_starts = [m[0] for m in markers]
+
+    def to_clean(position: int, is_end: bool) -> int:
+        """Map an original offset to the cleaned text (snapping into markers)."""
+        i = bisect.bisect_right(original_starts, position - 1 if is_end else position) - 1
+        if i < 0:
+            return position
+        original_start, original_end, clean_start, clean_end = replacements[i]
+        if position < original_end or (is_end and position == original_end):
+            return clean_end if is_end else clean_start
+        return position - original_end + clean_end
+
+    detections = [
+        (entity_type, to_clean(start, False), to_clean(end, True), score)
+        for entity_type, start, end, score in trace.detections
+    ]
+    windows = _validation_windows(cleaned, trace, detections)
+    if sum(end - start for start, end in windows) > len(cleaned) * settings.validation_max_window_fraction:
+        return None
+
+    found: list[tuple[int, int, str]] = []
+
+    # Untouched text: reuse detection's candidates
+    window_starts = [w[0] for w in windows]
+    for entity_type, start, end, score in detections:
+        i = bisect.bisect_right(window_starts, start) - 1
+        if i >= 0 and start < windows[i][1]:
+            continue  # Re-analyzed below
+        if i + 1 < len(windows) and end > windows[i + 1][0]:
+            continue
+        threshold = _get_entity_threshold(entity_type)
+        if score >= threshold:
+            found.append((start, end, _leak_warning(entity_type, score, threshold, start, end)))
+
+    # Around replacements: re-analyze the cleaned text (windows parsed as one spaCy batch)
+    nlp_engine = analyzer.nlp_engine
+    window_texts = [cleaned[start:end] for start, end in windows]
+    docs = timed_docs(nlp_engine.nlp["en"].pipe(window_texts))
+    for (window_start, _), window_text, doc in zip(windows, window_texts, docs):
+        nlp_artifacts = nlp_engine._doc_to_nlp_artifact(doc, "en")
+        for result in _analyze(analyzer, window_text, nlp_artifacts):
+            start, end = window_start + result.start, window_start + result.end
+            if _in_marker(start, end, markers, marker_starts):
+                continue
+            threshold = _get_entity_threshold(result.entity_type)
+            if result.score >= threshold:
+                found.append((start, end, _leak_warning(result.entity_type, result.score, threshold, start, end)))
+
+    return [warning for _, _, warning in sorted(found)]
+
+
 def validate_deidentification(
     original: str,
-    cleaned: str
+    cleaned: str,
+    result: Optional[DeidentificationResult] = None
 ) -> tuple[bool, list[str]]:
     """
     Re-scan cleaned text to catch any PHI that might have been missed.
@@ -307,40 +1217,54 @@ def validate_deidentification(
     Uses the same per-entity thresholds as detection for consistency
     (fixes THRS-02: detection/validation threshold mismatch).
 
+    When the DeidentificationResult is passed, its replacement markers are
+    skipped by position, and (with settings.incremental_validation) only
+    text around replacements is re-analyzed; candidates elsewhere are taken
+    from detection's analysis of the identical original text. Fast-mode
+    results never ran NER, so their cleaned text is always fully rescanned.
+
     Args:
         original: Original text before de-identification
         cleaned: Text after de-identification
+        result: The de-identification that produced cleaned (optional)
 
     Returns:
         Tuple of (is_valid, list_of_warnings)
         is_valid is True if no PHI above per-entity threshold remains
     """
-    analyzer, _ = _get_engines()
-
-    # Scan the cleaned text with minimum threshold (filter per-entity below)
-    results = analyzer.analyze(
-        text=cleaned,
-        language="en",
-        entities=settings.phi_entities,
-        score_threshold=0.0  # Get all, filter by per-entity threshold below
-    )
-
-    warnings = []
-
-    for result in results:
-        # Skip markers we added
-        detected = cleaned[result.start:result.end]
-        if detected.startswith("[") and detected.endswith("]"):
-            continue
-
-        # Apply same per-entity threshold as detection (fixes THRS-02)
-        entity_threshold = _get_entity_threshold(result.entity_type)
-        if result.score >= entity_threshold:
-            warnings.append(
-                f"Potential PHI leak: {result.entity_type} "
-                f"(score: {result.score:.2f}, threshold: {entity_threshold:.2f}) "
-                f"at position {result.start}-{result.end}"
-            )
+    analyzer = _get_analyzer()
+
+    trace = None
+    if result is not None and result.clean_text == cleaned:
+        trace = result.trace
+
+    warnings = None
+    if trace is not None and settings.incremental_validation and result.mode == "full":
+        warnings = _validate_incremental(analyzer, cleaned, trace)
+
+    if warnings is None:
+        # Full rescan of the cleaned text
+        markers = [] if trace is None else [(r[2], r[3]) for r in trace.replacements]
+        marker_starts = [m[0] for m in markers]
+
+        warnings = []
+        for detection in _analyze(analyzer, cleaned):
+            # Skip markers we added
+            if trace is not None:
+                if _in_marker(detection.start, detection.end, markers, marker_starts):
+                    continue
+            else:
+                detected = cleaned[detection.start:detection.end]
+                if detected.startswith("[") and detected.endswith("]"):
+                    continue
+
+            # Apply same per-entity threshold as detection (fixes THRS-02)
+            entity_threshold = _get_entity_threshold(detection.entity_type)
+            if detection.score >= entity_threshold:
+                warnings.append(_leak_warning(
+                    detection.entity_type, detection.score, entity_threshold,
+                    detection.start, detection.end
+                ))
 
     is_valid = len(warnings) == 0
 
@@ -0,0 +1,426 @@
+"""
+Forked de-identification worker pool.
+
+spaCy NER holds the GIL for most of its work, so threads running
+deidentify_text() share one core however many requests are in flight.
+With settings.deidentify_pool_workers > 1, the parent loads the analyzer
+once, moves it out of the garbage collector's reach (gc.freeze) and forks
+the workers: model weights and vocabularies stay shared copy-on-write, and
+each worker only adds the memory its own texts allocate.
+
+    deidentify_pool.start()                       # application startup
+    result = deidentify_pooled(text, strategy)    # any thread; blocks
+
+Dispatch: texts wait in one queue in the parent and go to the next idle
+worker, oldest first. The first worker only takes texts of at most
+deidentify_pool_short_chars, so a short /api/deidentify call is never
+stuck behind long transcripts.
+
+Restarts: a worker that dies is replaced, and its text retried once on
+another worker before failing with WorkerCrashedError. A worker whose
+private memory exceeds deidentify_pool_max_worker_mb, or that has handled
+deidentify_pool_max_tasks texts, is retired after its current text and
+replaced by a fresh fork. The old process is stopped and joined on a
+separate thread, outside the pool lock, so a stuck worker never holds up
+dispatch, results or stats().
+
+Requires the fork start method (Linux, macOS); elsewhere, or when the pool
+isn't started, deidentify_pooled() runs in-process. Replacements are forked
+from the running, multithreaded server (a forkserver or spawn child would
+not share the loaded analyzer): only the forking thread survives in the
+child, so a lock another thread held at that moment stays held there. The
+worker therefore touches no parent state guarded by such locks beyond what
+_worker_main resets (the sentence cache, recognizer metrics); logging
+reinitialises its own locks after fork.
+"""
+
+import gc
+import logging
+import multiprocessing
+import signal
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from typing import Any, Optional
+
+from . import recognizer_metrics, sentence_cache
+from .config import settings
+from .deidentification import DeidentificationResult, _get_analyzer, deidentify_text
+
+logger = logging.getLogger(__name__)
+
+# Attempts per text before its worker crashes are reported as an error
+MAX_ATTEMPTS = 2
+
+# Seconds a retiring worker gets to exit before it is killed
+RETIRE_TIMEOUT_SECONDS = 5.0
+
+# Restart reasons
+RESTART_CRASH = "crash"
+RESTART_MEMORY = "memory"
+RESTART_TASKS = "tasks"
+
+WARM_UP_TEXT = "Mom Jessica called 555-123-4567 about the patient in room 4B."
+
+
+class WorkerCrashedError(Exception):
+    """Raised when worker processes died on every attempt at a text."""
+    pass
+
+
+def private_memory_mb() -> float:
+    """
+    Resident memory of this process not shared with others, in MB.
+
+    Falls back to peak RSS (shared pages included) without /proc.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            kb = sum(
+                int(line.split()[1]) for line in f if line.startswith(("Private_Clean:", "Private_Dirty:"))
+            )
+        return kb / 1024
+    except OSError:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _worker_main(conn: Connection) -> None:
+    """Worker process loop: de-identify texts from the parent until told to stop."""
+    # The parent handles Ctrl+C and stops workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    # No nested process pools inside a worker
+    settings.deidentify_window_workers = 0
+    # Another parent thread may have held these objects' locks at fork
+    # time; the worker starts its own cache, and its metrics (which
+    # wouldn't be reported) are off
+    sentence_cache._cache = None
+    settings.recognizer_metrics_enabled = False
+    recognizer_metrics.recognizer_metrics = recognizer_metrics.RecognizerMetrics()
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        task_id, text, strategy = message
+        try:
+            reply = (task_id, True, deidentify_text(text, strategy))
+        except Exception as e:
+            reply = (task_id, False, f"{type(e).__name__}: {e}")
+        conn.send(reply + (private_memory_mb(),))
+
+
+@dataclass
+class _Task:
+    id: int
+    text: str
+    strategy: str
+    future: Future
+    attempts: int = 0
+
+
+class _Worker:
+    """One forked worker process and the text it is working on."""
+
+    def __init__(self, index: int, process: multiprocessing.Process, conn: Connection):
+        self.index = index
+        self.process = process
+        self.conn = conn
+        self.task: Optional[_Task] = None
+        self.tasks_done = 0
+        self.private_mb = 0.0
+
+
+class DeidentificationPool:
+    """
+    Forked worker processes sharing the parent's loaded analyzer.
+
+    Args:
+        workers: Worker processes (fewer than 2 = pool not started)
+        short_chars: Longest text the first worker takes
+        max_worker_mb: Private memory that retires a worker (0 = no limit)
+        max_tasks: Texts that retire a worker (0 = no limit)
+    """
+
+    def __init__(self, workers: int, short_chars: int, max_worker_mb: int = 0, max_tasks: int = 0):
+        self.workers = workers
+        self.short_chars = short_chars
+        self.max_worker_mb = max_worker_mb
+        self.max_tasks = max_tasks
+        self._lock = threading.Lock()
+        self._queue: deque[_Task] = deque()
+        self._workers: list[_Worker] = []
+        # Threads stopping replaced workers outside the lock
+        self._retiring: list[threading.Thread] = []
+        self._next_id = 0
+        self._collector: Optional[threading.Thread] = None
+        self._wakeup: Optional[tuple[Connection, Connection]] = None
+        self._context = None
+        self._closed = False
+
+        # Statistics (guarded by _lock)
+        self._completed = 0
+        self._failed = 0
+        self._chars = 0
+        self._restarts = {RESTART_CRASH: 0, RESTART_MEMORY: 0, RESTART_TASKS: 0}
+
+    @property
+    def running(self) -> bool:
+        return self._collector is not None and not self._closed
+
+    def start(self) -> None:
+        """Load the analyzer here and fork the workers (no-op if already running or disabled)."""
+        if self.running or self.workers < 2:
+            return
+        if "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning("De-identification pool needs the fork start method; de-identifying in-process")
+            return
+
+        # Load everything built lazily, so workers inherit it instead of
+        # each building their own copy
+        _get_analyzer()
+        deidentify_text(WARM_UP_TEXT)
+        # Keep the collector from writing to (and so copying) shared pages
+        gc.collect()
+        gc.freeze()
+
+        self._context = multiprocessing.get_context("fork")
+        self._wakeup = self._context.Pipe(duplex=False)
+        self._closed = False
+        with self._lock:
+            self._workers = [self._fork(i) for i in range(self.workers)]
+        self._collector = threading.Thread(target=self._collect, name="deidentify-pool", daemon=True)
+        self._collector.start()
+        logger.info(
+            f"Started de-identification pool: workers={self.workers}, "
+            f"short_chars={self.short_chars}, parent={private_memory_mb():.0f} MB private"
+        )
+
+    def _fork(self, index: int) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main, args=(child_conn,), name=f"deidentify-worker-{index}", daemon=True
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(index, process, parent_conn)
+
+    def submit(self, text: str, strategy: str = "type_marker") -> Future:
+        """
+        Queue a text for de-identification.
+
+        Returns:
+            Future resolving to its DeidentificationResult
+
+        Raises:
+            RuntimeError: If the pool isn't running
+        """
+        if not self.running:
+            raise RuntimeError("De-identification pool is not running")
+        with self._lock:
+            task = _Task(self._next_id, text, strategy, Future())
+            self._next_id += 1
+            self._queue.append(task)
+            self._dispatch()
+        return task.future
+
+    def deidentify(self, text: str, strategy: str = "type_marker") -> DeidentificationResult:
+        """De-identify one text on a worker, blocking until done."""
+        return self.submit(text, strategy).result()
+
+    def _take(self, worker: _Worker) -> Optional[_Task]:
+        """Oldest queued text this worker may take (the first worker: short texts only)."""
+        if worker.index != 0:
+            return self._queue.popleft() if self._queue else None
+        for task in self._queue:
+            if len(task.text) <= self.short_chars:
+                self._queue.remove(task)
+                return task
+        return None
+
+    def _dispatch(self) -> None:
+        """Hand queued texts to idle workers. Caller holds _lock."""
+        for worker in self._workers:
+            if not self._queue:
+                return
+            if worker.task is not None:
+                continue
+            task = self._take(worker)
+            if task is None:
+                continue
+            task.attempts += 1
+            worker.task = task
+            try:
+                worker.conn.send((task.id, task.text, task.strategy))
+            except OSError:
+                # Died while idle; its sentinel fires and the text is retried
+                pass
+
+    def _collect(self) -> None:
+        """Receive results and watch for dead workers (collector thread)."""
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                by_conn = {w.conn: w for w in self._workers}
+                by_sentinel = {w.process.sentinel: w for w in self._workers}
+            ready = wait(list(by_conn) + list(by_sentinel) + [self._wakeup[0]])
+
+            with self._lock:
+                if self._closed:
+                    return
+                for obj in ready:
+                    worker = by_conn.get(obj) or by_sentinel.get(obj)
+                    if worker is None or worker not in self._workers:
+                        continue
+                    if obj is worker.conn and worker.conn.poll():
+                        self._receive(worker)
+                    elif not worker.process.is_alive():
+                        self._replace(worker, RESTART_CRASH)
+                self._dispatch()
+
+    def _receive(self, worker: _Worker) -> None:
+        """Resolve a worker's finished text; retire it if it grew too large. Caller holds _lock."""
+        try:
+            task_id, ok, payload, private_mb = worker.conn.recv()
+        except (EOFError, OSError):
+            self._replace(worker, RESTART_CRASH)
+            return
+
+        task, worker.task = worker.task, None
+        worker.tasks_done += 1
+        worker.private_mb = private_mb
+        if ok:
+            self._completed += 1
+            self._chars += len(task.text)
+            task.future.set_result(payload)
+        else:
+            self._failed += 1
+            task.future.set_exception(RuntimeError(f"De-identification failed in worker: {payload}"))
+
+        if self.max_worker_mb and private_mb > self.max_worker_mb:
+            logger.info(f"Retiring de-identification worker {worker.index}: {private_mb:.0f} MB private")
+            self._replace(worker, RESTART_MEMORY)
+        elif self.max_tasks and worker.tasks_done >= self.max_tasks:
+            self._replace(worker, RESTART_TASKS)
+
+    def _replace(self, worker: _Worker, reason: str) -> None:
+        """
+        Fork a worker's replacement and requeue its text. Caller holds _lock.
+
+        The old worker is swapped out here and stopped on its own thread,
+        which may wait up to RETIRE_TIMEOUT_SECONDS for it to exit.
+        """
+        if reason == RESTART_CRASH:
+            logger.warning(
+                f"De-identification worker {worker.index} died (exit code {worker.process.exitcode})"
+            )
+        stopper = threading.Thread(
+            target=_stop_worker, args=(worker,), name=f"deidentify-retire-{worker.index}", daemon=True
+        )
+        stopper.start()
+        self._retiring = [t for t in self._retiring if t.is_alive()] + [stopper]
+        self._restarts[reason] += 1
+
+        task, worker.task = worker.task, None
+        if task is not None:
+            if task.attempts < MAX_ATTEMPTS:
+                self._queue.appendleft(task)
+            else:
+                self._failed += 1
+                task.future.set_exception(
+                    WorkerCrashedError(f"De-identification worker died {task.attempts} times on this text")
+                )
+
+        self._workers[self._workers.index(worker)] = self._fork(worker.index)
+
+    def stats(self) -> dict[str, Any]:
+        """Worker, queue and restart counters (no PHI)."""
+        with self._lock:
+            return {
+                "running": self.running,
+                "workers": [
+                    {
+                        "pid": w.process.pid,
+                        "busy": w.task is not None,
+                        "tasks_done": w.tasks_done,
+                        "private_mb": round(w.private_mb, 1),
+                    }
+                    for w in self._workers
+                ],
+                "queued": len(self._queue),
+                "completed": self._completed,
+                "failed": self._failed,
+                "chars": self._chars,
+                "restarts": dict(self._restarts),
+            }
+
+    def shutdown(self) -> None:
+        """Stop the workers; queued and running texts fail with RuntimeError."""
+        if not self.running:
+            return
+        with self._lock:
+            self._closed = True
+            self._wakeup[1].send(None)
+            for worker in self._workers:
+                if worker.task is not None:
+                    self._queue.append(worker.task)
+            for task in self._queue:
+                task.future.set_exception(RuntimeError("De-identification pool shut down"))
+            self._queue.clear()
+            workers, retiring = self._workers, self._retiring
+            self._workers, self._retiring = [], []
+        for worker in workers:
+            _stop_worker(worker)
+        for stopper in retiring:
+            stopper.join()
+        self._collector.join()
+        self._collector = None
+        gc.unfreeze()
+
+
+def _stop_worker(worker: _Worker) -> None:
+    """Ask a worker to exit, killing it if it doesn't."""
+    try:
+        worker.conn.send(None)
+    except OSError:
+        pass
+    worker.process.join(RETIRE_TIMEOUT_SECONDS)
+    if worker.process.is_alive():
+        worker.process.kill()
+        worker.process.join()
+    worker.conn.close()
+
+
+# Global pool instance (started at application startup when configured)
+deidentify_pool = DeidentificationPool(
+    workers=settings.deidentify_pool_workers,
+    short_chars=settings.deidentify_pool_short_chars,
+    max_worker_mb=settings.deidentify_pool_max_worker_mb,
+    max_tasks=settings.deidentify_pool_max_tasks,
+)
+
+
+def deidentify_pooled(text: str, strategy: str = "type_marker") -> DeidentificationResult:
+    """
+    De-identify text on the worker pool when it is running, in-process otherwise.
+
+    Args:
+        text: Text to de-identify
+        strategy: Replacement strategy (see deidentify_text)
+
+    Returns:
+        DeidentificationResult
+    """
+    if deidentify_pool.running:
+        return deidentify_pool.deidentify(text, strategy)
+    return deidentify_text(text, strategy)
@@ -0,0 +1,190 @@
+"""
+Compiled deny-list index.
+
+Deny lists (settings.deny_list_*) name medical terms that NER models
+misclassify as PHI. Detected entities are checked against them one by one,
+so the lists are compiled once instead of being scanned per entity:
+
+- Exact-match lists (PERSON, GUARDIAN_NAME, PEDIATRIC_AGE): a lowercase set,
+  one hash lookup per entity
+- Substring lists (LOCATION, DATE_TIME): an Aho-Corasick automaton, one pass
+  over the entity text regardless of how many terms are listed
+
+    index = get_deny_list_index()
+    if index.is_denied(result.entity_type, detected_text):
+        ...
+"""
+
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Optional
+
+from .config import settings
+
+
+class AhoCorasick:
+    """
+    Multi-pattern substring matcher.
+
+    Answers "does the text contain any of the patterns?", or finds every
+    occurrence of them, in a single pass over the text, independent of the
+    number of patterns.
+
+    Args:
+        patterns: Strings to search for (matched case-sensitively)
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._terminal: list[bool] = [False]
+        # Lengths of the patterns ending at each state
+        self._outputs: list[tuple[int, ...]] = [()]
+        self._matches_empty = False
+
+        for pattern in patterns:
+            if not pattern:
+                self._matches_empty = True  # "" is a substring of everything
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._terminal.append(False)
+                    self._outputs.append(())
+                state = next_state
+            self._terminal[state] = True
+            if len(pattern) not in self._outputs[state]:
+                self._outputs[state] += (len(pattern),)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # A state also matches everything its failure state matches
+                self._terminal[next_state] |= self._terminal[self._fail[next_state]]
+                self._outputs[next_state] += self._outputs[self._fail[next_state]]
+
+    def contains_any(self, text: str) -> bool:
+        """True if any pattern occurs in text."""
+        if self._matches_empty:
+            return True
+        goto, fail, terminal = self._goto, self._fail, self._terminal
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if terminal[state]:
+                return True
+        return False
+
+    def find_all(self, text: str) -> Iterator[tuple[int, int]]:
+        """(start, end) of every occurrence of a pattern in text, overlapping ones included."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length in outputs[state]:
+                yield end - length, end
+
+
+class DenyListIndex:
+    """
+    Deny lists compiled for per-entity lookups.
+
+    Args:
+        exact: Entity type -> terms matched against the whole entity text
+        substring: Entity type -> terms matched anywhere in the entity text
+
+    Matching is case-insensitive; entity text is stripped before matching.
+    """
+
+    def __init__(
+        self,
+        exact: Mapping[str, Iterable[str]],
+        substring: Mapping[str, Iterable[str]]
+    ):
+        self._exact = {
+            entity_type: frozenset(term.lower() for term in terms)
+            for entity_type, terms in exact.items()
+        }
+        self._substring = {
+            entity_type: AhoCorasick(term.lower() for term in terms)
+            for entity_type, terms in substring.items()
+        }
+
+    @classmethod
+    def from_settings(cls) -> "DenyListIndex":
+        """Build the index from the configured deny lists."""
+        return cls(
+            exact={
+                "PERSON": settings.deny_list_person,
+                "GUARDIAN_NAME": settings.deny_list_guardian_name,
+                "PEDIATRIC_AGE": settings.deny_list_pediatric_age,
+            },
+            substring={
+                # e.g., "5 months old" is denied by "months old"
+                "LOCATION": settings.deny_list_location,
+                "DATE_TIME": settings.deny_list_date_time,
+            },
+        )
+
+    def is_denied(self, entity_type: str, detected_text: str) -> bool:
+        """
+        Check whether a detected entity is a deny-listed term.
+
+        Args:
+            entity_type: Presidio entity type of the detection
+            detected_text: The detected span's text
+
+        Returns:
+            True if the detection should be discarded
+        """
+        detected_lower = detected_text.strip().lower()
+
+        terms = self._exact.get(entity_type)
+        if terms is not None and detected_lower in terms:
+            return True
+
+        automaton = self._substring.get(entity_type)
+        return automaton is not None and automaton.contains_any(detected_lower)
+
+
+# Compiled lazily from settings on first use
+_index: Optional[DenyListIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_deny_list_index() -> DenyListIndex:
+    """Get the deny-list index for the configured lists (compiled once)."""
+    global _index
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = DenyListIndex.from_settings()
+    return _index
+
+
+def reset_deny_list_index() -> None:
+    """Discard the compiled index so the next lookup recompiles from settings."""
+    global _index
+
+    with _index_lock:
+        _index = None
@@ -0,0 +1,262 @@
+"""
+Self-calibrating processing-time estimator.
+
+Estimates are built from two parts:
+1. Audio duration: read from the container header when possible (PyAV),
+   otherwise derived from file size and a typical bitrate for the format
+2. Measured speed: every completed request feeds the real-time factor
+   (transcription seconds per audio second) for its (model, compute type,
+   decode profile) and the de-identification throughput (chars/sec)
+
+Each speed is tracked with an EWMA (for the typical value) and a sliding
+window of recent observations (for p50/p90). Until enough requests have
+been observed, the model-size priors below are used and the estimate's
+confidence is reported as "low".
+"""
+
+import io
+import logging
+import threading
+from collections import deque
+from typing import Any, BinaryIO, Optional, Union
+
+import av
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Prior real-time factors (processing seconds per audio second) on CPU,
+# used until measurements exist for a (model, compute type, profile) key
+PRIOR_MODEL_RTF = {
+    "tiny.en": 0.05,
+    "base.en": 0.1,
+    "small.en": 0.3,
+    "medium.en": 0.5,
+    "large-v3": 1.0,
+}
+PRIOR_PROFILE_FACTOR = {"fast": 0.4, "balanced": 1.0, "accurate": 1.6}
+PRIOR_DEID_CHARS_PER_SECOND = 2000.0
+# Speech is ~150 words/min at ~6 chars/word including spaces
+PRIOR_TRANSCRIPT_CHARS_PER_AUDIO_SECOND = 15.0
+# Spread of the prior distribution: p90 = p50 * factor
+PRIOR_P90_FACTOR = 1.5
+
+# Typical bytes per audio second by container, used when the header has no
+# duration (e.g., MediaRecorder WebM). Legacy rule of thumb: 1MB per minute.
+BYTES_PER_AUDIO_SECOND = {
+    ".webm": 4000,    # Opus ~32 kbps
+    ".ogg": 4000,
+    ".mp3": 16000,    # 128 kbps
+    ".m4a": 12000,    # AAC ~96 kbps
+    ".wav": 32000,    # 16 kHz 16-bit mono
+    ".flac": 20000,
+}
+DEFAULT_BYTES_PER_AUDIO_SECOND = 1024 * 1024 / 60
+
+# Observations needed before an estimate is "medium" / "high" confidence
+MEDIUM_CONFIDENCE_SAMPLES = 5
+HIGH_CONFIDENCE_SAMPLES = 20
+
+
+def probe_duration(audio: Union[bytes, BinaryIO]) -> Optional[float]:
+    """
+    Read audio duration from the container header.
+
+    Args:
+        audio: Audio file content, as bytes or a seekable binary file object
+            (the position is restored afterwards)
+
+    Returns:
+        Duration in seconds, or None if the container doesn't declare one
+    """
+    source = io.BytesIO(audio) if isinstance(audio, (bytes, bytearray)) else audio
+    position = source.tell()
+    try:
+        with av.open(source, mode="r", metadata_errors="ignore") as container:
+            if container.duration:
+                return container.duration / av.time_base
+            for stream in container.streams.audio:
+                if stream.duration and stream.time_base:
+                    return float(stream.duration * stream.time_base)
+    except Exception as e:
+        logger.debug(f"Could not probe audio duration: {type(e).__name__}")
+    finally:
+        source.seek(position)
+    return None
+
+
+def duration_from_size(file_size_bytes: int, extension: Optional[str] = None) -> float:
+    """Estimate audio duration from file size and a typical bitrate for the format."""
+    rate = BYTES_PER_AUDIO_SECOND.get((extension or "").lower(), DEFAULT_BYTES_PER_AUDIO_SECOND)
+    return file_size_bytes / rate
+
+
+def _quantile(sorted_values: list[float], q: float) -> float:
+    """Linear-interpolated quantile of pre-sorted values."""
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class RateTracker:
+    """EWMA plus sliding-window quantiles for one measured rate."""
+
+    def __init__(self, alpha: float, window: int):
+        self.alpha = alpha
+        self.count = 0
+        self.ewma: Optional[float] = None
+        self._recent: deque[float] = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.ewma = value if self.ewma is None else self.alpha * value + (1 - self.alpha) * self.ewma
+        self._recent.append(value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self._recent:
+            return None
+        return _quantile(sorted(self._recent), q)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "ewma": round(self.ewma, 4) if self.ewma is not None else None,
+            "p50": round(self.quantile(0.5), 4) if self._recent else None,
+            "p90": round(self.quantile(0.9), 4) if self._recent else None,
+        }
+
+
+def _confidence(samples: int) -> str:
+    if samples >= HIGH_CONFIDENCE_SAMPLES:
+        return "high"
+    if samples >= MEDIUM_CONFIDENCE_SAMPLES:
+        return "medium"
+    return "low"
+
+
+class ProcessingTimeEstimator:
+    """
+    Online model of transcription and de-identification speed.
+
+    Thread-safe: observations may arrive from worker threads.
+    """
+
+    def __init__(self, alpha: float = 0.2, window: int = 200):
+        self.alpha = alpha
+        self.window = window
+        self._rtf: dict[tuple[str, str, str], RateTracker] = {}
+        self._deid_chars_per_second = RateTracker(alpha, window)
+        self._transcript_chars_per_audio_second = RateTracker(alpha, window)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(profile: Optional[str]) -> tuple[str, str, str]:
+        return (
+            settings.whisper_model,
+            settings.whisper_compute_type,
+            profile or settings.default_decode_profile,
+        )
+
+    def record_transcription(
+        self,
+        audio_seconds: float,
+        wall_seconds: float,
+        transcript_chars: int,
+        profile: Optional[str] = None
+    ) -> None:
+        """Feed one completed transcription (no PHI: durations and counts only)."""
+        if audio_seconds <= 0 or wall_seconds <= 0:
+            return
+        with self._lock:
+            key = self._key(profile)
+            if key not in self._rtf:
+                self._rtf[key] = RateTracker(self.alpha, self.window)
+            self._rtf[key].observe(wall_seconds / audio_seconds)
+            self._transcript_chars_per_audio_second.observe(transcript_chars / audio_seconds)
+
+    def record_deidentification(self, chars: int, wall_seconds: float) -> None:
+        """Feed one completed de-identification."""
+        if chars <= 0 or wall_seconds <= 0:
+            return
+        with self._lock:
+            self._deid_chars_per_second.observe(chars / wall_seconds)
+
+    def _rtf_quantiles(self, profile: Optional[str]) -> tuple[float, float, int]:
+        key = self._key(profile)
+        tracker = self._rtf.get(key)
+        if tracker is None or tracker.count == 0:
+            p50 = PRIOR_MODEL_RTF.get(settings.whisper_model, 0.5) * PRIOR_PROFILE_FACTOR.get(key[2], 1.0)
+            return p50, p50 * PRIOR_P90_FACTOR, 0
+        # EWMA tracks drift; the window supplies the spread
+        p50 = tracker.ewma
+        return p50, max(p50, tracker.quantile(0.9)), tracker.count
+
+    def estimate(
+        self,
+        audio_seconds: float,
+        profile: Optional[str] = None
+    ) -> dict[str, Any]:
+        """
+        Estimate processing time for a recording.
+
+        Args:
+            audio_seconds: Audio duration
+            profile: Decode profile (None = default)
+
+        Returns:
+            Dict with p50_seconds, p90_seconds, confidence, and the
+            transcription/de-identification breakdown
+        """
+        with self._lock:
+            rtf_p50, rtf_p90, samples = self._rtf_quantiles(profile)
+
+            chars_tracker = self._transcript_chars_per_audio_second
+            chars_per_audio_second = chars_tracker.ewma or PRIOR_TRANSCRIPT_CHARS_PER_AUDIO_SECOND
+
+            deid = self._deid_chars_per_second
+            if deid.count:
+                deid_rate_p50 = deid.ewma
+                # Slow tail: p90 time comes from the 10th-percentile throughput
+                deid_rate_p10 = min(deid_rate_p50, deid.quantile(0.1))
+            else:
+                deid_rate_p50 = PRIOR_DEID_CHARS_PER_SECOND
+                deid_rate_p10 = PRIOR_DEID_CHARS_PER_SECOND / PRIOR_P90_FACTOR
+
+        transcript_chars = audio_seconds * chars_per_audio_second
+        transcribe_p50 = audio_seconds * rtf_p50
+        transcribe_p90 = audio_seconds * rtf_p90
+        deid_p50 = transcript_chars / deid_rate_p50
+        deid_p90 = transcript_chars / deid_rate_p10
+
+        return {
+            "p50_seconds": round(transcribe_p50 + deid_p50, 1),
+            "p90_seconds": round(transcribe_p90 + deid_p90, 1),
+            "confidence": _confidence(samples),
+            "samples": samples,
+            "audio_duration_seconds": round(audio_seconds, 1),
+            "profile": profile or settings.default_decode_profile,
+            "model": settings.whisper_model,
+            "real_time_factor_p50": round(rtf_p50, 4),
+            "real_time_factor_p90": round(rtf_p90, 4),
+            "transcription_p50_seconds": round(transcribe_p50, 1),
+            "transcription_p90_seconds": round(transcribe_p90, 1),
+            "deidentification_p50_seconds": round(deid_p50, 1),
+            "deidentification_p90_seconds": round(deid_p90, 1),
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Observed rates per key (no PHI)."""
+        with self._lock:
+            return {
+                "real_time_factor": {
+                    "/".join(key): tracker.stats() for key, tracker in self._rtf.items()
+                },
+                "deidentification_chars_per_second": self._deid_chars_per_second.stats(),
+                "transcript_chars_per_audio_second": self._transcript_chars_per_audio_second.stats(),
+            }
+
+
+# Singleton instance
+processing_estimator = ProcessingTimeEstimator()
@@ -0,0 +1,218 @@
+"""
+Bounded executor layer for CPU-bound processing stages.
+
+Transcription and de-identification are synchronous, CPU-bound calls. Running
+them directly inside ``async def`` endpoints blocks the asyncio event loop, so
+a single long handoff freezes every other request (including /health).
+
+This module moves that work onto per-stage worker pools:
+- Each stage ("transcribe", "deidentify") has its own concurrency limit
+- Each stage has a bounded wait queue; when it is full, new work is rejected
+  with ExecutorBusyError (mapped to 503 + Retry-After by the API)
+- Backend is configurable: threads (default) or processes
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TRANSCRIBE_STAGE = "transcribe"
+DEIDENTIFY_STAGE = "deidentify"
+
+
+class ExecutorBusyError(Exception):
+    """Raised when a processing stage has no free queue slots."""
+
+    def __init__(self, stage: str, retry_after_seconds: int):
+        self.stage = stage
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(
+            f"Server busy: {stage} queue is full. Retry in {retry_after_seconds} seconds."
+        )
+
+
+class _Stage:
+    """A single processing stage: worker pool plus admission counters."""
+
+    def __init__(self, name: str, max_concurrency: int, queue_size: int, backend: str):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.queue_size = max(0, queue_size)
+        self.backend = backend
+        self.pending = 0  # Running + waiting
+        self.completed = 0
+        self.rejected = 0
+        self._pool: Optional[Executor] = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of admitted tasks (running + queued)."""
+        return self.max_concurrency + self.queue_size
+
+    def get_pool(self) -> Executor:
+        """Lazy-create the worker pool so importing the app stays cheap."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    if self.backend == "process":
+                        self._pool = ProcessPoolExecutor(max_workers=self.max_concurrency)
+                    else:
+                        self._pool = ThreadPoolExecutor(
+                            max_workers=self.max_concurrency,
+                            thread_name_prefix=f"{self.name}-worker",
+                        )
+                    logger.info(
+                        f"Started {self.name} pool: backend={self.backend}, "
+                        f"workers={self.max_concurrency}, queue={self.queue_size}"
+                    )
+        return self._pool
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "max_concurrency": self.max_concurrency,
+            "queue_size": self.queue_size,
+            "running": min(self.pending, self.max_concurrency),
+            "queued": max(0, self.pending - self.max_concurrency),
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+class ProcessingExecutor:
+    """
+    Runs blocking stage functions off the event loop with backpressure.
+
+    Admission counters are only touched from the event loop thread, so no
+    locking is needed around them.
+    """
+
+    def __init__(
+        self,
+        stage_limits: dict[str, int],
+        queue_size: int,
+        backend: str = "thread",
+        retry_after_seconds: int = 30,
+    ):
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Unknown executor backend: {backend!r} (expected 'thread' or 'process')")
+        self.backend = backend
+        self.retry_after_seconds = retry_after_seconds
+        self._stages = {
+            name: _Stage(name, limit, queue_size, backend)
+            for name, limit in stage_limits.items()
+        }
+
+    @property
+    def in_process(self) -> bool:
+        """
+        Whether stage functions run in this process (thread backend).
+
+        Only then may callers pass callbacks or open file objects; the
+        process backend requires picklable arguments.
+        """
+        return self.backend == "thread"
+
+    def _get_stage(self, stage: str) -> _Stage:
+        try:
+            return self._stages[stage]
+        except KeyError:
+            raise ValueError(f"Unknown processing stage: {stage!r}") from None
+
+    def is_full(self, stage: str) -> bool:
+        """Check whether a stage would reject newly admitted work."""
+        s = self._get_stage(stage)
+        return s.pending >= s.capacity
+
+    def check_capacity(self, stage: str) -> None:
+        """
+        Raise ExecutorBusyError if the stage has no free queue slot.
+
+        Lets endpoints reject early (before reading an upload) instead of
+        after doing work that would be thrown away.
+        """
+        if self.is_full(stage):
+            s = self._get_stage(stage)
+            s.rejected += 1
+            logger.warning(f"Rejecting {stage} work: queue full ({s.pending}/{s.capacity})")
+            raise ExecutorBusyError(stage, self.retry_after_seconds)
+
+    async def run(
+        self,
+        stage: str,
+        func: Callable[..., T],
+        *args: Any,
+        admit: bool = True,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run a blocking function on a stage's worker pool.
+
+        Args:
+            stage: Stage name (e.g., "transcribe", "deidentify")
+            func: Blocking callable (must be picklable for the process backend)
+            *args, **kwargs: Arguments forwarded to func
+            admit: Apply the queue limit. Pass False for follow-on stages of a
+                request that was already admitted, so work in progress is never
+                thrown away halfway through a pipeline.
+
+        Returns:
+            The function's return value
+
+        Raises:
+            ExecutorBusyError: If admit is True and the stage queue is full
+        """
+        s = self._get_stage(stage)
+        if admit:
+            self.check_capacity(stage)
+
+        s.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            call = functools.partial(func, *args, **kwargs)
+            result = await loop.run_in_executor(s.get_pool(), call)
+            s.completed += 1
+            return result
+        finally:
+            s.pending -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Per-stage queue statistics (no PHI)."""
+        return {name: s.stats() for name, s in self._stages.items()}
+
+    def shutdown(self) -> None:
+        """Stop all worker pools."""
+        for s in self._stages.values():
+            s.shutdown()
+
+
+def create_executor_from_settings() -> ProcessingExecutor:
+    """Build the processing executor from application settings."""
+    return ProcessingExecutor(
+        stage_limits={
+            TRANSCRIBE_STAGE: settings.transcribe_max_concurrency,
+            DEIDENTIFY_STAGE: settings.deidentify_max_concurrency,
+        },
+        queue_size=settings.executor_queue_size,
+        backend=settings.executor_backend,
+        retry_after_seconds=settings.executor_retry_after_seconds,
+    )
+
+
+# Singleton instance
+processing_executor = create_executor_from_settings()
@@ -0,0 +1,228 @@
+"""
+In-memory job store for asynchronous audio processing.
+
+POST /api/jobs returns a job ID immediately; the pipeline runs in the
+background and clients follow it via polling or Server-Sent Events.
+
+PHI handling:
+- The job ID is a random bearer handle (new_job_id) that is never logged;
+  audit and log lines use the job's request_id instead
+- Progress events carry counts, stages and timestamps only (no transcript text)
+- Segment events carry de-identified text only, as each segment is cleaned
+- The final result (which contains the transcript) lives only in memory and
+  is evicted after job_ttl_seconds
+- The store is bounded; when it is full of unfinished jobs, new jobs are rejected
+"""
+
+import asyncio
+import json
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Job lifecycle states
+JOB_QUEUED = "queued"
+JOB_TRANSCRIBING = "transcribing"
+JOB_DEIDENTIFYING = "deidentifying"
+JOB_VALIDATING = "validating"
+JOB_COMPLETE = "complete"
+JOB_FAILED = "failed"
+
+TERMINAL_STATES = (JOB_COMPLETE, JOB_FAILED)
+
+
+def new_job_id() -> str:
+    """
+    Generate an unguessable job ID.
+
+    The ID is the only credential for a job's result (which includes the
+    original transcript), so it is random and never written to logs.
+    """
+    return secrets.token_urlsafe(32)
+
+
+class JobStoreFullError(Exception):
+    """Raised when the job store has no room for another unfinished job."""
+
+    def __init__(self, retry_after_seconds: int):
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(
+            f"Too many jobs in progress. Retry in {retry_after_seconds} seconds."
+        )
+
+
+@dataclass
+class JobEvent:
+    """A single progress event (no PHI except the final result payload)."""
+    event_id: int
+    event_type: str  # "stage", "progress", "segment", "complete", "error"
+    data: dict[str, Any]
+
+    def to_sse(self) -> str:
+        """Format as a Server-Sent Events frame."""
+        return f"id: {self.event_id}\nevent: {self.event_type}\ndata: {json.dumps(self.data)}\n\n"
+
+
+@dataclass
+class Job:
+    """State of one asynchronous processing job."""
+    job_id: str
+    request_id: str = ""
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    status: str = JOB_QUEUED
+    segments_decoded: int = 0
+    audio_position_seconds: Optional[float] = None
+    audio_duration_seconds: Optional[float] = None
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    events: list[JobEvent] = field(default_factory=list)
+    _waker: Optional[asyncio.Event] = field(default=None, repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in TERMINAL_STATES
+
+    def _emit(self, event_type: str, data: dict[str, Any]) -> None:
+        """Append an event and wake any SSE listeners. Event loop thread only."""
+        self.updated_at = time.time()
+        self.events.append(JobEvent(len(self.events), event_type, data))
+        if self._waker is not None:
+            self._waker.set()
+        self._waker = asyncio.Event()
+
+    async def wait_for_event(self, seen: int, timeout: float) -> bool:
+        """
+        Wait until more than `seen` events exist.
+
+        Returns:
+            True if new events are available, False on timeout
+        """
+        if len(self.events) > seen:
+            return True
+        if self._waker is None:
+            self._waker = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._waker.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return len(self.events) > seen
+
+    def set_stage(self, status: str) -> None:
+        self.status = status
+        self._emit("stage", {"status": status})
+
+    def record_segment(self, segment_end: float, duration: Optional[float]) -> None:
+        self.segments_decoded += 1
+        self.audio_position_seconds = segment_end
+        self.audio_duration_seconds = duration
+        self._emit("progress", {
+            "segments_decoded": self.segments_decoded,
+            "audio_position_seconds": round(segment_end, 2),
+            "audio_duration_seconds": round(duration, 2) if duration else None,
+        })
+
+    def record_clean_segment(self, index: int, clean_text: str) -> None:
+        """Publish one de-identified segment (not yet validated)."""
+        self._emit("segment", {"index": index, "clean_text": clean_text})
+
+    def complete(self, result: dict[str, Any]) -> None:
+        self.result = result
+        self.status = JOB_COMPLETE
+        self.finished_at = time.time()
+        self._emit("complete", result)
+
+    def fail(self, error: str) -> None:
+        self.error = error
+        self.status = JOB_FAILED
+        self.finished_at = time.time()
+        self._emit("error", {"detail": error})
+
+    def snapshot(self) -> dict[str, Any]:
+        """Polling view of the job."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "segments_decoded": self.segments_decoded,
+            "audio_position_seconds": self.audio_position_seconds,
+            "audio_duration_seconds": self.audio_duration_seconds,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobStore:
+    """
+    Bounded in-memory job store with TTL eviction.
+
+    Finished jobs are evicted `ttl_seconds` after completion, or earlier
+    (oldest first) when room is needed. Unfinished jobs are never evicted.
+    """
+
+    def __init__(self, max_jobs: int, ttl_seconds: float, retry_after_seconds: int = 30):
+        self.max_jobs = max_jobs
+        self.ttl_seconds = ttl_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def _evict_expired(self, now: Optional[float] = None) -> None:
+        now = now or time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.is_finished and now - (job.finished_at or now) >= self.ttl_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        if expired:
+            logger.debug(f"Evicted {len(expired)} expired jobs")
+
+    def _evict_oldest_finished(self) -> bool:
+        for job_id, job in self._jobs.items():
+            if job.is_finished:
+                del self._jobs[job_id]
+                return True
+        return False
+
+    def create(self, job_id: str, request_id: str = "") -> Job:
+        """
+        Register a new job.
+
+        Args:
+            job_id: Handle clients fetch the job with (see new_job_id)
+            request_id: Audit request ID the job's log lines are tagged with
+
+        Raises:
+            JobStoreFullError: If the store is full of unfinished jobs
+        """
+        self._evict_expired()
+        if len(self._jobs) >= self.max_jobs and not self._evict_oldest_finished():
+            raise JobStoreFullError(self.retry_after_seconds)
+
+        job = Job(job_id=job_id, request_id=request_id)
+        self._jobs[job_id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        self._evict_expired()
+        return self._jobs.get(job_id)
+
+
+# Singleton instance
+job_store = JobStore(
+    max_jobs=settings.job_store_max_jobs,
+    ttl_seconds=settings.job_ttl_seconds,
+    retry_after_seconds=settings.executor_retry_after_seconds,
+)
@@ -4,18 +4,20 @@ FastAPI application for Pediatric Handoff PHI Remover.
 All processing happens locally - no patient data leaves the server.
 """
 
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Annotated, Optional
+from tempfile import SpooledTemporaryFile
+from typing import Annotated, BinaryIO, Optional, Union
 
 from fastapi import FastAPI, File, HTTPException, Query, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
@@ -23,13 +25,45 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
 from .audit import audit_logger, generate_request_id, hash_client_ip
+from .batching import batching_stats, shutdown_batch_scheduler
+from .chunking import shutdown_chunk_pool
 from .config import settings
-from .deidentification import deidentify_text, is_engines_loaded, validate_deidentification
+from .deidentification import (
+    DEIDENTIFY_MODES,
+    DeidentificationResult,
+    StreamingDeidentifier,
+    deidentify_batch,
+    deidentify_text,
+    is_engines_loaded,
+    validate_deidentification,
+)
+from .deidentify_pool import deidentify_pool, deidentify_pooled
+from .estimator import duration_from_size, probe_duration, processing_estimator
+from .executor import (
+    DEIDENTIFY_STAGE,
+    TRANSCRIBE_STAGE,
+    ExecutorBusyError,
+    processing_executor,
+)
+from .jobs import (
+    JOB_DEIDENTIFYING,
+    JOB_TRANSCRIBING,
+    JOB_VALIDATING,
+    Job,
+    JobStoreFullError,
+    job_store,
+    new_job_id,
+)
+from .recognizer_metrics import recognizer_metrics
+from .sentence_cache import get_sentence_cache
+from .text_windows import shutdown_window_pool
 from .transcription import (
+    DecodeProfileError,
     TranscriptionError,
-    estimate_transcription_time,
     is_model_loaded,
+    resolve_decode_profile,
     transcribe_audio,
+    whisper_pool,
 )
 
 # Configure logging
@@ -42,6 +76,14 @@ logger = logging.getLogger(__name__)
 # Rate limiter setup
 limiter = Limiter(key_func=get_remote_address)
 
+# Job upload copies in 1MB chunks; allow slack for multipart framing
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+UPLOAD_MULTIPART_OVERHEAD_BYTES = 64 * 1024
+UPLOAD_PATHS = ("/api/process", "/api/transcribe", "/api/jobs")
+
+# Interval between SSE keepalive comments (keeps proxies from closing idle streams)
+SSE_KEEPALIVE_SECONDS = 15.0
+
 
 # =============================================================================
 # Security Headers Middleware
@@ -74,6 +116,50 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversize upload bodies before they are buffered.
+
+    FastAPI parses multipart forms before the endpoint runs, so an
+    endpoint-level size check only fires after the whole body was read.
+    This ASGI middleware answers 413 up front when Content-Length is too
+    large, and aborts chunked bodies as soon as the running total crosses
+    the limit.
+    """
+
+    def __init__(self, app, max_body_bytes: int, paths: tuple[str, ...]):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.paths = paths
+
+    def _too_large_detail(self) -> str:
+        return f"File too large. Maximum size is {settings.max_audio_size_mb}MB."
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            response = JSONResponse(status_code=413, content={"detail": self._too_large_detail()})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    raise HTTPException(status_code=413, detail=self._too_large_detail())
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
 # =============================================================================
 # Pydantic Models
 # =============================================================================
@@ -94,6 +180,7 @@ class ProcessResponse(BaseModel):
     warnings: list
     request_id: str
     processing_timestamp: str
+    metadata: Optional[dict] = None  # Decode profile, real-time factor (no PHI)
 
 
 class DeidentifyResponse(BaseModel):
@@ -101,10 +188,45 @@ class DeidentifyResponse(BaseModel):
     entities_found: int
     entities: list
     entity_counts_by_type: dict
+    mode: str
+
+
+class DeidentifyBatchRequest(BaseModel):
+    texts: list[str] = Field(..., description="Texts to de-identify")
+    strategy: str = Field("type_marker", description="Replacement strategy: 'type_marker' (default) or 'redact'")
+
+
+class DeidentifyBatchResponse(BaseModel):
+    results: list[DeidentifyResponse]
+
+
+class JobCreatedResponse(BaseModel):
+    job_id: str
+    status: str
+    status_url: str
+    events_url: str
+    estimate: Optional[dict] = None
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: str
+    created_at: float
+    updated_at: float
+    segments_decoded: int
+    audio_position_seconds: Optional[float]
+    audio_duration_seconds: Optional[float]
+    result: Optional[dict]
+    error: Optional[str]
 
 
 class EstimateResponse(BaseModel):
     estimated_seconds: float
+    p50_seconds: float
+    p90_seconds: float
+    confidence: str
+    audio_duration_seconds: float
+    duration_source: str
     breakdown: dict
 
 
@@ -124,9 +246,18 @@ async def lifespan(app: FastAPI):
     logger.info(f"Whisper model: {settings.whisper_model}")
     logger.info(f"Debug mode: {settings.debug}")
 
+    # The worker pool forks from a parent with the models already loaded,
+    # so (unlike everything else) it loads them at startup
+    deidentify_pool.start()
+
     yield
 
     logger.info("Shutting down...")
+    processing_executor.shutdown()
+    shutdown_batch_scheduler()
+    shutdown_chunk_pool()
+    shutdown_window_pool()
+    deidentify_pool.shutdown()
 
 
 # =============================================================================
@@ -204,6 +335,13 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Upload size limit (innermost, so 413 responses still get security/CORS headers)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_body_bytes=settings.max_audio_size_mb * 1024 * 1024 + UPLOAD_MULTIPART_OVERHEAD_BYTES,
+    paths=UPLOAD_PATHS,
+)
+
 # Security headers middleware (applied first, runs last)
 app.add_middleware(SecurityHeadersMiddleware)
 
@@ -254,9 +392,46 @@ async def health_check():
     )
 
 
+@app.get("/api/admin/stats", tags=["health"])
+async def admin_stats():
+    """
+    Processing capacity statistics.
+
+    Queue depth per processing stage, Whisper model pool checkouts, wait
+    times and utilization, batching, sentence cache and de-identification
+    worker pool counters. Contains no PHI.
+    """
+    return {
+        "executor": processing_executor.stats(),
+        "whisper_pool": whisper_pool.stats(),
+        "whisper_batching": batching_stats(),
+        "estimator": processing_estimator.stats(),
+        "sentence_cache": get_sentence_cache().stats(),
+        "deidentify_pool": deidentify_pool.stats(),
+    }
+
+
+@app.get("/api/admin/recognizers", tags=["health"])
+async def admin_recognizers():
+    """
+    Per-recognizer latency and hit-rate statistics.
+
+    Calls, latency histogram, matches and how many matches survived
+    thresholds and deny lists, for each recognizer plus spaCy parsing.
+    Empty unless RECOGNIZER_METRICS_ENABLED. Contains no PHI.
+    """
+    return recognizer_metrics.stats()
+
+
 @app.post("/api/transcribe", tags=["utilities"])
 @limiter.limit(f"{settings.rate_limit_requests}/{settings.rate_limit_window_seconds}seconds")
-async def transcribe_only(request: Request, file: Annotated[UploadFile, File()]):
+async def transcribe_only(
+    request: Request,
+    file: Annotated[UploadFile, File()],
+    profile: Optional[str] = Query(
+        None, description="Decode profile: 'fast', 'balanced' (default) or 'accurate'"
+    ),
+):
     """
     Transcribe audio without de-identification.
 
@@ -265,37 +440,36 @@ async def transcribe_only(request: Request, file: Annotated[UploadFile, File()])
     ⚠️ **WARNING**: Returns raw transcript which may contain PHI.
     Use /api/process for production to ensure PHI is removed.
     """
-    # Validate file size
-    content = await file.read()
-    size_mb = len(content) / (1024 * 1024)
-
-    if size_mb > settings.max_audio_size_mb:
-        raise HTTPException(
-            status_code=413,
-            detail=f"File too large. Maximum size is {settings.max_audio_size_mb}MB."
-        )
-
-    # Get file extension
-    extension = Path(file.filename or "audio.webm").suffix or ".webm"
+    profile = _validate_decode_profile(profile)
+    audio, file_size, extension = _open_audio_upload(file, generate_request_id())
 
     try:
-        transcript, metadata = transcribe_audio(content, extension)
+        transcript, metadata = await processing_executor.run(
+            TRANSCRIBE_STAGE, transcribe_audio, _stage_audio(audio), extension, profile=profile
+        )
+        _record_transcription_speed(metadata)
 
         return {
             "transcript": transcript,
             "duration_seconds": metadata.get("duration"),
             "language": metadata.get("language"),
-            "segments_count": metadata.get("segments_count")
+            "segments_count": metadata.get("segments_count"),
+            "profile": metadata.get("profile"),
+            "real_time_factor": metadata.get("real_time_factor")
         }
 
     except TranscriptionError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    finally:
+        audio.close()
+
 
 @app.post("/api/deidentify", response_model=DeidentifyResponse, tags=["utilities"])
 async def deidentify_only(
     text: str = Query(..., description="Text to de-identify"),
-    strategy: str = Query("type_marker", description="Replacement strategy: 'type_marker' (default) or 'redact'")
+    strategy: str = Query("type_marker", description="Replacement strategy: 'type_marker' (default) or 'redact'"),
+    mode: str = Query("full", description="Detection tier: 'full' (default) or 'fast' (patterns only)")
 ):
     """
     De-identify text without transcription.
@@ -306,9 +480,54 @@ async def deidentify_only(
     **Strategies**:
     - `type_marker`: Replace PHI with `[ENTITY_TYPE]` (e.g., `[PERSON]`)
     - `redact`: Replace PHI with `[REDACTED]`
+
+    **Modes** (the response's `mode` says which ran):
+    - `full`: spaCy NER plus all pattern recognizers
+    - `fast`: regex pattern recognizers only, for short notes needing
+      sub-millisecond latency. Misses names without a cue such as "mom",
+      and most locations; see scripts/benchmark_fast_mode.py for recall
+      per entity type
+    """
+    if mode not in DEIDENTIFY_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown mode '{mode}'. Available: {', '.join(DEIDENTIFY_MODES)}"
+        )
+
+    if mode == "fast":
+        result = await processing_executor.run(DEIDENTIFY_STAGE, deidentify_text, text, strategy, mode)
+    else:
+        result = await processing_executor.run(DEIDENTIFY_STAGE, deidentify_pooled, text, strategy)
+
+    return _deidentify_response(result)
+
+
+@app.post("/api/deidentify/batch", response_model=DeidentifyBatchResponse, tags=["utilities"])
+async def deidentify_many(body: DeidentifyBatchRequest):
+    """
+    De-identify many texts in one request.
+
+    For bulk jobs such as archived typed handoff notes: all texts are parsed
+    in one spaCy batch, avoiding the per-call overhead of /api/deidentify.
+    Results are returned in input order.
+
+    Accepts at most DEIDENTIFY_BATCH_MAX_TEXTS texts per request (413 otherwise).
     """
-    result = deidentify_text(text, strategy)
+    if len(body.texts) > settings.deidentify_batch_max_texts:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many texts. Maximum per request: {settings.deidentify_batch_max_texts}"
+        )
+
+    results = await processing_executor.run(
+        DEIDENTIFY_STAGE, deidentify_batch, body.texts, body.strategy
+    )
+
+    return DeidentifyBatchResponse(results=[_deidentify_response(result) for result in results])
 
+
+def _deidentify_response(result: DeidentificationResult) -> DeidentifyResponse:
+    """API response for one de-identified text (entity previews are masked)."""
     return DeidentifyResponse(
         clean_text=result.clean_text,
         entities_found=result.entity_count,
@@ -320,13 +539,20 @@ async def deidentify_only(
             }
             for e in result.entities_found
         ],
-        entity_counts_by_type=result.entity_counts_by_type
+        entity_counts_by_type=result.entity_counts_by_type,
+        mode=result.mode
     )
 
 
 @app.post("/api/process", response_model=ProcessResponse, tags=["processing"])
 @limiter.limit(f"{settings.rate_limit_requests}/{settings.rate_limit_window_seconds}seconds")
-async def process_audio(request: Request, file: Annotated[UploadFile, File()]):
+async def process_audio(
+    request: Request,
+    file: Annotated[UploadFile, File()],
+    profile: Optional[str] = Query(
+        None, description="Decode profile: 'fast', 'balanced' (default) or 'accurate'"
+    ),
+):
     """
     **Main endpoint**: Transcribe audio and remove all PHI.
 
@@ -341,6 +567,12 @@ async def process_audio(request: Request, file: Annotated[UploadFile, File()]):
 
     **Rate limited**: 10 requests per 60 seconds (configurable)
 
+    **Backpressure**: Returns 503 with a `Retry-After` header when the
+    processing queue is full
+
+    **Decode profiles**: `?profile=fast` uses greedy decoding for quick
+    bedside notes; `accurate` uses a wider beam (see DECODE_PROFILES)
+
     **Returns**:
     - `clean_transcript`: De-identified text safe for sharing
     - `original_transcript`: Raw transcript (for verification only)
@@ -348,37 +580,289 @@ async def process_audio(request: Request, file: Annotated[UploadFile, File()]):
     - `entities`: Details of each detected entity
     - `audio_duration_seconds`: Length of the audio file
     - `warnings`: Any validation warnings
+    - `metadata`: Decode profile used and its measured real-time factor
     """
     start_time = time.time()
     request_id = generate_request_id()
     client_ip_hash = hash_client_ip(get_remote_address(request) or "unknown")
+    profile = _validate_decode_profile(profile)
 
-    # Validate file
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No file provided")
+    audio, file_size, extension = _open_audio_upload(file, request_id)
 
-    content = await file.read()
-    file_size = len(content)
-    size_mb = file_size / (1024 * 1024)
+    # Log request start (only after the upload passed validation)
+    audit_logger.log_request_start(request_id, file_size, client_ip_hash)
+
+    try:
+        return await _run_processing_pipeline(
+            request_id=request_id,
+            audio=audio,
+            file_size=file_size,
+            extension=extension,
+            client_ip_hash=client_ip_hash,
+            start_time=start_time,
+            profile=profile,
+        )
+    finally:
+        audio.close()
 
-    logger.info(f"[{request_id}] Processing audio: {file.filename} ({size_mb:.2f}MB)")
 
-    # Log request start
-    audit_logger.log_request_start(request_id, file_size, client_ip_hash)
+def _validate_decode_profile(profile: Optional[str]) -> str:
+    """Resolve the requested decode profile before reading the upload (400 if unknown)."""
+    try:
+        name, _ = resolve_decode_profile(profile)
+    except DecodeProfileError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return name
+
+
+def _transcription_summary(metadata: dict) -> dict:
+    """PHI-free transcription metadata for API responses."""
+    return {
+        "profile": metadata.get("profile"),
+        "real_time_factor": metadata.get("real_time_factor"),
+        "language": metadata.get("language"),
+        "segments_count": metadata.get("segments_count"),
+        "decode_path": metadata.get("decode_path"),
+    }
+
+
+def _record_transcription_speed(metadata: dict) -> None:
+    """Feed a completed transcription's real-time factor to the estimator."""
+    duration = metadata.get("duration")
+    real_time_factor = metadata.get("real_time_factor")
+    if duration and real_time_factor:
+        processing_estimator.record_transcription(
+            duration, duration * real_time_factor, metadata.get("clean_length", 0), metadata.get("profile")
+        )
+
+
+def _open_audio_upload(
+    file: UploadFile,
+    request_id: str
+) -> tuple[BinaryIO, int, str]:
+    """
+    Validate an uploaded audio file and return its spool file, enforcing the size cap.
 
-    if size_mb > settings.max_audio_size_mb:
+    Starlette has already spooled the upload (in memory up to 1MB, on disk
+    beyond), so requests that finish with the upload use that file directly
+    instead of copying the audio a second time.
+
+    Returns:
+        Tuple of (audio positioned at 0, size_in_bytes, file_extension).
+        The file belongs to the UploadFile and is closed with the request.
+
+    Raises:
+        HTTPException: 400 if no file, 413 if too large
+        ExecutorBusyError: If the transcription queue is full
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
+
+    # Reject before touching the upload if the transcription queue is full
+    processing_executor.check_capacity(TRANSCRIBE_STAGE)
+
+    audio = file.file
+    size = file.size
+    if size is None:
+        size = audio.seek(0, 2)
+    if size > settings.max_audio_size_mb * 1024 * 1024:
+        logger.info(f"[{request_id}] Upload rejected: exceeds {settings.max_audio_size_mb}MB")
         raise HTTPException(
             status_code=413,
-            detail=f"File too large ({size_mb:.1f}MB). Maximum size is {settings.max_audio_size_mb}MB."
+            detail=f"File too large. Maximum size is {settings.max_audio_size_mb}MB."
         )
 
-    # Get file extension
-    extension = Path(file.filename).suffix or ".webm"
+    audio.seek(0)
+    logger.info(f"[{request_id}] Processing audio: {file.filename} ({size / (1024 * 1024):.2f}MB)")
+
+    return audio, size, Path(file.filename).suffix or ".webm"
+
+
+async def _spool_audio_upload(
+    file: UploadFile,
+    request_id: str
+) -> tuple[SpooledTemporaryFile, int, str]:
+    """
+    Copy a validated upload into a spool file that outlives the request.
+
+    Only background jobs need this: the UploadFile is closed when the
+    request returns. The copy is made in fixed-size chunks; small uploads
+    stay in memory, larger ones spill to a temp file under settings.temp_dir.
+
+    Returns:
+        Tuple of (spooled_audio positioned at 0, size_in_bytes, file_extension).
+        The caller must close the spool file.
+
+    Raises:
+        HTTPException: 400 if no file, 413 if too large
+        ExecutorBusyError: If the transcription queue is full
+    """
+    _, size, extension = _open_audio_upload(file, request_id)
+
+    temp_dir = Path(settings.temp_dir)
+    temp_dir.mkdir(parents=True, exist_ok=True)
+
+    spool = SpooledTemporaryFile(
+        max_size=settings.upload_spool_memory_mb * 1024 * 1024,
+        dir=temp_dir,
+    )
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+            spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+
+    spool.seek(0)
+    return spool, size, extension
+
+
+def _stage_audio(audio: BinaryIO) -> Union[BinaryIO, bytes]:
+    """
+    Prepare spooled audio for a transcription stage call.
+
+    Thread workers read the spooled file directly; the process backend needs
+    picklable bytes, so only then is the audio read into memory.
+    """
+    if processing_executor.in_process:
+        return audio
+    audio.seek(0)
+    return audio.read()
+
+
+def _job_segment_callback(job: Job):
+    """Forward per-segment progress from the transcription worker thread to a job."""
+    loop = asyncio.get_running_loop()
+
+    def on_segment(segment: dict, duration: Optional[float]) -> None:
+        loop.call_soon_threadsafe(job.record_segment, segment["end"], duration)
+
+    return on_segment
+
+
+async def _transcribe_and_deidentify_streaming(
+    request_id: str,
+    audio: BinaryIO,
+    extension: str,
+    start_time: float,
+    job: Optional[Job] = None,
+    profile: Optional[str] = None,
+) -> tuple[str, dict, DeidentificationResult]:
+    """
+    Transcribe and de-identify concurrently, segment by segment.
+
+    Whisper segments are queued from the transcription worker as they are
+    decoded and de-identified on the de-identify stage while transcription
+    continues, so wall-clock time approaches max(transcribe, de-identify)
+    rather than their sum. Segments that pile up while a de-identify call is
+    running are fed together in the next call.
+
+    Requires the thread executor backend (callbacks cross threads).
 
+    Returns:
+        Tuple of (transcript, transcription_metadata, deidentification_result)
+    """
+    loop = asyncio.get_running_loop()
+    segments: asyncio.Queue = asyncio.Queue()
+    deidentifier = StreamingDeidentifier("type_marker")
+
+    def on_segment(segment: dict, duration: Optional[float]) -> None:
+        loop.call_soon_threadsafe(segments.put_nowait, segment)
+        if job is not None:
+            loop.call_soon_threadsafe(job.record_segment, segment["end"], duration)
+
+    # Jobs are admitted when created (the job store bounds them)
+    transcription = asyncio.ensure_future(processing_executor.run(
+        TRANSCRIBE_STAGE, transcribe_audio, audio, extension,
+        on_segment=on_segment, profile=profile, admit=job is None
+    ))
+    # Runs after all queued segments (same loop FIFO): marks end of stream
+    transcription.add_done_callback(lambda _: segments.put_nowait(None))
+
+    first_segment_logged = False
+    deidentified_chars = 0
+    deidentify_seconds = 0.0
+    try:
+        finished = False
+        while not finished:
+            batch = [await segments.get()]
+            while not segments.empty():
+                batch.append(segments.get_nowait())
+            finished = batch[-1] is None
+
+            texts = [segment["text"] for segment in batch if segment is not None]
+            if not texts:
+                continue
+
+            # Already admitted at the transcription stage - never drop work in progress
+            fed = time.perf_counter()
+            cleaned = await processing_executor.run(
+                DEIDENTIFY_STAGE, deidentifier.feed_many, texts, admit=False
+            )
+            deidentify_seconds += time.perf_counter() - fed
+            deidentified_chars += sum(len(text) for text in texts)
+            if cleaned and not first_segment_logged:
+                first_segment_logged = True
+                logger.info(
+                    f"[{request_id}] First de-identified segment ready after "
+                    f"{time.time() - start_time:.2f}s"
+                )
+            if job is not None:
+                for segment in cleaned:
+                    job.record_clean_segment(segment.index, segment.clean_text)
+    except BaseException:
+        # Don't leave the transcription running unobserved
+        await asyncio.gather(transcription, return_exceptions=True)
+        raise
+
+    transcript, metadata = await transcription
+    processing_estimator.record_deidentification(deidentified_chars, deidentify_seconds)
+    return transcript, metadata, deidentifier.finish()
+
+
+async def _run_processing_pipeline(
+    request_id: str,
+    audio: BinaryIO,
+    file_size: int,
+    extension: str,
+    client_ip_hash: str,
+    start_time: float,
+    job: Optional[Job] = None,
+    profile: Optional[str] = None,
+) -> ProcessResponse:
+    """
+    Transcribe, de-identify and validate one upload.
+
+    Shared by the blocking /api/process endpoint and background jobs.
+    When a job is given, stage transitions and decoded segments are
+    reported to it as they happen.
+
+    Raises:
+        HTTPException: On transcription or processing failure
+        ExecutorBusyError: If the transcription queue is full
+    """
     try:
-        # Step 1: Transcribe
+        # Step 1: Transcribe (de-identifying segments as they arrive when streaming)
         logger.info(f"[{request_id}] Step 1: Transcribing audio...")
-        transcript, metadata = transcribe_audio(content, extension)
+        if job is not None:
+            job.set_stage(JOB_TRANSCRIBING)
+
+        result: Optional[DeidentificationResult] = None
+        if settings.stream_deidentification and processing_executor.in_process:
+            transcript, metadata, result = await _transcribe_and_deidentify_streaming(
+                request_id, audio, extension, start_time, job, profile
+            )
+        else:
+            on_segment = None
+            if job is not None and processing_executor.in_process:
+                on_segment = _job_segment_callback(job)
+
+            # Jobs are admitted when created (the job store bounds them)
+            transcript, metadata = await processing_executor.run(
+                TRANSCRIBE_STAGE, transcribe_audio, _stage_audio(audio), extension,
+                on_segment=on_segment, profile=profile, admit=job is None
+            )
+        _record_transcription_speed(metadata)
 
         if not transcript.strip():
             processing_time = time.time() - start_time
@@ -399,16 +883,35 @@ async def process_audio(request: Request, file: Annotated[UploadFile, File()]):
                 audio_duration_seconds=metadata.get("duration"),
                 warnings=["No speech detected in audio"],
                 request_id=request_id,
-                processing_timestamp=datetime.utcnow().isoformat()
+                processing_timestamp=datetime.utcnow().isoformat(),
+                metadata=_transcription_summary(metadata)
             )
 
-        # Step 2: De-identify
+        # Step 2: De-identify (already done segment by segment when streaming)
         logger.info(f"[{request_id}] Step 2: De-identifying PHI...")
-        result = deidentify_text(transcript, "type_marker")
+        if job is not None:
+            job.set_stage(JOB_DEIDENTIFYING)
+        if result is not None and result.original_text != transcript:
+            logger.warning(f"[{request_id}] Streamed segments diverged from transcript; re-running de-identification")
+            result = None
+        if result is None:
+            # Already admitted at the transcription stage - never drop work in progress
+            deidentify_started = time.perf_counter()
+            result = await processing_executor.run(
+                DEIDENTIFY_STAGE, deidentify_pooled, transcript, "type_marker", admit=False
+            )
+            processing_estimator.record_deidentification(
+                len(transcript), time.perf_counter() - deidentify_started
+            )
 
         # Step 3: Validate
         logger.info(f"[{request_id}] Step 3: Validating de-identification...")
-        is_valid, warnings = validate_deidentification(transcript, result.clean_text)
+        if job is not None:
+            job.set_stage(JOB_VALIDATING)
+        is_valid, warnings = await processing_executor.run(
+            DEIDENTIFY_STAGE, validate_deidentification, transcript, result.clean_text, result,
+            admit=False
+        )
 
         if not is_valid:
             logger.warning(f"[{request_id}] Validation warnings: {warnings}")
@@ -445,8 +948,20 @@ async def process_audio(request: Request, file: Annotated[UploadFile, File()]):
             audio_duration_seconds=metadata.get("duration"),
             warnings=warnings,
             request_id=request_id,
-            processing_timestamp=datetime.utcnow().isoformat()
+            processing_timestamp=datetime.utcnow().isoformat(),
+            metadata=_transcription_summary(metadata)
+        )
+
+    except ExecutorBusyError:
+        processing_time = time.time() - start_time
+        audit_logger.log_request_failed(
+            request_id=request_id,
+            file_size_bytes=file_size,
+            error_type="ExecutorBusyError",
+            processing_time_seconds=processing_time,
+            client_ip_hash=client_ip_hash
         )
+        raise
 
     except TranscriptionError as e:
         processing_time = time.time() - start_time
@@ -479,18 +994,210 @@ async def process_audio(request: Request, file: Annotated[UploadFile, File()]):
         ) from e
 
 
+# =============================================================================
+# Asynchronous Jobs
+# =============================================================================
+
+# Strong references so background tasks are not garbage-collected mid-run
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def _run_job(
+    job: Job,
+    audio: SpooledTemporaryFile,
+    file_size: int,
+    extension: str,
+    client_ip_hash: str,
+    start_time: float,
+    profile: Optional[str] = None,
+):
+    """Run the processing pipeline for a job and record its outcome."""
+    try:
+        response = await _run_processing_pipeline(
+            request_id=job.request_id,
+            audio=audio,
+            file_size=file_size,
+            extension=extension,
+            client_ip_hash=client_ip_hash,
+            start_time=start_time,
+            job=job,
+            profile=profile,
+        )
+        job.complete(response.model_dump())
+    except HTTPException as e:
+        job.fail(str(e.detail))
+    except ExecutorBusyError as e:
+        job.fail(str(e))
+    except Exception:
+        logger.exception(f"[{job.request_id}] Job failed unexpectedly")
+        job.fail("Processing failed. Please try again.")
+    finally:
+        audio.close()
+
+
+@app.post("/api/jobs", response_model=JobCreatedResponse, status_code=202, tags=["processing"])
+@limiter.limit(f"{settings.rate_limit_requests}/{settings.rate_limit_window_seconds}seconds")
+async def create_job(
+    request: Request,
+    file: Annotated[UploadFile, File()],
+    profile: Optional[str] = Query(
+        None, description="Decode profile: 'fast', 'balanced' (default) or 'accurate'"
+    ),
+):
+    """
+    Start asynchronous processing of an audio file.
+
+    Returns a job ID immediately instead of holding the connection open for
+    the whole transcription. Follow progress with:
+    - `GET /api/jobs/{job_id}`: Poll current status (result included when complete)
+    - `GET /api/jobs/{job_id}/events`: Server-Sent Events stream of stage
+      transitions, decoded segment counts, and the final `ProcessResponse`
+
+    Results are kept in memory for a limited time (JOB_TTL_SECONDS) and
+    then discarded.
+
+    The job ID is a random bearer handle for the result, which includes the
+    original transcript: it is not the audit request ID and is never logged.
+
+    **Backpressure**: Returns 503 with a `Retry-After` header when the
+    processing queue or job store is full
+    """
+    start_time = time.time()
+    request_id = generate_request_id()
+    client_ip_hash = hash_client_ip(get_remote_address(request) or "unknown")
+    profile = _validate_decode_profile(profile)
+
+    audio, file_size, extension = await _spool_audio_upload(file, request_id)
+    try:
+        # Container header when it declares a duration (MediaRecorder WebM often doesn't).
+        # Probed before the job is registered so a cancelled request leaves no job behind.
+        duration = await asyncio.to_thread(probe_duration, audio)
+        estimate = processing_estimator.estimate(
+            duration if duration is not None else duration_from_size(file_size, extension), profile
+        )
+        estimate["duration_source"] = "container" if duration is not None else "file_size"
+        job = job_store.create(new_job_id(), request_id)
+    except BaseException:
+        audio.close()
+        raise
+
+    audit_logger.log_request_start(request_id, file_size, client_ip_hash)
+
+    # No await between registering the job and handing it to its task: the
+    # job owns the spool file from here on (UploadFile is closed with the request)
+    task = asyncio.create_task(
+        _run_job(job, audio, file_size, extension, client_ip_hash, start_time, profile)
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+    return JobCreatedResponse(
+        job_id=job.job_id,
+        status=job.status,
+        status_url=f"/api/jobs/{job.job_id}",
+        events_url=f"/api/jobs/{job.job_id}/events",
+        estimate=estimate,
+    )
+
+
+def _get_job_or_404(job_id: str) -> Job:
+    job = job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
+
+
+@app.get("/api/jobs/{job_id}", response_model=JobStatusResponse, tags=["processing"])
+async def get_job(job_id: str):
+    """
+    Get the current status of a processing job.
+
+    `result` holds the `ProcessResponse` once status is `complete`;
+    `error` holds the failure reason once status is `failed`.
+    """
+    return JobStatusResponse(**_get_job_or_404(job_id).snapshot())
+
+
+@app.get("/api/jobs/{job_id}/events", tags=["processing"])
+async def stream_job_events(request: Request, job_id: str):
+    """
+    Stream job progress as Server-Sent Events.
+
+    Event types:
+    - `stage`: `{"status": "transcribing" | "deidentifying" | "validating"}`
+    - `progress`: `{"segments_decoded", "audio_position_seconds", "audio_duration_seconds"}`
+    - `segment`: `{"index", "clean_text"}` - a de-identified segment, published
+      while transcription continues (final text is in `complete`, after validation)
+    - `complete`: Final `ProcessResponse`
+    - `error`: `{"detail": "..."}`
+
+    Past events are replayed on connect; reconnecting clients may send
+    `Last-Event-ID` to resume.
+    """
+    job = _get_job_or_404(job_id)
+
+    last_event_id = request.headers.get("last-event-id")
+    seen = int(last_event_id) + 1 if last_event_id and last_event_id.isdigit() else 0
+
+    async def event_stream():
+        nonlocal seen
+        while True:
+            while seen < len(job.events):
+                yield job.events[seen].to_sse()
+                seen += 1
+            if job.is_finished or await request.is_disconnected():
+                return
+            if not await job.wait_for_event(seen, timeout=SSE_KEEPALIVE_SECONDS):
+                yield ": keepalive\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/estimate-time", response_model=EstimateResponse, tags=["utilities"])
-async def estimate_time(file_size_bytes: int = Query(..., gt=0, description="Audio file size in bytes")):
+async def estimate_time(
+    file_size_bytes: Optional[int] = Query(None, gt=0, description="Audio file size in bytes"),
+    duration_seconds: Optional[float] = Query(None, gt=0, description="Audio duration, if known"),
+    extension: Optional[str] = Query(None, description="File extension, e.g. '.webm'"),
+    profile: Optional[str] = Query(
+        None, description="Decode profile: 'fast', 'balanced' (default) or 'accurate'"
+    ),
+):
     """
-    Estimate processing time for a given file size.
+    Estimate processing time for a recording.
 
     Helps frontend show realistic progress expectations before upload.
-    Estimate is based on the configured Whisper model and device (CPU/GPU).
+    Pass the audio duration when the client knows it (e.g., the recording
+    timer); otherwise it is derived from file size and format.
+
+    The estimate is calibrated from real-time factors measured on this
+    server for the configured model and decode profile, and reports a
+    median (p50) and slow-case (p90) time. Confidence is "low" until enough
+    requests have been observed.
     """
-    estimate = estimate_transcription_time(file_size_bytes)
+    profile = _validate_decode_profile(profile)
+    if duration_seconds is not None:
+        source = "client"
+    elif file_size_bytes is not None:
+        if extension and not extension.startswith("."):
+            extension = f".{extension}"
+        duration_seconds = duration_from_size(file_size_bytes, extension)
+        source = "file_size"
+    else:
+        raise HTTPException(status_code=400, detail="Provide duration_seconds or file_size_bytes")
+
+    estimate = processing_estimator.estimate(duration_seconds, profile)
 
     return EstimateResponse(
-        estimated_seconds=estimate["estimated_seconds"],
+        estimated_seconds=estimate["p50_seconds"],
+        p50_seconds=estimate["p50_seconds"],
+        p90_seconds=estimate["p90_seconds"],
+        confidence=estimate["confidence"],
+        audio_duration_seconds=estimate["audio_duration_seconds"],
+        duration_source=source,
         breakdown=estimate
     )
 
@@ -499,6 +1206,26 @@ async def estimate_time(file_size_bytes: int = Query(..., gt=0, description="Aud
 # Error Handlers
 # =============================================================================
 
+@app.exception_handler(ExecutorBusyError)
+async def executor_busy_handler(request: Request, exc: ExecutorBusyError):
+    """Apply backpressure: tell clients to retry instead of queueing forever."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc), "stage": exc.stage},
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+    )
+
+
+@app.exception_handler(JobStoreFullError)
+async def job_store_full_handler(request: Request, exc: JobStoreFullError):
+    """Too many unfinished jobs - same backpressure contract as a full queue."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+    )
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Handle unexpected errors gracefully."""
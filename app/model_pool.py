@@ -0,0 +1,155 @@
+"""
+Fixed-size pool of model instances.
+
+A single shared WhisperModel serializes every request on one CTranslate2
+instance. The pool holds up to N instances, each built with its own CPU
+thread budget, and hands one out per request:
+
+    with whisper_pool.checkout() as model:
+        segments, info = model.transcribe(...)
+
+Instances are created lazily (on first demand, up to the pool size) so
+startup stays fast and small deployments never load more than they use.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ModelPoolTimeout(Exception):
+    """Raised when no instance becomes free within the checkout timeout."""
+    pass
+
+
+class ModelPool(Generic[T]):
+    """
+    Thread-safe pool of lazily created model instances.
+
+    Args:
+        factory: Builds instance number `index` (0-based)
+        size: Maximum number of instances
+        name: Label for logs and stats
+    """
+
+    def __init__(self, factory: Callable[[int], T], size: int, name: str = "model"):
+        self.factory = factory
+        self.size = max(1, size)
+        self.name = name
+        self._idle: list[T] = []
+        self._created = 0
+        self._cond = threading.Condition()
+
+        # Statistics (guarded by _cond)
+        self._started_at = time.monotonic()
+        self._in_use = 0
+        self._waiting = 0
+        self._checkouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._busy_total = 0.0
+
+    @property
+    def loaded(self) -> int:
+        """Number of instances created so far."""
+        return self._created
+
+    def _acquire(self, timeout: Optional[float]) -> tuple[Optional[T], int]:
+        """Take an idle instance, or reserve a slot to create one. Returns (instance, new_index)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._waiting += 1
+            try:
+                while True:
+                    if self._idle:
+                        return self._idle.pop(), -1
+                    if self._created < self.size:
+                        self._created += 1
+                        return None, self._created - 1
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise ModelPoolTimeout(
+                            f"No {self.name} instance free after {timeout:.0f}s"
+                        )
+                    self._cond.wait(remaining)
+            finally:
+                self._waiting -= 1
+
+    def _create(self, index: int) -> T:
+        logger.info(f"Loading {self.name} instance {index + 1}/{self.size}")
+        try:
+            return self.factory(index)
+        except BaseException:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[T]:
+        """
+        Borrow an instance for the duration of the block.
+
+        Args:
+            timeout: Seconds to wait for a free instance (None = wait forever)
+
+        Raises:
+            ModelPoolTimeout: If no instance became free in time
+        """
+        requested = time.monotonic()
+        instance, new_index = self._acquire(timeout)
+        if instance is None:
+            instance = self._create(new_index)
+
+        acquired = time.monotonic()
+        with self._cond:
+            wait = acquired - requested
+            self._checkouts += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._in_use += 1
+
+        try:
+            yield instance
+        finally:
+            with self._cond:
+                self._busy_total += time.monotonic() - acquired
+                self._in_use -= 1
+                self._idle.append(instance)
+                self._cond.notify()
+
+    def preload(self, count: Optional[int] = None) -> None:
+        """Create instances up front (default: fill the pool)."""
+        target = self.size if count is None else min(count, self.size)
+        while True:
+            with self._cond:
+                if self._created >= target:
+                    return
+                self._created += 1
+                index = self._created - 1
+            instance = self._create(index)
+            with self._cond:
+                self._idle.append(instance)
+                self._cond.notify()
+
+    def stats(self) -> dict[str, Any]:
+        """Pool statistics (no PHI)."""
+        with self._cond:
+            elapsed = time.monotonic() - self._started_at
+            return {
+                "size": self.size,
+                "loaded": self._created,
+                "in_use": self._in_use,
+                "waiting": self._waiting,
+                "checkouts": self._checkouts,
+                "wait_seconds_mean": round(self._wait_total / self._checkouts, 4) if self._checkouts else 0.0,
+                "wait_seconds_max": round(self._wait_max, 4),
+                "utilization": round(self._busy_total / (self.size * elapsed), 4) if elapsed > 0 else 0.0,
+            }
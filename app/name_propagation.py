@@ -0,0 +1,181 @@
+"""
+Document-level name propagation.
+
+A name caught once with strong evidence ("mom Jessica", via the guardian
+recognizer) is often missed when it recurs bare ("jessica called back"):
+Whisper output is lowercase, and spaCy NER rarely fires on it. After
+detection, propagate_names() collects the surface forms of the document's
+confirmed PERSON and GUARDIAN_NAME entities and redacts their other
+occurrences in one pass over the text:
+
+1. Seeds: kept PERSON/GUARDIAN_NAME results from cue-based recognizers
+   (guardian, baby name patterns) scoring at least
+   settings.name_propagation_min_score. spaCy NER hits never seed: every
+   one scores a constant 0.85 and PERSON precision is about 73%, so a
+   single false positive ("Will", "Grace") would redact every occurrence
+   of that word
+2. Forms: each seed's text, plus its words for multi-word names ("Jessica
+   Smith" -> "jessica", "smith"). Words shorter than
+   settings.name_propagation_min_chars, stop words, titles ("Dr."),
+   relationship words and deny-listed terms are never propagated
+3. One Aho-Corasick pass over the lowercased text finds every occurrence;
+   those on word boundaries that don't overlap an existing result become
+   new results, with the seed's entity type and score
+
+Transcripts de-identified piece by piece (streaming, incremental) keep the
+forms of earlier pieces with name_forms()/merge_name_forms() and search
+each new piece with find_names().
+"""
+
+import logging
+
+from presidio_analyzer import RecognizerResult
+from spacy.lang.en.stop_words import STOP_WORDS
+
+from .config import settings
+from .deny_list import AhoCorasick, get_deny_list_index
+from .recognizers.guardian import FILLER_WORDS, RELATIONSHIP_SCORES
+
+logger = logging.getLogger(__name__)
+
+PROPAGATED_ENTITIES = ("PERSON", "GUARDIAN_NAME")
+
+# recognition_metadata name of propagated results
+RECOGNIZER_NAME = "Name Propagation"
+
+# Recognizers whose results never seed propagation (presidio's SpacyRecognizer)
+NER_RECOGNIZERS = frozenset({"SpacyRecognizer"})
+
+# Titles and honorifics detected as part of a name ("Dr. Patel"), never
+# propagated on their own; matched without a trailing period
+HONORIFICS = frozenset({
+    "dr", "doctor", "mr", "mrs", "ms", "miss", "mx", "mister", "madam", "sir",
+    "prof", "professor", "rev", "fr", "sr", "jr", "nurse", "rn", "np", "pa", "md",
+})
+
+NameForms = dict[str, tuple[str, float]]
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _surface_forms(text: str, seeds: list[RecognizerResult]) -> NameForms:
+    """Lowercase form -> (entity type, score) of the best seed it came from."""
+    deny_list = get_deny_list_index()
+    forms: NameForms = {}
+    for seed in sorted(seeds, key=lambda r: r.score):
+        name = text[seed.start:seed.end].strip().lower()
+        words = name.split()
+        candidates = [name] + (words if len(words) > 1 else [])
+        for form in candidates:
+            if (
+                len(form) < settings.name_propagation_min_chars
+                or form in STOP_WORDS
+                or form.rstrip(".") in HONORIFICS
+                or form in RELATIONSHIP_SCORES
+                or form in FILLER_WORDS
+                or any(deny_list.is_denied(entity_type, form) for entity_type in PROPAGATED_ENTITIES)
+            ):
+                continue
+            forms[form] = (seed.entity_type, seed.score)
+    return forms
+
+
+def _is_seed(result: RecognizerResult) -> bool:
+    recognizer = (result.recognition_metadata or {}).get(RecognizerResult.RECOGNIZER_NAME_KEY)
+    return (
+        result.entity_type in PROPAGATED_ENTITIES
+        and result.score >= settings.name_propagation_min_score
+        and recognizer not in NER_RECOGNIZERS
+    )
+
+
+def name_forms(text: str, results: list[RecognizerResult]) -> NameForms:
+    """
+    Propagated surface forms of the confirmed names among results.
+
+    Args:
+        text: The analyzed text
+        results: Results kept after thresholds and deny lists
+
+    Returns:
+        Lowercase form -> (entity type, score) of the best seed it came from
+    """
+    seeds = [r for r in results if _is_seed(r)]
+    return _surface_forms(text, seeds) if seeds else {}
+
+
+def merge_name_forms(forms: NameForms, more: NameForms) -> NameForms:
+    """Union of two sets of forms, keeping the higher-scoring seed of each."""
+    merged = dict(forms)
+    for form, (entity_type, score) in more.items():
+        if form not in merged or merged[form][1] < score:
+            merged[form] = (entity_type, score)
+    return merged
+
+
+def propagate_names(text: str, results: list[RecognizerResult]) -> list[RecognizerResult]:
+    """
+    Find the other occurrences of a document's confirmed names.
+
+    Args:
+        text: The analyzed text
+        results: Results kept after thresholds and deny lists
+
+    Returns:
+        New results for occurrences not already covered (possibly empty)
+    """
+    return find_names(text, name_forms(text, results), results)
+
+
+def find_names(text: str, forms: NameForms, results: list[RecognizerResult]) -> list[RecognizerResult]:
+    """
+    Find occurrences of name forms not already covered by results.
+
+    Args:
+        text: Text to search
+        forms: Name forms (see name_forms), possibly from other text
+        results: Results in text; occurrences overlapping them are skipped
+
+    Returns:
+        New results with each form's entity type and score (possibly empty)
+    """
+    if not forms:
+        return []
+
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Lowercasing changed offsets (rare non-ASCII case mappings)
+        logger.debug("Skipping name propagation: lowercase text length differs")
+        return []
+
+    automaton = AhoCorasick(forms)
+
+    # Longest occurrence first, skipping anything overlapping a kept span
+    occurrences = sorted(automaton.find_all(lowered), key=lambda span: (span[0], span[0] - span[1]))
+    covered = bytearray(len(text))
+    for r in results:
+        covered[r.start:r.end] = b"\x01" * (r.end - r.start)
+    propagated = []
+    for start, end in occurrences:
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < len(text) and _is_word_char(text[end]):
+            continue
+        if any(covered[start:end]):
+            continue
+
+        entity_type, score = forms[lowered[start:end]]
+        propagated.append(RecognizerResult(
+            entity_type=entity_type,
+            start=start,
+            end=end,
+            score=score,
+            recognition_metadata={RecognizerResult.RECOGNIZER_NAME_KEY: RECOGNIZER_NAME},
+        ))
+        covered[start:end] = b"\x01" * (end - start)
+
+    if propagated:
+        logger.debug(f"Name propagation added {len(propagated)} occurrences of {len(forms)} names")
+    return propagated
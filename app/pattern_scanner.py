@@ -0,0 +1,339 @@
+"""
+Combined matching for the custom pattern recognizers.
+
+A PatternRecognizer runs each of its regexes as a separate finditer over
+the whole text, so the medical and pediatric recognizers scan every text
+dozens of times; most of that time goes to families of patterns that
+differ only in a lookaround, e.g. the 30+ guardian patterns
+"(?i)(?<=mom )[a-z][a-z]+\b", "(?i)(?<=dad )[a-z][a-z]+\b", ...
+
+PatternScanner merges each family into one alternation and scans for the
+family once:
+
+1. Patterns with the same flags and the same body behind a literal
+   lookbehind, or before a trailing lookahead, share one locator:
+   (?<=mom |dad |...)[a-z][a-z]+\b
+2. The locator finds every position where some member can match; members
+   are then matched anchored at those positions only, keeping finditer
+   semantics per pattern (a pattern's next match can't start before its
+   previous match ended)
+3. Patterns in no family are matched with their own finditer, as before
+
+One alternation over all patterns isn't used: Python's backtracking
+engines try every alternative at every position, which is no faster than
+separate scans.
+
+Results are built exactly as PatternRecognizer builds them and attributed
+to the original recognizers. Those stay registered as
+ScannedPatternRecognizer (same name, patterns and context; analyze()
+returns nothing), so context enhancement, thresholds and instrumentation
+see the same recognizers as before. Patterns are compiled with the regex
+module, as Presidio compiles them.
+"""
+
+import logging
+from typing import Optional
+
+import regex
+from presidio_analyzer import EntityRecognizer, PatternRecognizer, RecognizerResult
+from presidio_analyzer.nlp_engine import NlpArtifacts
+
+logger = logging.getLogger(__name__)
+
+# Inline global flags at the start of a pattern, e.g. "(?i)"
+_LEADING_FLAGS = regex.compile(r"^\(\?([aiLmsux]+)\)")
+_FLAG_VALUES = {
+    "a": regex.ASCII, "i": regex.IGNORECASE, "L": regex.LOCALE, "m": regex.MULTILINE,
+    "s": regex.DOTALL, "u": regex.UNICODE, "x": regex.VERBOSE,
+}
+
+# Literal lookbehind at the start of a pattern, e.g. "(?<=mom )"
+_LITERAL_LOOKBEHIND = regex.compile(r"^\(\?<=((?:[^()\[\]|\\]|\\.)+)\)")
+
+# Named groups or backreferences (group names/numbers would collide)
+_GROUP_REFERENCES = regex.compile(r"\(\?P?<[A-Za-z_]|\(\?P=|\\[1-9]|\\g<")
+
+
+class ScannedPatternRecognizer(PatternRecognizer):
+    """
+    PatternRecognizer whose patterns are matched by a PatternScanner.
+
+    Registered in place of the original so results keep its name and
+    context words; analyze() itself finds nothing.
+    """
+
+    @classmethod
+    def from_recognizer(cls, recognizer: PatternRecognizer) -> "ScannedPatternRecognizer":
+        return cls(
+            supported_entity=recognizer.supported_entities[0],
+            name=recognizer.name,
+            supported_language=recognizer.supported_language,
+            patterns=recognizer.patterns,
+            context=recognizer.context,
+            global_regex_flags=recognizer.global_regex_flags,
+            version=recognizer.version,
+        )
+
+    def analyze(
+        self,
+        text: str,
+        entities: list[str],
+        nlp_artifacts: Optional[NlpArtifacts] = None,
+        regex_flags: Optional[int] = None
+    ) -> list[RecognizerResult]:
+        return []
+
+
+def _split_trailing_lookahead(body: str) -> Optional[tuple[str, str]]:
+    """Split "BODY(?=AHEAD)" into (BODY, AHEAD); None without a top-level trailing lookahead."""
+    opens: list[int] = []
+    last_open = None
+    in_class = False
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A "]" first in a class (after an optional "^") is literal
+            if body.startswith("^", i + 1):
+                i += 1
+            if body.startswith("]", i + 1):
+                i += 1
+        elif char == "(":
+            opens.append(i)
+        elif char == ")":
+            if not opens:
+                return None
+            start = opens.pop()
+            if i == len(body) - 1 and not opens:
+                last_open = start
+        i += 1
+    if not last_open or not body.startswith("(?=", last_open):
+        return None
+    return body[:last_open], body[last_open + 3:-1]
+
+
+def _family_key(pattern_regex: str, flags: int) -> tuple[tuple[int, str, str], str]:
+    """
+    Family of a pattern and its own part.
+
+    Returns:
+        ((flags, kind, shared body), lookaround content) where kind is
+        "behind", "ahead" or "whole" (no family: the whole pattern)
+    """
+    match = _LEADING_FLAGS.match(pattern_regex)
+    if match is not None:
+        for letter in match.group(1):
+            flags |= _FLAG_VALUES[letter]
+        pattern_regex = pattern_regex[match.end():]
+
+    match = _LITERAL_LOOKBEHIND.match(pattern_regex)
+    if match is not None:
+        return (flags, "behind", pattern_regex[match.end():]), match.group(1)
+    split = _split_trailing_lookahead(pattern_regex)
+    if split is not None:
+        return (flags, "ahead", split[0]), split[1]
+    return (flags, "whole", pattern_regex), ""
+
+
+class _PatternFamily:
+    """Patterns sharing a body, located together by one alternation of their lookarounds."""
+
+    def __init__(self, key: tuple[int, str, str]):
+        self.flags, self.kind, self.body = key
+        self.indices: list[int] = []
+        self.parts: list[str] = []
+        self.locator: Optional[regex.Pattern] = None
+
+    def compile(self) -> None:
+        alternatives = "|".join(f"(?:{part})" for part in dict.fromkeys(self.parts))
+        if self.kind == "behind":
+            source = f"(?<={alternatives}){self.body}"
+        else:
+            source = f"{self.body}(?={alternatives})"
+        self.locator = regex.compile(source, flags=self.flags)
+
+
+class PatternScanner(EntityRecognizer):
+    """
+    Matches the patterns of several pattern recognizers, one scan per family.
+
+    Args:
+        recognizers: Scanned recognizers whose patterns this scanner matches
+    """
+
+    def __init__(self, recognizers: list[ScannedPatternRecognizer]):
+        self.recognizers = recognizers
+        self._patterns = [(r, p) for r in recognizers for p in r.patterns]
+        self._compiled = [
+            regex.compile(p.regex, flags=r.global_regex_flags or 0) for r, p in self._patterns
+        ]
+
+        families: dict[tuple[int, str, str], _PatternFamily] = {}
+        for i, (recognizer, pattern) in enumerate(self._patterns):
+            key, part = _family_key(pattern.regex, recognizer.global_regex_flags or 0)
+            if key[1] == "whole" or _GROUP_REFERENCES.search(pattern.regex):
+                key = (0, "whole", str(i))
+            family = families.setdefault(key, _PatternFamily(key))
+            family.indices.append(i)
+            family.parts.append(part)
+
+        self._families: list[_PatternFamily] = []
+        self._separate: list[int] = []
+        for family in families.values():
+            if len(family.indices) == 1:
+                self._separate.extend(family.indices)
+                continue
+            try:
+                family.compile()
+                self._families.append(family)
+            except regex.error as e:
+                logger.warning(f"Patterns can't be combined ({e}); matching them separately")
+                self._separate.extend(family.indices)
+
+        logger.info(
+            f"Pattern scanner: {len(self._patterns)} patterns from {len(recognizers)} recognizers, "
+            f"{sum(len(f.indices) for f in self._families)} in {len(self._families)} combined scans, "
+            f"{len(self._separate)} separate"
+        )
+        super().__init__(
+            supported_entities=sorted({e for r in recognizers for e in r.supported_entities}),
+            name="Pattern Scanner",
+            supported_language="en",
+        )
+
+    def load(self) -> None:
+        pass
+
+    def _scan(self, text: str, family: _PatternFamily, spans: list[list[tuple[int, int]]]) -> None:
+        """Record each family member's match spans, as its own finditer would find them."""
+        compiled = self._compiled
+        next_start = [0] * len(family.indices)
+        done = [False] * len(family.indices)
+
+        # Every position where some member can match (one locator match per position)
+        for located in family.locator.finditer(text, overlapped=True):
+            position = located.start()
+            for k, i in enumerate(family.indices):
+                if done[k] or position < next_start[k]:
+                    continue
+                match = compiled[i].match(text, position)
+                if match is None:
+                    continue
+                start, end = match.span()
+                if start == end:
+                    # finditer retries after an empty match differently;
+                    # let it take over this pattern from here
+                    spans[i].extend(m.span() for m in compiled[i].finditer(text, position))
+                    done[k] = True
+                    continue
+                spans[i].append((start, end))
+                next_start[k] = end
+
+    def analyze(
+        self,
+        text: str,
+        entities: list[str],
+        nlp_artifacts: Optional[NlpArtifacts] = None
+    ) -> list[RecognizerResult]:
+        """
+        Match all patterns and build each recognizer's results.
+
+        Args:
+            text: Text to analyze
+            entities: Requested entities (recognizers for others are skipped)
+            nlp_artifacts: Unused
+
+        Returns:
+            Each recognizer's de-duplicated results, attributed to it
+        """
+        spans: list[list[tuple[int, int]]] = [[] for _ in self._patterns]
+        for family in self._families:
+            self._scan(text, family, spans)
+        for i in self._separate:
+            spans[i] = [m.span() for m in self._compiled[i].finditer(text)]
+
+        results = []
+        i = 0
+        for recognizer in self.recognizers:
+            first, i = i, i + len(recognizer.patterns)
+            if recognizer.supported_entities[0] not in entities:
+                continue
+            recognizer_results = []
+            for pattern, pattern_spans in zip(recognizer.patterns, spans[first:i]):
+                for start, end in pattern_spans:
+                    result = self._build_result(recognizer, pattern, text, start, end)
+                    if result is not None:
+                        recognizer_results.append(result)
+            results.extend(EntityRecognizer.remove_duplicates(recognizer_results))
+        return results
+
+    @staticmethod
+    def _build_result(
+        recognizer: PatternRecognizer,
+        pattern,
+        text: str,
+        start: int,
+        end: int
+    ) -> Optional[RecognizerResult]:
+        """One match as PatternRecognizer reports it (None if dropped)."""
+        current_match = text[start:end]
+        if current_match == "":
+            return None
+
+        validation_result = recognizer.validate_result(current_match)
+        description = PatternRecognizer.build_regex_explanation(
+            recognizer.name,
+            pattern.name,
+            pattern.regex,
+            pattern.score,
+            validation_result,
+            recognizer.global_regex_flags,
+        )
+        result = RecognizerResult(
+            entity_type=recognizer.supported_entities[0],
+            start=start,
+            end=end,
+            score=pattern.score,
+            analysis_explanation=description,
+            recognition_metadata={
+                RecognizerResult.RECOGNIZER_NAME_KEY: recognizer.name,
+                RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: recognizer.id,
+            },
+        )
+
+        if validation_result is not None:
+            result.score = EntityRecognizer.MAX_SCORE if validation_result else EntityRecognizer.MIN_SCORE
+        if recognizer.invalidate_result(current_match):
+            result.score = EntityRecognizer.MIN_SCORE
+        description.score = result.score
+
+        if result.score > EntityRecognizer.MIN_SCORE:
+            return result
+        return None
+
+
+def scan_pattern_recognizers(recognizers: list[EntityRecognizer]) -> list[EntityRecognizer]:
+    """
+    Replace plain PatternRecognizers with scanned ones plus one PatternScanner.
+
+    Args:
+        recognizers: Recognizers to register
+
+    Returns:
+        The same recognizers in order, plain PatternRecognizers swapped for
+        ScannedPatternRecognizers, followed by their PatternScanner
+    """
+    replaced = [
+        ScannedPatternRecognizer.from_recognizer(r) if type(r) is PatternRecognizer else r
+        for r in recognizers
+    ]
+    scanned = [r for r in replaced if isinstance(r, ScannedPatternRecognizer)]
+    if not scanned:
+        return replaced
+    return replaced + [PatternScanner(scanned)]
@@ -0,0 +1,231 @@
+"""
+Per-recognizer latency and hit-rate instrumentation.
+
+With settings.recognizer_metrics_enabled, each recognizer registered with
+the analyzer is wrapped when the analyzer loads, and for every recognizer
+the following are aggregated:
+
+- Calls and time spent in its analyze(), as a latency histogram
+- Matches it returned, as a matches-per-call histogram (the pattern
+  scanner's time covers all scanned recognizers, whose matches are counted
+  under their own names)
+- How many of those matches were kept, or dropped by the per-entity
+  threshold or a deny list (matches removed by the analyzer's own
+  de-duplication are neither)
+
+spaCy parsing happens before any recognizer runs (SpacyRecognizer only
+reads the parsed entities), so its time is recorded separately as "nlp".
+
+    recognizer_metrics.stats()   # served at GET /api/admin/recognizers
+
+Only recognizer names, counts and timings are recorded (no PHI). Results
+served from the sentence cache count as kept without a recognizer call,
+and window worker processes keep their own (unreported) metrics, so
+profile with both disabled (see scripts/profile_recognizers.py).
+"""
+
+import bisect
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from presidio_analyzer import RecognizerResult
+
+from .config import settings
+
+if TYPE_CHECKING:
+    from presidio_analyzer import AnalyzerEngine, EntityRecognizer
+
+T = TypeVar("T")
+
+# Histogram bucket upper bounds (a final bucket counts everything above)
+LATENCY_BUCKETS_MS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0)
+MATCH_BUCKETS = (0, 1, 2, 5, 10, 50)
+
+# Outcomes of a recognizer's match after filtering
+KEPT = "kept"
+DROPPED_THRESHOLD = "dropped_threshold"
+DROPPED_DENY_LIST = "dropped_deny_list"
+
+
+class Histogram:
+    """Counts of observations per fixed bucket."""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+
+    def stats(self) -> dict[str, int]:
+        labels = [f"<={bound:g}" for bound in self.bounds] + [f">{self.bounds[-1]:g}"]
+        return dict(zip(labels, self.counts))
+
+
+class TimingStats:
+    """Calls, total time and latency histogram of one instrumented step."""
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.latency = Histogram(LATENCY_BUCKETS_MS)
+
+    def observe(self, seconds: float) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        self.latency.observe(seconds * 1000)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "seconds_total": round(self.seconds, 6),
+            "ms_mean": round(self.seconds * 1000 / self.calls, 4) if self.calls else None,
+            "latency_ms_histogram": self.latency.stats(),
+        }
+
+
+class RecognizerStats(TimingStats):
+    """Timing plus match outcomes of one recognizer."""
+
+    def __init__(self, entities: list[str]):
+        super().__init__()
+        self.entities = entities
+        self.matches = 0
+        self.match_counts = Histogram(MATCH_BUCKETS)
+        self.outcomes = {KEPT: 0, DROPPED_THRESHOLD: 0, DROPPED_DENY_LIST: 0}
+
+    def stats(self) -> dict[str, Any]:
+        stats = super().stats()
+        stats.update({
+            "entities": self.entities,
+            "matches": self.matches,
+            "matches_per_call_histogram": self.match_counts.stats(),
+            **self.outcomes,
+            "kept_ratio": round(self.outcomes[KEPT] / self.matches, 4) if self.matches else None,
+        })
+        return stats
+
+
+class RecognizerMetrics:
+    """
+    Thread-safe per-recognizer statistics.
+
+    Recognizers are registered when the analyzer is instrumented; outcomes
+    for unknown recognizer names are ignored.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._recognizers: dict[str, RecognizerStats] = {}
+        self._nlp = TimingStats()
+
+    def register(self, name: str, entities: list[str]) -> None:
+        with self._lock:
+            self._recognizers.setdefault(name, RecognizerStats(list(entities)))
+
+    def record_call(self, name: str, seconds: float, results: list[RecognizerResult]) -> None:
+        with self._lock:
+            stats = self._recognizers[name]
+            stats.observe(seconds)
+            stats.match_counts.observe(len(results))
+            for result in results:
+                # Matches count for the recognizer they're attributed to
+                # (the pattern scanner reports its recognizers' matches)
+                owner = (result.recognition_metadata or {}).get(RecognizerResult.RECOGNIZER_NAME_KEY, name)
+                self._recognizers.get(owner, stats).matches += 1
+
+    def record_outcome(self, result: RecognizerResult, outcome: str) -> None:
+        name = (result.recognition_metadata or {}).get(RecognizerResult.RECOGNIZER_NAME_KEY)
+        with self._lock:
+            stats = self._recognizers.get(name)
+            if stats is not None:
+                stats.outcomes[outcome] += 1
+
+    def record_nlp(self, seconds: float) -> None:
+        with self._lock:
+            self._nlp.observe(seconds)
+
+    def reset(self) -> None:
+        """Zero all statistics, keeping the registered recognizers."""
+        with self._lock:
+            self._recognizers = {
+                name: RecognizerStats(stats.entities) for name, stats in self._recognizers.items()
+            }
+            self._nlp = TimingStats()
+
+    def stats(self) -> dict[str, Any]:
+        """Statistics per recognizer, most total time first (no PHI)."""
+        with self._lock:
+            ranked = sorted(self._recognizers.items(), key=lambda item: -item[1].seconds)
+            return {
+                "enabled": settings.recognizer_metrics_enabled,
+                "nlp": self._nlp.stats(),
+                "recognizers": {name: stats.stats() for name, stats in ranked},
+            }
+
+
+# Global metrics instance
+recognizer_metrics = RecognizerMetrics()
+
+
+def _instrument_recognizer(recognizer: "EntityRecognizer") -> None:
+    """Wrap one recognizer's analyze() to record its calls."""
+    analyze = recognizer.analyze
+    name = recognizer.name
+
+    def timed_analyze(*args, **kwargs):
+        start = time.perf_counter()
+        results = analyze(*args, **kwargs)
+        recognizer_metrics.record_call(name, time.perf_counter() - start, results or [])
+        return results
+
+    recognizer_metrics.register(name, recognizer.supported_entities)
+    recognizer.analyze = timed_analyze
+
+
+def instrument_analyzer(analyzer: "AnalyzerEngine") -> None:
+    """
+    Record statistics for every recognizer and spaCy parse of an analyzer.
+
+    Args:
+        analyzer: Analyzer to instrument (in place, once)
+    """
+    for recognizer in analyzer.registry.recognizers:
+        _instrument_recognizer(recognizer)
+
+    nlp_engine = analyzer.nlp_engine
+    process_text = nlp_engine.process_text
+
+    def timed_process_text(*args, **kwargs):
+        start = time.perf_counter()
+        nlp_artifacts = process_text(*args, **kwargs)
+        recognizer_metrics.record_nlp(time.perf_counter() - start)
+        return nlp_artifacts
+
+    nlp_engine.process_text = timed_process_text
+
+
+def timed_docs(docs: Iterable[T]) -> Iterable[T]:
+    """
+    Record the time spent producing each spaCy Doc as nlp time.
+
+    For nlp.pipe() calls made outside the analyzer. Returns docs unchanged
+    when instrumentation is disabled.
+    """
+    if not settings.recognizer_metrics_enabled:
+        return docs
+    return _timed_iter(docs)
+
+
+def _timed_iter(docs: Iterable[T]) -> Iterator[T]:
+    iterator = iter(docs)
+    while True:
+        start = time.perf_counter()
+        try:
+            doc = next(iterator)
+        except StopIteration:
+            return
+        recognizer_metrics.record_nlp(time.perf_counter() - start)
+        yield doc
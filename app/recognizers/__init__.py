@@ -1,6 +1,7 @@
 """Custom Presidio recognizers for pediatric PHI patterns."""
 
+from .guardian import GuardianNameRecognizer
 from .medical import get_medical_recognizers
 from .pediatric import get_pediatric_recognizers
 
-__all__ = ["get_pediatric_recognizers", "get_medical_recognizers"]
+__all__ = ["get_pediatric_recognizers", "get_medical_recognizers", "GuardianNameRecognizer"]
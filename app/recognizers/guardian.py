@@ -0,0 +1,193 @@
+"""
+Guardian name recognizer over the spaCy tokens.
+
+The regex Guardian Name Recognizer (see pediatric.py) needs a fixed-width
+lookbehind per relationship word and per filler combination, so every
+new word means more patterns and every pattern another scan of the text.
+This recognizer runs a spaCy token Matcher for the relationship words
+(and "is") over the Doc the analyzer has already tokenized, then looks
+only at the tokens around each hit:
+
+- Forward: "Mom Jessica", "grandma rosa" (the relationship word's score)
+- Speech artifacts: "mom uh Jessica", "mom mom Jessica" (0.75) - any run
+  of filler or relationship words between the relationship word and name
+- Bidirectional: "Jessica is Mom" (0.80)
+
+Only the name is matched, so relationship words are preserved. Names
+follow the regex patterns: two or more ASCII letters, separated from the
+relationship word (and "is") by exactly one space, case-insensitive.
+
+Differences from the regex patterns: a relationship word must be a whole
+token ("banana bread" no longer flags "bread" after "nana"), relationship
+and filler words are never matched as names ("dad uh", the second "mom"
+of "mom mom"), fillers and repetitions work after every relationship
+word, and bidirectional matching accepts every relationship word.
+"""
+
+from typing import Optional
+
+import regex
+from presidio_analyzer import AnalysisExplanation, EntityRecognizer, RecognizerResult
+from presidio_analyzer.nlp_engine import NlpArtifacts
+from spacy.matcher import Matcher
+from spacy.tokens import Doc
+from spacy.vocab import Vocab
+
+# Relationship word -> score of the name right after it
+RELATIONSHIP_SCORES: dict[str, float] = {
+    "mom": 0.85, "mother": 0.85, "mommy": 0.85,
+    "dad": 0.85, "father": 0.85, "daddy": 0.85,
+    "grandma": 0.85, "grandmother": 0.85, "grandpa": 0.85, "grandfather": 0.85,
+    "nana": 0.85, "papa": 0.85, "granny": 0.85,
+    "aunt": 0.85, "auntie": 0.85, "uncle": 0.85,
+    "stepmom": 0.85, "stepdad": 0.85, "stepmother": 0.85, "stepfather": 0.85,
+    "guardian": 0.80,
+}
+
+# Speech fillers skipped between a relationship word and the name
+FILLER_WORDS = frozenset({"uh", "um"})
+
+# Name separated from its relationship word by fillers or repetitions
+SPEECH_ARTIFACT_SCORE = 0.75
+
+# "Jessica is Mom"
+BIDIRECTIONAL_SCORE = 0.80
+
+# Names as the regex patterns match them: after "mom ", and before " is mom"
+_FORWARD_NAME = regex.compile(r"[a-z][a-z]+\b", regex.IGNORECASE)
+_BIDIRECTIONAL_NAME = regex.compile(r"\b[a-z][a-z]+\Z", regex.IGNORECASE)
+_WORD_CHAR = regex.compile(r"\w")
+
+
+class GuardianNameRecognizer(EntityRecognizer):
+    """
+    Guardian names next to relationship words, matched on spaCy tokens.
+
+    Registered under the same name, entity and context words as the regex
+    recognizer it replaces.
+
+    Args:
+        relationship_scores: Relationship word -> forward match score
+        filler_words: Words skipped between relationship word and name
+    """
+
+    def __init__(
+        self,
+        relationship_scores: Optional[dict[str, float]] = None,
+        filler_words: Optional[frozenset[str]] = None
+    ):
+        self.relationship_scores = relationship_scores or RELATIONSHIP_SCORES
+        self.filler_words = filler_words or FILLER_WORDS
+        self._vocabulary = self.filler_words.union(self.relationship_scores)
+        self._matcher: Optional[Matcher] = None
+        super().__init__(
+            supported_entities=["GUARDIAN_NAME"],
+            name="Guardian Name Recognizer",
+            supported_language="en",
+            context=["parent", "guardian", "family", "caregiver", "at bedside", "reached at", "contact"],
+        )
+
+    def load(self) -> None:
+        pass
+
+    def analyze(
+        self,
+        text: str,
+        entities: list[str],
+        nlp_artifacts: Optional[NlpArtifacts] = None
+    ) -> list[RecognizerResult]:
+        """
+        Match guardian names in the tokenized text.
+
+        Args:
+            text: Text to analyze
+            entities: Requested entities
+            nlp_artifacts: The analyzer's spaCy parse of text
+
+        Returns:
+            One result per name (nothing without nlp_artifacts)
+        """
+        if "GUARDIAN_NAME" not in entities or nlp_artifacts is None or nlp_artifacts.tokens is None:
+            return []
+
+        doc = nlp_artifacts.tokens
+        matcher = self._get_matcher(doc.vocab)
+        is_key = doc.vocab.strings["IS"]
+
+        # Best score per name span
+        names: dict[tuple[int, int], tuple[float, str]] = {}
+        for match_id, i, _ in matcher(doc):
+            if match_id == is_key:
+                match = self._bidirectional_match(text, doc, i)
+            else:
+                match = self._forward_match(text, doc, i)
+            if match is not None:
+                start, end, score, explanation = match
+                if score > names.get((start, end), (0.0, ""))[0]:
+                    names[(start, end)] = (score, explanation)
+
+        return [
+            self._build_result(start, end, score, explanation)
+            for (start, end), (score, explanation) in names.items()
+        ]
+
+    def _get_matcher(self, vocab: Vocab) -> Matcher:
+        """Token matcher for the relationship words and "is" (built once per vocab)."""
+        matcher = self._matcher
+        if matcher is None or matcher.vocab is not vocab:
+            matcher = Matcher(vocab)
+            matcher.add("RELATIONSHIP", [[{"LOWER": {"IN": sorted(self.relationship_scores)}}]])
+            matcher.add("IS", [[{"LOWER": "is"}]])
+            self._matcher = matcher
+        return matcher
+
+    def _forward_match(self, text: str, doc: Doc, i: int) -> Optional[tuple[int, int, float, str]]:
+        """Name after the relationship word at token i ("Mom Jessica", "mom uh Jessica")."""
+        # Skip fillers and repetitions; the last word before the name sets the score
+        j = i
+        while doc[j].whitespace_ == " " and j + 1 < len(doc) and doc[j + 1].lower_ in self._vocabulary:
+            j += 1
+        if doc[j].whitespace_ != " " or j + 1 == len(doc):
+            return None
+
+        match = _FORWARD_NAME.match(text, doc[j + 1].idx)
+        if match is None:
+            return None
+        score = self.relationship_scores.get(doc[j].lower_, SPEECH_ARTIFACT_SCORE)
+        return match.start(), match.end(), score, f"Name after '{doc[i].text}'"
+
+    def _bidirectional_match(self, text: str, doc: Doc, i: int) -> Optional[tuple[int, int, float, str]]:
+        """Name before the "is" at token i and a relationship word ("Jessica is Mom")."""
+        if i == 0 or i + 1 == len(doc):
+            return None
+        name, relationship = doc[i - 1], doc[i + 1]
+        if (
+            name.whitespace_ != " "
+            or doc[i].whitespace_ != " "
+            or name.lower_ in self._vocabulary
+            or relationship.lower_ not in self.relationship_scores
+            or _WORD_CHAR.match(text, relationship.idx + len(relationship))
+        ):
+            return None
+
+        match = _BIDIRECTIONAL_NAME.search(text, name.idx, name.idx + len(name))
+        if match is None:
+            return None
+        return match.start(), match.end(), BIDIRECTIONAL_SCORE, f"Name before 'is {relationship.text}'"
+
+    def _build_result(self, start: int, end: int, score: float, explanation: str) -> RecognizerResult:
+        return RecognizerResult(
+            entity_type="GUARDIAN_NAME",
+            start=start,
+            end=end,
+            score=score,
+            analysis_explanation=AnalysisExplanation(
+                recognizer=self.name,
+                original_score=score,
+                textual_explanation=explanation,
+            ),
+            recognition_metadata={
+                RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+                RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+            },
+        )
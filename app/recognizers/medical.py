@@ -13,10 +13,15 @@ Updated: Phase 04-04 - Added phone number patterns for international/extension f
 from presidio_analyzer import Pattern, PatternRecognizer
 
 
-def get_medical_recognizers() -> list[PatternRecognizer]:
+def get_medical_recognizers(standard_phone_patterns: bool = False) -> list[PatternRecognizer]:
     """
     Create medical-context PHI recognizers.
 
+    Args:
+        standard_phone_patterns: Also match common US formats (555-123-4567,
+            (555) 123-4567), for registries without Presidio's phonenumbers
+            based PhoneRecognizer (the fast de-identification tier)
+
     Returns:
         List of PatternRecognizer instances
     """
@@ -219,6 +224,13 @@ def get_medical_recognizers() -> list[PatternRecognizer]:
             score=0.60
         ),
     ]
+    if standard_phone_patterns:
+        # Dashed or parenthesized area code: 555-123-4567, (555) 123-4567x12
+        phone_patterns.append(Pattern(
+            name="phone_standard_us",
+            regex=r"(?:\(\d{3}\)\s?|\b\d{3}[-\s])\d{3}-\d{4}(?:x\d{1,5})?\b",
+            score=0.75
+        ))
 
     phone_recognizer = PatternRecognizer(
         supported_entity="PHONE_NUMBER",
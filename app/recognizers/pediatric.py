@@ -14,17 +14,24 @@ Pattern Design Notes (Phase 4 improvements):
 """
 
 
-from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer import EntityRecognizer, Pattern, PatternRecognizer
 
+from .guardian import GuardianNameRecognizer
 
-def get_pediatric_recognizers() -> list[PatternRecognizer]:
+
+def get_pediatric_recognizers(guardian_token_matcher: bool = False) -> list[EntityRecognizer]:
     """
     Create pediatric-specific PHI recognizers.
 
     These catch PHI patterns that standard NER models miss in pediatric context.
 
+    Args:
+        guardian_token_matcher: Match guardian names on spaCy tokens
+            (GuardianNameRecognizer) instead of the lookbehind patterns below
+
     Returns:
-        List of PatternRecognizer instances
+        List of recognizer instances (PatternRecognizers, except a token
+        guardian recognizer)
     """
     recognizers = []
 
@@ -236,6 +243,8 @@ def get_pediatric_recognizers() -> list[PatternRecognizer]:
         patterns=guardian_patterns,
         context=["parent", "guardian", "family", "caregiver", "at bedside", "reached at", "contact"]
     )
+    if guardian_token_matcher:
+        guardian_recognizer = GuardianNameRecognizer()
     recognizers.append(guardian_recognizer)
 
     # =========================================================================
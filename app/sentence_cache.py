@@ -0,0 +1,153 @@
+"""
+Sentence-level analyzer result cache.
+
+Handoffs repeat the same PHI-free phrases ("afebrile overnight", "no acute
+events"), and every repetition otherwise goes through spaCy NER and every
+recognizer. With settings.sentence_cache_enabled, documents are analyzed
+sentence by sentence and each sentence's analyzer results are memoized:
+
+- Keys are HMAC-SHA256 digests of the sentence under a per-process random
+  key, combined with a fingerprint of the analysis configuration; no
+  sentence text is retained, and digests can't be checked against guessed
+  text outside the process
+- Values are offsets relative to the sentence, entity types and scores
+- Memory is bounded by an LRU limit on the number of entries
+
+    cache = get_sentence_cache()
+    key = cache.key(sentence, fingerprint)
+    results = cache.get(key)
+"""
+
+import hashlib
+import hmac
+import json
+import secrets
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from .config import settings
+
+# Cached analyzer result: (entity_type, start, end, score, recognition_metadata)
+CachedResult = tuple[str, int, int, float, Optional[dict]]
+
+
+def config_fingerprint(recognizers: list[Any]) -> bytes:
+    """
+    Digest of everything that changes analysis of a sentence.
+
+    Args:
+        recognizers: The analyzer's registered recognizers
+
+    Returns:
+        SHA-256 digest of the model, entities, recognizers, thresholds and
+        deny lists
+    """
+    recognizer_config = sorted(
+        (
+            recognizer.name,
+            sorted(recognizer.supported_entities),
+            [(p.regex, p.score) for p in getattr(recognizer, "patterns", None) or []],
+            sorted(getattr(recognizer, "context", None) or []),
+        )
+        for recognizer in recognizers
+    )
+    config = {
+        "spacy_model": settings.spacy_model,
+        "spacy_exclude": settings.spacy_exclude,
+        "spacy_disable": settings.spacy_disable,
+        "entities": settings.phi_entities,
+        "recognizers": recognizer_config,
+        "threshold": settings.phi_score_threshold,
+        "thresholds": settings.phi_score_thresholds,
+        "deny_lists": [
+            settings.deny_list_location,
+            settings.deny_list_person,
+            settings.deny_list_guardian_name,
+            settings.deny_list_pediatric_age,
+            settings.deny_list_date_time,
+        ],
+    }
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).digest()
+
+
+class SentenceCache:
+    """
+    Bounded LRU map from keyed sentence digests to analyzer results.
+
+    Thread-safe.
+
+    Args:
+        max_entries: Entries kept before the least recently used is evicted
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._secret = secrets.token_bytes(32)
+        self._entries: OrderedDict[bytes, tuple[CachedResult, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, sentence: str, fingerprint: bytes) -> bytes:
+        """Keyed digest of a sentence under a configuration fingerprint."""
+        return hmac.new(self._secret, fingerprint + sentence.encode("utf-8"), hashlib.sha256).digest()
+
+    def get(self, key: bytes) -> Optional[tuple[CachedResult, ...]]:
+        """Cached results for a key (None on a miss)."""
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return results
+
+    def put(self, key: bytes, results: tuple[CachedResult, ...]) -> None:
+        """Store results for a key, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = results
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and occupancy (no PHI)."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": settings.sentence_cache_enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+# Created lazily with the configured size
+_cache: Optional[SentenceCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_sentence_cache() -> SentenceCache:
+    """Get the process-wide sentence cache."""
+    global _cache
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SentenceCache(settings.sentence_cache_max_entries)
+    return _cache
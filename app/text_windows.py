@@ -0,0 +1,257 @@
+"""
+Windowed analysis for long transcripts.
+
+analyzer.analyze() parses a whole transcript as one spaCy Doc, so an
+hour-long unit-wide handoff runs on one core, holds the full parse in
+memory and is capped by spaCy's max_length. Texts longer than
+deidentify_window_chars are instead:
+
+1. Split on sentence boundaries into windows of at most
+   deidentify_window_chars, each overlapping the previous one by about
+   deidentify_window_overlap_chars (whole sentences)
+2. Analyzed window by window, in parallel on a process pool where each
+   worker holds its own analyzer (deidentify_window_workers > 1), or
+   in-process one spaCy batch at a time
+3. Merged: each window owns the results starting in its half of the
+   overlaps with its neighbours, so entities near a seam are taken from
+   the window that saw context on both sides; duplicates are then removed
+   with the analyzer's own de-duplication
+
+Work and peak memory grow with the window size, not the transcript length.
+"""
+
+import logging
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Optional
+
+from presidio_analyzer import EntityRecognizer, RecognizerResult
+
+from .config import settings
+from .recognizer_metrics import timed_docs
+
+if TYPE_CHECKING:
+    from presidio_analyzer import AnalyzerEngine
+
+logger = logging.getLogger(__name__)
+
+# Sentence ends: terminal punctuation before whitespace (not after common
+# title abbreviations, so "Dr. Smith" stays together) or a line break
+_SENTENCE_END = re.compile(
+    r"(?<!\bDr)(?<!\bMr)(?<!\bMs)(?<!\bMrs)(?<!\bSt)[.!?]+(?=\s)|\n"
+)
+
+# Analyzer result without text: (entity_type, start, end, score, recognition_metadata)
+ResultTuple = tuple[str, int, int, float, Optional[dict]]
+
+
+def sentence_spans(text: str) -> list[tuple[int, int]]:
+    """(start, end) of each sentence in text, with surrounding whitespace trimmed."""
+    spans = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        spans.append((start, match.end()))
+        start = match.end()
+    spans.append((start, len(text)))
+
+    trimmed = []
+    for start, end in spans:
+        sentence = text[start:end]
+        stripped = sentence.strip()
+        if stripped:
+            start += len(sentence) - len(sentence.lstrip())
+            trimmed.append((start, start + len(stripped)))
+    return trimmed
+
+
+def plan_windows(text: str, window_chars: int, overlap_chars: int) -> list[tuple[int, int]]:
+    """
+    Split text into overlapping, sentence-aligned windows.
+
+    Consecutive windows share the trailing sentences of the first one (at
+    least one sentence, about overlap_chars). Sentences longer than a
+    window are split at spaces into pieces of about overlap_chars so they
+    can still overlap.
+
+    Args:
+        text: Text to split
+        window_chars: Maximum window length
+        overlap_chars: Target overlap between consecutive windows
+
+    Returns:
+        (start, end) of each window, in text order
+    """
+    overlap_chars = min(overlap_chars, window_chars // 2)
+    piece_chars = overlap_chars or window_chars
+
+    units: list[tuple[int, int]] = []
+    for start, end in sentence_spans(text):
+        split = end - start > window_chars
+        while split and end - start > piece_chars:
+            cut = text.rfind(" ", start + 1, start + piece_chars)
+            if cut == -1:
+                cut = start + piece_chars
+            units.append((start, cut))
+            start = cut
+        units.append((start, end))
+    if not units:
+        return []
+
+    windows = []
+    i = 0
+    while True:
+        start = units[i][0]
+        j = i
+        while j + 1 < len(units) and units[j + 1][1] - start <= window_chars:
+            j += 1
+        end = units[j][1]
+        windows.append((start, end))
+        if j + 1 == len(units):
+            return windows
+
+        # Next window starts at the earliest sentence within the overlap
+        # (always at least the last one, always moving forward)
+        k = j
+        while k - 1 > i and end - units[k - 1][0] <= overlap_chars:
+            k -= 1
+        if overlap_chars == 0 or k == i:
+            k = j + 1
+        i = k
+
+
+def merge_window_results(
+    windows: list[tuple[int, int]],
+    window_results: list[list[ResultTuple]]
+) -> list[RecognizerResult]:
+    """
+    Combine per-window results into results for the whole text.
+
+    Args:
+        windows: (start, end) of each window
+        window_results: Results per window, offsets relative to the window
+
+    Returns:
+        De-duplicated results in text offsets, in analyzer order
+    """
+    merged = []
+    for i, ((start, end), results) in enumerate(zip(windows, window_results)):
+        # Seams: middle of the overlap with each neighbour
+        own_from = 0 if i == 0 else (start + windows[i - 1][1]) // 2
+        own_to = None if i + 1 == len(windows) else (windows[i + 1][0] + end) // 2
+        for entity_type, result_start, result_end, score, metadata in results:
+            text_start = start + result_start
+            if text_start < own_from or (own_to is not None and text_start >= own_to):
+                continue
+            merged.append(RecognizerResult(
+                entity_type=entity_type,
+                start=text_start,
+                end=start + result_end,
+                score=score,
+                recognition_metadata=metadata,
+            ))
+    return EntityRecognizer.remove_duplicates(merged)
+
+
+def should_window(text: str) -> bool:
+    """Whether text is long enough for windowed analysis."""
+    return 0 < settings.deidentify_window_chars < len(text)
+
+
+# =============================================================================
+# Worker functions (run in pool processes)
+# =============================================================================
+
+_worker_analyzer: Optional["AnalyzerEngine"] = None
+
+
+def _init_worker() -> None:
+    """Load this worker's own analyzer (runs once per pool process)."""
+    global _worker_analyzer
+    from .deidentification import _get_analyzer
+
+    _worker_analyzer = _get_analyzer()
+
+
+def _analyze_window(text: str) -> list[ResultTuple]:
+    """Analyze one window in a worker process."""
+    from .deidentification import _analyze
+
+    return [
+        (r.entity_type, r.start, r.end, r.score, r.recognition_metadata)
+        for r in _analyze(_worker_analyzer, text)
+    ]
+
+
+# =============================================================================
+# Pool
+# =============================================================================
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Lazy-create the worker pool. Thread-safe."""
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # spawn: workers load their own spaCy model rather than
+                # inheriting a parent mid-request
+                _pool = ProcessPoolExecutor(
+                    max_workers=settings.deidentify_window_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+                logger.info(
+                    f"Started windowed analysis pool: workers={settings.deidentify_window_workers}"
+                )
+    return _pool
+
+
+def shutdown_window_pool() -> None:
+    """Stop the worker processes (application shutdown)."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def analyze_windowed(analyzer: "AnalyzerEngine", text: str) -> list[RecognizerResult]:
+    """
+    Analyze a long text as overlapping windows.
+
+    Args:
+        analyzer: Analyzer for in-process analysis (workers use their own)
+        text: Text to analyze
+
+    Returns:
+        All candidates (no thresholds applied), in text offsets
+    """
+    from .deidentification import _analyze
+
+    windows = plan_windows(text, settings.deidentify_window_chars, settings.deidentify_window_overlap_chars)
+    window_texts = [text[start:end] for start, end in windows]
+
+    if settings.deidentify_window_workers > 1 and len(windows) > 1:
+        logger.info(f"Analyzing {len(text)} chars as {len(windows)} parallel windows")
+        window_results = list(_get_pool().map(_analyze_window, window_texts))
+    else:
+        logger.info(f"Analyzing {len(text)} chars as {len(windows)} windows")
+        nlp_engine = analyzer.nlp_engine
+        # One window parsed at a time keeps peak memory at a window's parse
+        docs = timed_docs(nlp_engine.nlp["en"].pipe(window_texts, batch_size=1))
+        window_results = [
+            [
+                (r.entity_type, r.start, r.end, r.score, r.recognition_metadata)
+                for r in _analyze(analyzer, window_text, nlp_engine._doc_to_nlp_artifact(doc, "en"))
+            ]
+            for window_text, doc in zip(window_texts, docs)
+        ]
+
+    return merge_window_results(windows, window_results)
@@ -4,23 +4,60 @@ Transcription module using faster-whisper.
 All transcription happens locally - no cloud APIs.
 """
 
+import copy
+import io
 import logging
 import os
 import re
+import shutil
 import tempfile
-import threading
+import time
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Callable, Optional, Union
 
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import WhisperModel, decode_audio
 
+from .batching import ScheduledBatchPipeline, get_batch_scheduler
+from .chunking import should_chunk, transcribe_chunked
 from .config import settings
+from .model_pool import ModelPool
 
 logger = logging.getLogger(__name__)
 
-# Thread-safe model loading
-_model: Optional[WhisperModel] = None
-_model_lock = threading.Lock()
+# Whisper models expect 16kHz mono audio
+WHISPER_SAMPLE_RATE = 16000
+
+def _load_whisper_model(index: int) -> WhisperModel:
+    """Build one pool instance with its share of the CPU thread budget."""
+    return WhisperModel(
+        settings.whisper_model,
+        device=settings.whisper_device,
+        compute_type=settings.whisper_compute_type,
+        cpu_threads=whisper_cpu_threads(),
+        num_workers=settings.whisper_num_workers
+    )
+
+
+def whisper_cpu_threads() -> int:
+    """
+    CPU threads per pooled Whisper instance.
+
+    Explicit WHISPER_CPU_THREADS wins. Otherwise a single instance keeps
+    CTranslate2's default (0) and multiple instances split the cores evenly.
+    """
+    if settings.whisper_cpu_threads > 0:
+        return settings.whisper_cpu_threads
+    if settings.whisper_pool_size <= 1:
+        return 0
+    return max(1, (os.cpu_count() or 1) // settings.whisper_pool_size)
+
+
+# Pool of Whisper instances, checked out per transcription (lazy-loaded)
+whisper_pool: ModelPool[WhisperModel] = ModelPool(
+    _load_whisper_model, size=settings.whisper_pool_size, name="Whisper model"
+)
 
 
 class TranscriptionError(Exception):
@@ -28,33 +65,35 @@ class TranscriptionError(Exception):
     pass
 
 
-def get_model() -> WhisperModel:
+class DecodeProfileError(ValueError):
+    """Raised when a request names a decode profile that is not configured."""
+    pass
+
+
+def resolve_decode_profile(profile: Optional[str] = None) -> tuple[str, dict[str, Any]]:
     """
-    Lazy-load and cache the Whisper model. Thread-safe.
+    Look up a decode profile's transcribe() arguments.
+
+    Args:
+        profile: Profile name, or None for settings.default_decode_profile
 
     Returns:
-        WhisperModel: The loaded Whisper model
-    """
-    global _model
-
-    if _model is None:
-        with _model_lock:
-            # Double-check after acquiring lock
-            if _model is None:
-                logger.info(f"Loading Whisper model: {settings.whisper_model}")
-                _model = WhisperModel(
-                    settings.whisper_model,
-                    device=settings.whisper_device,
-                    compute_type=settings.whisper_compute_type
-                )
-                logger.info("Whisper model loaded successfully")
+        Tuple of (profile_name, transcribe_kwargs); the kwargs are a deep
+        copy, safe for the caller to modify
 
-    return _model
+    Raises:
+        DecodeProfileError: If the profile is not defined in settings.decode_profiles
+    """
+    name = profile or settings.default_decode_profile
+    if name not in settings.decode_profiles:
+        available = ", ".join(sorted(settings.decode_profiles))
+        raise DecodeProfileError(f"Unknown decode profile '{name}'. Available: {available}")
+    return name, copy.deepcopy(settings.decode_profiles[name])
 
 
 def is_model_loaded() -> bool:
-    """Check if the Whisper model is loaded."""
-    return _model is not None
+    """Check if at least one Whisper model instance is loaded."""
+    return whisper_pool.loaded > 0
 
 
 # Common Whisper hallucination artifacts to remove
@@ -66,25 +105,43 @@ HALLUCINATION_PATTERNS = [
     r"Like and subscribe[.!]?",
     r"Don't forget to subscribe[.!]?",
     r"See you in the next video[.!]?",
+]
+
+# Only hallucinations at the end of the whole transcript
+TRAILING_HALLUCINATION_PATTERNS = [
     r"Bye[.!]?$",
+]
+
+# Only hallucinations when they are the whole transcript
+WHOLE_HALLUCINATION_PATTERNS = [
     r"^\s*you\s*$",  # Standalone "you" (common hallucination)
     r"^\s*\.\s*$",   # Standalone period
 ]
 
 
-def _clean_transcript(text: str) -> str:
+def _clean_transcript(text: str, at_start: bool = True, at_end: bool = True) -> str:
     """
     Remove common Whisper hallucination artifacts.
 
+    Applied segment by segment, the anchored patterns must only see the
+    ends of the whole transcript: "say bye." mid-recording is speech.
+
     Args:
-        text: Raw transcription text
+        text: Raw transcription text, or one segment of it
+        at_start: No non-empty text precedes this in the transcript
+        at_end: This is the end of the transcript
 
     Returns:
         Cleaned text with hallucinations removed
     """
-    cleaned = text
+    patterns = list(HALLUCINATION_PATTERNS)
+    if at_end:
+        patterns += TRAILING_HALLUCINATION_PATTERNS
+        if at_start:
+            patterns += WHOLE_HALLUCINATION_PATTERNS
 
-    for pattern in HALLUCINATION_PATTERNS:
+    cleaned = text
+    for pattern in patterns:
         cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
 
     # Clean up extra whitespace
@@ -93,29 +150,26 @@ def _clean_transcript(text: str) -> str:
     return cleaned
 
 
-def transcribe_audio(
-    audio_bytes: bytes,
-    file_extension: str = ".webm"
-) -> tuple[str, dict[str, Any]]:
-    """
-    Transcribe audio bytes to text using local Whisper.
+def _decode_in_memory(audio: Union[bytes, BinaryIO], sampling_rate: int) -> np.ndarray:
+    """Decode audio straight from the upload buffer with PyAV (no disk I/O)."""
+    source = io.BytesIO(audio) if isinstance(audio, (bytes, bytearray)) else audio
+    return decode_audio(source, sampling_rate=sampling_rate)
 
-    Args:
-        audio_bytes: Raw audio file content
-        file_extension: Hint for audio format (e.g., ".webm", ".wav", ".mp3")
 
-    Returns:
-        Tuple of (transcript_text, metadata_dict)
-        metadata includes: duration, language, language_probability, segments_count
+def _decode_via_temp_file(
+    audio: Union[bytes, BinaryIO],
+    file_extension: str,
+    sampling_rate: int
+) -> np.ndarray:
+    """
+    Decode audio by writing it to a temp file first.
 
-    Raises:
-        TranscriptionError: If transcription fails
+    Fallback for containers the decoder cannot read from a buffer. The temp
+    file holds PHI, so it is always deleted before returning.
     """
-    # Ensure temp directory exists
     temp_dir = Path(settings.temp_dir)
     temp_dir.mkdir(parents=True, exist_ok=True)
 
-    # Write audio to temp file (faster-whisper requires file path)
     temp_file = None
     try:
         temp_file = tempfile.NamedTemporaryFile(
@@ -123,41 +177,157 @@ def transcribe_audio(
             dir=temp_dir,
             delete=False
         )
-        temp_file.write(audio_bytes)
+        if isinstance(audio, (bytes, bytearray)):
+            temp_file.write(audio)
+        else:
+            shutil.copyfileobj(audio, temp_file)
         temp_file.close()
 
-        logger.info(f"Transcribing audio file: {temp_file.name}")
+        return decode_audio(temp_file.name, sampling_rate=sampling_rate)
 
-        model = get_model()
+    finally:
+        # Always clean up temp file
+        if temp_file and os.path.exists(temp_file.name):
+            try:
+                os.unlink(temp_file.name)
+            except Exception as e:
+                logger.warning(f"Failed to delete temp file: {e}")
 
-        # Transcribe with VAD filtering
-        segments, info = model.transcribe(
-            temp_file.name,
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters={
-                "min_silence_duration_ms": 500,
-                "threshold": 0.5,
-            }
-        )
 
-        # Collect segments
-        segment_list = []
-        text_parts = []
+def load_audio(
+    audio: Union[bytes, BinaryIO],
+    file_extension: str = ".webm",
+    sampling_rate: int = WHISPER_SAMPLE_RATE
+) -> tuple[np.ndarray, str]:
+    """
+    Decode uploaded audio to mono float32 PCM for Whisper.
+
+    Decodes in-process from the upload buffer when enabled
+    (settings.audio_decode_in_memory), falling back to a temp file only if
+    the in-memory decode fails.
 
-        for segment in segments:
-            segment_list.append({
-                "start": segment.start,
-                "end": segment.end,
-                "text": segment.text.strip()
-            })
-            text_parts.append(segment.text.strip())
+    Args:
+        audio: Raw audio file content, as bytes or a seekable binary file object
+        file_extension: Hint for audio format, used for the temp file fallback
+        sampling_rate: Target sample rate in Hz
+
+    Returns:
+        Tuple of (pcm_samples, decode_path) where decode_path is "memory" or "temp_file"
+    """
+    if settings.audio_decode_in_memory:
+        try:
+            return _decode_in_memory(audio, sampling_rate), "memory"
+        except Exception as e:
+            if not isinstance(audio, (bytes, bytearray)):
+                if not audio.seekable():
+                    raise
+                audio.seek(0)
+            logger.warning(
+                f"In-memory decode failed for {file_extension} ({type(e).__name__}); "
+                "falling back to temp file"
+            )
+
+    return _decode_via_temp_file(audio, file_extension, sampling_rate), "temp_file"
+
+
+def transcribe_audio(
+    audio: Union[bytes, BinaryIO],
+    file_extension: str = ".webm",
+    on_segment: Optional[Callable[[dict[str, Any], float], None]] = None,
+    profile: Optional[str] = None
+) -> tuple[str, dict[str, Any]]:
+    """
+    Transcribe audio to text using local Whisper.
+
+    Args:
+        audio: Raw audio file content, as bytes or a seekable binary file
+            object (e.g., the spooled upload). Decoded in memory; a temp
+            file is only written if in-memory decoding fails.
+        file_extension: Hint for audio format (e.g., ".webm", ".wav", ".mp3")
+        on_segment: Optional callback, called with each decoded segment dict
+            (start, end, cleaned text) and the total audio duration, once
+            the following segment has decoded (the last at the end). The
+            final transcript is the non-empty segment texts joined by spaces.
+        profile: Decode profile name (see settings.decode_profiles); None
+            uses settings.default_decode_profile
+
+    Returns:
+        Tuple of (transcript_text, metadata_dict)
+        metadata includes: duration, language, language_probability, segments_count,
+        decode_path ("memory" or "temp_file"), profile, real_time_factor
+        (transcription wall time / audio duration), and chunks when a long
+        recording was transcribed as parallel chunks
+
+    Raises:
+        DecodeProfileError: If the profile is not configured
+        TranscriptionError: If transcription fails
+    """
+    started = time.perf_counter()
+    try:
+        # Decoding settings for the requested profile
+        profile_name, transcribe_kwargs = resolve_decode_profile(profile)
+
+        # Decode to 16kHz mono PCM (in memory when possible)
+        sampling_rate = WHISPER_SAMPLE_RATE
+        pcm, decode_path = load_audio(audio, file_extension, sampling_rate=sampling_rate)
+
+        logger.info(
+            f"Transcribing audio: {len(pcm) / sampling_rate:.1f}s decoded via {decode_path} "
+            f"(profile: {profile_name})"
+        )
+
+        with ExitStack() as stack:
+            chunks = None
+            if should_chunk(pcm, sampling_rate):
+                # Long recording: split at silences and transcribe chunks in parallel
+                segments, info = transcribe_chunked(pcm, sampling_rate, transcribe_kwargs)
+                chunks = info.chunks
+            elif settings.whisper_batching:
+                # Forward passes are batched with other in-flight requests on
+                # the scheduler's model (no per-request checkout)
+                scheduler = get_batch_scheduler(whisper_pool)
+                pipeline = ScheduledBatchPipeline(scheduler.model, scheduler)
+                segments, info = pipeline.transcribe(
+                    pcm, batch_size=settings.whisper_batch_size, **transcribe_kwargs
+                )
+            else:
+                model = stack.enter_context(whisper_pool.checkout())
+                segments, info = model.transcribe(pcm, **transcribe_kwargs)
+
+            # Collect segments (the model stays checked out while they decode)
+            segment_list = []
+            text_parts = []
+            seen_text = False
+
+            def emit(segment, at_end: bool) -> None:
+                # Clean hallucinations per segment so streamed consumers see
+                # exactly the text that ends up in the final transcript
+                nonlocal seen_text
+                segment_entry = {
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": _clean_transcript(segment.text.strip(), not seen_text, at_end)
+                }
+                seen_text = seen_text or bool(segment_entry["text"])
+                segment_list.append(segment_entry)
+
+                if on_segment is not None:
+                    on_segment(segment_entry, info.duration)
+
+            # Each segment is emitted once the next one arrives, so the last
+            # is known to end the transcript
+            pending = None
+            for segment in segments:
+                text_parts.append(segment.text.strip())
+                if pending is not None:
+                    emit(pending, at_end=False)
+                pending = segment
+            if pending is not None:
+                emit(pending, at_end=True)
 
         # Combine text
         raw_text = " ".join(text_parts)
-
-        # Clean hallucinations
-        clean_text = _clean_transcript(raw_text)
+        clean_text = " ".join(s["text"] for s in segment_list if s["text"])
 
         metadata = {
             "duration": info.duration,
@@ -166,7 +336,14 @@ def transcribe_audio(
             "segments_count": len(segment_list),
             "raw_length": len(raw_text),
             "clean_length": len(clean_text),
+            "decode_path": decode_path,
+            "profile": profile_name,
+            "real_time_factor": (
+                round((time.perf_counter() - started) / info.duration, 4) if info.duration else None
+            ),
         }
+        if chunks is not None:
+            metadata["chunks"] = chunks
 
         logger.info(
             f"Transcription complete: {metadata['duration']:.1f}s audio, "
@@ -176,52 +353,9 @@ def transcribe_audio(
 
         return clean_text, metadata
 
+    except DecodeProfileError:
+        raise
+
     except Exception as e:
         logger.error(f"Transcription failed: {str(e)}")
         raise TranscriptionError(f"Failed to transcribe audio: {str(e)}") from e
-
-    finally:
-        # Always clean up temp file
-        if temp_file and os.path.exists(temp_file.name):
-            try:
-                os.unlink(temp_file.name)
-            except Exception as e:
-                logger.warning(f"Failed to delete temp file: {e}")
-
-
-def estimate_transcription_time(file_size_bytes: int) -> dict[str, float]:
-    """
-    Estimate transcription time based on file size.
-
-    Args:
-        file_size_bytes: Size of the audio file in bytes
-
-    Returns:
-        Dict with estimated_seconds and breakdown
-    """
-    # Rough estimates based on medium.en model on CPU
-    # ~1MB of compressed audio ≈ 1 minute ≈ 15-30 seconds to transcribe
-
-    size_mb = file_size_bytes / (1024 * 1024)
-
-    # Estimate audio duration (compressed audio ~1MB per minute)
-    estimated_audio_duration = size_mb * 60  # seconds
-
-    # Transcription speed depends on model
-    model_speeds = {
-        "tiny.en": 0.05,    # ~20x realtime
-        "base.en": 0.1,     # ~10x realtime
-        "small.en": 0.3,    # ~3x realtime
-        "medium.en": 0.5,   # ~2x realtime
-        "large-v3": 1.0,    # ~1x realtime
-    }
-
-    speed_factor = model_speeds.get(settings.whisper_model, 0.5)
-    estimated_transcription = estimated_audio_duration * speed_factor
-
-    return {
-        "estimated_seconds": estimated_transcription,
-        "estimated_audio_duration": estimated_audio_duration,
-        "model": settings.whisper_model,
-        "speed_factor": speed_factor,
-    }
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Anonymizer benchmark: span-splice anonymizer vs Presidio AnonymizerEngine.
+
+Synthetic handoffs are concatenated into long transcripts and analyzed once;
+both anonymizers then replace the same filtered detections. Outputs must be
+identical; only anonymization time is measured.
+
+Usage:
+    python scripts/benchmark_anonymizer.py
+    python scripts/benchmark_anonymizer.py --join 1 20 100 --repeat 5
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from presidio_analyzer import RecognizerResult
+from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.entities import OperatorConfig
+
+from app.anonymizer import anonymize, type_marker
+from app.config import settings
+from app.deidentification import _analyze, _filter_results, _get_analyzer
+
+DATASET = Path(__file__).parent.parent / "tests" / "synthetic_handoffs.json"
+
+
+def load_transcripts(limit: int, join: int) -> List[str]:
+    texts = [h["text"] for h in json.loads(DATASET.read_text())["handoffs"][:limit]]
+    return [" ".join(texts[i:i + join]) for i in range(0, len(texts), join)]
+
+
+def presidio_operators() -> dict:
+    """The type_marker operators the app passed to AnonymizerEngine."""
+    return {
+        entity_type: OperatorConfig("replace", {"new_value": type_marker(entity_type)})
+        for entity_type in settings.phi_entities
+    }
+
+
+def time_presidio(engine: AnonymizerEngine, cases, repeat: int) -> Tuple[float, List[str]]:
+    operators = presidio_operators()
+    outputs = []
+    elapsed = 0.0
+    for _ in range(repeat):
+        outputs = []
+        for text, results in cases:
+            # AnonymizerEngine mutates its input; copying is not timed
+            copies = [RecognizerResult(r.entity_type, r.start, r.end, r.score) for r in results]
+            start = time.perf_counter()
+            outputs.append(engine.anonymize(text=text, analyzer_results=copies, operators=operators).text)
+            elapsed += time.perf_counter() - start
+    return elapsed / repeat, outputs
+
+
+def time_splice(cases, repeat: int) -> Tuple[float, List[str]]:
+    outputs = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        outputs = [anonymize(text, results).text for text, results in cases]
+    return (time.perf_counter() - start) / repeat, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark anonymization")
+    parser.add_argument("--limit", type=int, default=500, help="Handoffs to use")
+    parser.add_argument("--join", type=int, nargs="+", default=[1, 20, 100], help="Handoffs per transcript")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions")
+    args = parser.parse_args()
+
+    analyzer = _get_analyzer()
+    engine = AnonymizerEngine()
+
+    print(f"{'Join':>5} {'Texts':>6} {'Chars':>8} {'Entities':>9} {'Presidio ms':>12} {'Splice ms':>10} {'Speedup':>8}")
+    print("-" * 64)
+    for join in args.join:
+        cases = []
+        for text in load_transcripts(args.limit, join):
+            cases.append((text, _filter_results(text, _analyze(analyzer, text))))
+
+        presidio_seconds, presidio_outputs = time_presidio(engine, cases, args.repeat)
+        splice_seconds, splice_outputs = time_splice(cases, args.repeat)
+        assert presidio_outputs == splice_outputs, "Anonymizers disagree"
+
+        chars = sum(len(text) for text, _ in cases) // len(cases)
+        entities = sum(len(results) for _, results in cases) // len(cases)
+        print(
+            f"{join:>5} {len(cases):>6} {chars:>8} {entities:>9} "
+            f"{presidio_seconds * 1000:>12.1f} {splice_seconds * 1000:>10.1f} "
+            f"{presidio_seconds / splice_seconds:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
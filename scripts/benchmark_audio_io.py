@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Audio decode I/O benchmark.
+
+Compares the in-memory decode path (PyAV reading straight from the upload
+buffer) against the temp-file fallback (write upload to TEMP_DIR, decode from
+the path, unlink). Reports wall time per decode and bytes moved through the
+filesystem, taken from /proc/self/io on Linux.
+
+Uses synthetic audio, so no Whisper model or real recordings are needed.
+
+Usage:
+    python scripts/benchmark_audio_io.py
+    python scripts/benchmark_audio_io.py --seconds 600 --repeats 5
+    python scripts/benchmark_audio_io.py --format wav
+"""
+
+import argparse
+import io
+import statistics
+import sys
+import time
+import wave
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.transcription import (
+    WHISPER_SAMPLE_RATE,
+    _decode_in_memory,
+    _decode_via_temp_file,
+)
+
+
+def synthesize_wav(seconds: float, sample_rate: int = 44100) -> bytes:
+    """Generate a mono 16-bit WAV of a swept tone with light noise."""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    signal = 0.3 * np.sin(2 * np.pi * (220 + 40 * np.sin(t)) * t)
+    signal += 0.01 * np.random.default_rng(0).standard_normal(len(t))
+    pcm = (signal * 32767).astype(np.int16)
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def encode_webm(wav_bytes: bytes) -> bytes:
+    """Re-encode WAV to Opus/WebM (what browsers record) using PyAV."""
+    import av
+
+    output = io.BytesIO()
+    with av.open(io.BytesIO(wav_bytes)) as source, av.open(output, "w", format="webm") as sink:
+        stream = sink.add_stream("libopus", rate=48000)
+        for frame in source.decode(audio=0):
+            frame.pts = None
+            for packet in stream.encode(frame):
+                sink.mux(packet)
+        for packet in stream.encode(None):
+            sink.mux(packet)
+    return output.getvalue()
+
+
+def read_proc_io() -> Optional[Dict[str, int]]:
+    """Read this process's I/O counters (Linux only)."""
+    try:
+        with open("/proc/self/io") as f:
+            return {key: int(value) for key, value in (line.split(": ") for line in f)}
+    except OSError:
+        return None
+
+
+def measure(label: str, decode, repeats: int) -> Dict[str, float]:
+    """Time `decode` over several runs and record filesystem bytes moved."""
+    decode()  # Warm up codecs and page cache
+
+    io_before = read_proc_io()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        samples = decode()
+        timings.append(time.perf_counter() - start)
+    io_after = read_proc_io()
+
+    result = {
+        "label": label,
+        "median_ms": statistics.median(timings) * 1000,
+        "min_ms": min(timings) * 1000,
+        "samples": len(samples),
+    }
+    if io_before and io_after:
+        # wchar/rchar count bytes passed through write()/read() syscalls
+        result["written_kb"] = (io_after["wchar"] - io_before["wchar"]) / repeats / 1024
+        result["read_kb"] = (io_after["rchar"] - io_before["rchar"]) / repeats / 1024
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark in-memory vs temp-file audio decode")
+    parser.add_argument("--seconds", type=float, default=120.0, help="Synthetic audio length")
+    parser.add_argument("--repeats", type=int, default=10, help="Timed runs per path")
+    parser.add_argument(
+        "--format", choices=["webm", "wav"], default="webm",
+        help="Container to benchmark (webm matches browser recordings)"
+    )
+    args = parser.parse_args()
+
+    audio = synthesize_wav(args.seconds)
+    if args.format == "webm":
+        audio = encode_webm(audio)
+    extension = f".{args.format}"
+
+    print(f"Audio: {args.seconds:.0f}s {args.format}, {len(audio) / 1024:.1f} KB upload")
+    print(f"Repeats: {args.repeats}\n")
+
+    results = [
+        measure(
+            "memory",
+            lambda: _decode_in_memory(audio, WHISPER_SAMPLE_RATE),
+            args.repeats,
+        ),
+        measure(
+            "temp_file",
+            lambda: _decode_via_temp_file(audio, extension, WHISPER_SAMPLE_RATE),
+            args.repeats,
+        ),
+    ]
+
+    print(f"{'Path':<10} {'Median ms':>10} {'Min ms':>10} {'FS write KB':>12} {'FS read KB':>12}")
+    print("-" * 58)
+    for r in results:
+        written = f"{r['written_kb']:.1f}" if "written_kb" in r else "n/a"
+        read = f"{r['read_kb']:.1f}" if "read_kb" in r else "n/a"
+        print(f"{r['label']:<10} {r['median_ms']:>10.1f} {r['min_ms']:>10.1f} {written:>12} {read:>12}")
+
+    memory, temp_file = results
+    assert memory["samples"] == temp_file["samples"], "Decode paths produced different lengths"
+    speedup = temp_file["median_ms"] / memory["median_ms"] if memory["median_ms"] else float("inf")
+    print(f"\nIn-memory decode: {speedup:.2f}x relative to temp file, identical sample count")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Whisper batching throughput benchmark.
+
+Transcribes the same recordings with N concurrent requests, first with
+per-request `model.transcribe()` and then with the cross-request batch
+scheduler, and reports throughput in audio-seconds per wall-second.
+
+Requires the configured Whisper model (see scripts/preload_models.py) and
+real speech recordings (synthetic tones are removed by VAD).
+
+Usage:
+    python scripts/benchmark_batching.py handoff1.webm handoff2.webm
+    python scripts/benchmark_batching.py handoff.wav --concurrency 1 2 4 8
+    python scripts/benchmark_batching.py handoff.wav --batch-size 16 --max-wait-ms 100
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import batching
+from app.config import settings
+from app.transcription import transcribe_audio, whisper_pool
+
+
+def run_round(recordings: List[Path], concurrency: int) -> Dict[str, float]:
+    """Transcribe `concurrency` requests at once (cycling through recordings)."""
+    jobs = [recordings[i % len(recordings)] for i in range(concurrency)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(
+            lambda path: transcribe_audio(path.read_bytes(), path.suffix), jobs
+        ))
+    elapsed = time.perf_counter() - start
+
+    audio_seconds = sum(metadata["duration"] for _, metadata in results)
+    return {
+        "wall_seconds": elapsed,
+        "audio_seconds": audio_seconds,
+        "throughput": audio_seconds / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cross-request Whisper batching")
+    parser.add_argument("recordings", nargs="+", type=Path, help="Audio files to transcribe")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--batch-size", type=int, default=settings.whisper_batch_size)
+    parser.add_argument("--max-wait-ms", type=int, default=settings.whisper_batch_max_wait_ms)
+    args = parser.parse_args()
+
+    settings.whisper_batch_size = args.batch_size
+    settings.whisper_batch_max_wait_ms = args.max_wait_ms
+
+    print(f"Loading Whisper model: {settings.whisper_model} ({settings.whisper_compute_type})")
+    whisper_pool.preload()
+
+    print(f"\n{'Mode':<12} {'Requests':>8} {'Wall s':>8} {'Audio s':>8} {'Audio s/s':>10} {'Mean batch':>11}")
+    print("-" * 62)
+    for batched in (False, True):
+        settings.whisper_batching = batched
+        for concurrency in args.concurrency:
+            batching.shutdown_batch_scheduler()  # Fresh stats per round
+            r = run_round(args.recordings, concurrency)
+            stats = batching.batching_stats()
+            mean_batch = f"{stats['mean_batch_size']:.1f}" if stats else "-"
+            print(
+                f"{'batched' if batched else 'sequential':<12} {concurrency:>8} "
+                f"{r['wall_seconds']:>8.1f} {r['audio_seconds']:>8.1f} "
+                f"{r['throughput']:>10.2f} {mean_batch:>11}"
+            )
+
+    batching.shutdown_batch_scheduler()
+
+
+if __name__ == "__main__":
+    main()
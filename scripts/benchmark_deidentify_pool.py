@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+De-identification worker pool benchmark: throughput and shared memory.
+
+De-identifies synthetic handoffs in-process (one core, as the thread
+executor runs them) and on forked worker pools of increasing size, all
+texts submitted at once. Reports chars/sec, and the memory of the parent
+plus workers: RSS counts shared model pages in every process, PSS splits
+them between the processes sharing them, so total PSS is the real
+footprint to compare against N x a single process.
+
+Throughput can only scale up to the number of cores available.
+
+Usage:
+    python scripts/benchmark_deidentify_pool.py
+    python scripts/benchmark_deidentify_pool.py --workers 2 4 8 --limit 1000 --join 5
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.deidentification import deidentify_text
+from app.deidentify_pool import DeidentificationPool
+
+DATASET = Path(__file__).parent.parent / "tests" / "synthetic_handoffs.json"
+
+
+def memory_mb(pid: int) -> Dict[str, float]:
+    """RSS, PSS and private memory of a process from /proc (MB)."""
+    fields = {"Rss:": 0, "Pss:": 0, "Private_Clean:": 0, "Private_Dirty:": 0}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key = line.split()[0]
+            if key in fields:
+                fields[key] = int(line.split()[1])
+    return {
+        "rss": fields["Rss:"] / 1024,
+        "pss": fields["Pss:"] / 1024,
+        "private": (fields["Private_Clean:"] + fields["Private_Dirty:"]) / 1024,
+    }
+
+
+def load_texts(limit: int, join: int) -> List[str]:
+    texts = [h["text"] for h in json.loads(DATASET.read_text())["handoffs"][:limit]]
+    return [" ".join(texts[i:i + join]) for i in range(0, len(texts), join)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the forked de-identification pool")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4], help="Pool sizes")
+    parser.add_argument("--limit", type=int, default=500, help="Handoffs to use")
+    parser.add_argument("--join", type=int, default=1, help="Handoffs per text")
+    args = parser.parse_args()
+
+    texts = load_texts(args.limit, args.join)
+    chars = sum(len(t) for t in texts)
+    print(f"{len(texts)} texts, {chars} chars, {os.cpu_count()} CPUs\n")
+
+    deidentify_text(texts[0])  # Load models outside the timing
+    start = time.perf_counter()
+    expected = [deidentify_text(text).clean_text for text in texts]
+    single_seconds = time.perf_counter() - start
+    single = memory_mb(os.getpid())
+
+    print(f"{'Workers':>7} {'chars/s':>9} {'Scaling':>8} {'Total RSS MB':>13} {'Total PSS MB':>13} "
+          f"{'N x single MB':>14} {'Private/worker MB':>18}")
+    print("-" * 89)
+    print(f"{'in-proc':>7} {chars / single_seconds:>9.0f} {1.0:>7.2f}x {single['rss']:>13.0f} "
+          f"{single['pss']:>13.0f} {single['rss']:>14.0f} {'-':>18}")
+
+    for workers in args.workers:
+        pool = DeidentificationPool(workers=workers, short_chars=0)
+        pool.start()
+        try:
+            pool.deidentify(texts[0])
+            start = time.perf_counter()
+            futures = [pool.submit(text) for text in texts]
+            results = [future.result().clean_text for future in futures]
+            seconds = time.perf_counter() - start
+            assert results == expected, "Pool results differ from in-process de-identification"
+
+            worker_memory = [memory_mb(w["pid"]) for w in pool.stats()["workers"]]
+            parent = memory_mb(os.getpid())
+            total_rss = parent["rss"] + sum(m["rss"] for m in worker_memory)
+            total_pss = parent["pss"] + sum(m["pss"] for m in worker_memory)
+            private = sum(m["private"] for m in worker_memory) / len(worker_memory)
+            print(
+                f"{workers:>7} {chars / seconds:>9.0f} {single_seconds / seconds:>7.2f}x {total_rss:>13.0f} "
+                f"{total_pss:>13.0f} {(workers + 1) * single['rss']:>14.0f} {private:>18.1f}"
+            )
+        finally:
+            pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Deny-list filter microbenchmark.
+
+Compares the original per-entity filter (rebuilding lowercase lists and
+scanning every substring term for each detection) against the compiled
+DenyListIndex (hash sets + Aho-Corasick). Deny lists are scaled up from the
+configured ones with synthetic terms so growth can be measured; both
+filters must reach the same decision for every detection.
+
+No Presidio models are needed: detections are synthetic (entity type, text)
+pairs drawn from deny-listed terms and PHI-like values.
+
+Usage:
+    python scripts/benchmark_deny_list.py
+    python scripts/benchmark_deny_list.py --scale 1 10 50 --detections 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.deny_list import DenyListIndex
+
+LIST_FIELDS = {
+    "LOCATION": "deny_list_location",
+    "PERSON": "deny_list_person",
+    "GUARDIAN_NAME": "deny_list_guardian_name",
+    "PEDIATRIC_AGE": "deny_list_pediatric_age",
+    "DATE_TIME": "deny_list_date_time",
+}
+
+PHI_LIKE = {
+    "LOCATION": ["Boston Children's", "Springfield", "4 West tower"],
+    "PERSON": ["Jessica Smith", "Dr. Patel", "Aiden"],
+    "GUARDIAN_NAME": ["Maria", "John Rodriguez"],
+    "PEDIATRIC_AGE": ["3 years 2 months", "14 month old"],
+    "DATE_TIME": ["March 3rd", "01/15/2024", "last Tuesday at 4pm"],
+}
+
+
+def scaled_lists(scale: int) -> Dict[str, List[str]]:
+    """Configured deny lists plus synthetic terms up to `scale` times their size."""
+    lists = {}
+    for entity_type, field_name in LIST_FIELDS.items():
+        terms = list(getattr(settings, field_name))
+        lists[entity_type] = terms + [
+            f"{term} variant{i}" for i in range(1, scale) for term in terms
+        ]
+    return lists
+
+
+def legacy_filter(lists: Dict[str, List[str]]) -> Callable[[str, str], bool]:
+    """The original per-entity filter from deidentify_text."""
+    def is_denied(entity_type: str, text: str) -> bool:
+        detected_text = text.strip()
+        if entity_type == "LOCATION":
+            detected_lower = detected_text.lower()
+            if any(term.lower() in detected_lower for term in lists["LOCATION"]):
+                return True
+        if entity_type == "PERSON" and detected_text.lower() in [w.lower() for w in lists["PERSON"]]:
+            return True
+        if entity_type == "GUARDIAN_NAME" and detected_text.lower() in [w.lower() for w in lists["GUARDIAN_NAME"]]:
+            return True
+        if entity_type == "PEDIATRIC_AGE" and detected_text.lower() in [w.lower() for w in lists["PEDIATRIC_AGE"]]:
+            return True
+        if entity_type == "DATE_TIME":
+            detected_lower = detected_text.lower()
+            if any(term.lower() in detected_lower for term in lists["DATE_TIME"]):
+                return True
+        return False
+
+    return is_denied
+
+
+def sample_detections(lists: Dict[str, List[str]], count: int) -> List[Tuple[str, str]]:
+    """Half deny-listed terms, half PHI-like values."""
+    rng = random.Random(0)
+    detections = []
+    for i in range(count):
+        entity_type = rng.choice(list(LIST_FIELDS))
+        if i % 2:
+            detections.append((entity_type, rng.choice(lists[entity_type])))
+        else:
+            detections.append((entity_type, rng.choice(PHI_LIKE[entity_type])))
+    return detections
+
+
+def time_filter(is_denied: Callable[[str, str], bool], detections: List[Tuple[str, str]]) -> Tuple[float, List[bool]]:
+    start = time.perf_counter()
+    decisions = [is_denied(entity_type, text) for entity_type, text in detections]
+    return time.perf_counter() - start, decisions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark deny-list filtering")
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10], help="List size multipliers")
+    parser.add_argument("--detections", type=int, default=10000, help="Detections filtered per run")
+    args = parser.parse_args()
+
+    print(f"{'Scale':>6} {'Terms':>7} {'Legacy us':>10} {'Index us':>10} {'Compile ms':>11} {'Speedup':>8}")
+    print("-" * 58)
+    for scale in args.scale:
+        lists = scaled_lists(scale)
+        detections = sample_detections(lists, args.detections)
+
+        compile_start = time.perf_counter()
+        index = DenyListIndex(
+            exact={k: lists[k] for k in ("PERSON", "GUARDIAN_NAME", "PEDIATRIC_AGE")},
+            substring={k: lists[k] for k in ("LOCATION", "DATE_TIME")},
+        )
+        compile_ms = (time.perf_counter() - compile_start) * 1000
+
+        legacy_seconds, legacy_decisions = time_filter(legacy_filter(lists), detections)
+        index_seconds, index_decisions = time_filter(index.is_denied, detections)
+        assert legacy_decisions == index_decisions, "Filters disagree"
+
+        per_legacy = legacy_seconds / len(detections) * 1e6
+        per_index = index_seconds / len(detections) * 1e6
+        print(
+            f"{scale:>5}x {sum(map(len, lists.values())):>7} {per_legacy:>10.2f} "
+            f"{per_index:>10.2f} {compile_ms:>11.1f} {per_legacy / per_index:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Fast mode benchmark: recall and latency of the two de-identification tiers.
+
+Evaluates deidentify_text(mode="full") and deidentify_text(mode="fast")
+against the labeled handoff datasets with the PresidioEvaluator from
+tests/evaluate_presidio.py (same overlap matching and type mapping), and
+prints recall per entity type side by side with per-call latency. This is
+the recall contract callers of ?mode=fast choose against; rerun it after
+changing recognizers or thresholds and publish the table with --output.
+
+Usage:
+    python scripts/benchmark_fast_mode.py
+    python scripts/benchmark_fast_mode.py --input tests/adversarial_handoffs.json --output fast_mode.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.deidentification import DEIDENTIFY_MODES, deidentify_text
+from tests.evaluate_presidio import PresidioEvaluator
+from tests.generate_test_data import load_dataset
+
+DATASET = Path(__file__).parent.parent / "tests" / "synthetic_handoffs.json"
+
+
+class ModeEvaluator(PresidioEvaluator):
+    """PresidioEvaluator over deidentify_text in one mode, timing each call."""
+
+    def __init__(self, mode: str):
+        super().__init__()
+        self.mode = mode
+        self.latencies_ms: list[float] = []
+
+    def analyze_text(self, text: str) -> list[dict]:
+        start = time.perf_counter()
+        result = deidentify_text(text, mode=self.mode)
+        self.latencies_ms.append((time.perf_counter() - start) * 1000)
+        return [
+            {
+                "entity_type": e.entity_type,
+                "start": e.start,
+                "end": e.end,
+                "score": e.score,
+                "text": text[e.start:e.end],
+            }
+            for e in result.entities_found
+        ]
+
+
+def recall(stats: dict[str, int]) -> float:
+    expected = stats["tp"] + stats["fn"]
+    return stats["tp"] / expected if expected else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare recall and latency of full and fast de-identification")
+    parser.add_argument("--input", type=Path, default=DATASET, help="Labeled handoff dataset")
+    parser.add_argument("--limit", type=int, default=500, help="Handoffs evaluated")
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    dataset = load_dataset(args.input)[:args.limit]
+    for mode in DEIDENTIFY_MODES:
+        deidentify_text("Warm up: Mom Jessica, 555-123-4567", mode=mode)
+
+    report = {"dataset": args.input.name, "handoffs": len(dataset), "modes": {}}
+    for mode in DEIDENTIFY_MODES:
+        evaluator = ModeEvaluator(mode)
+        metrics, _ = evaluator.evaluate_dataset(dataset)
+        latencies = sorted(evaluator.latencies_ms)
+        report["modes"][mode] = {
+            "recall": metrics.recall,
+            "precision": metrics.precision,
+            "latency_ms_p50": statistics.median(latencies),
+            "latency_ms_p95": latencies[int(len(latencies) * 0.95)],
+            "recall_by_entity": {
+                entity_type: recall(stats)
+                for entity_type, stats in sorted(metrics.entity_stats.items())
+                if stats["tp"] + stats["fn"]
+            },
+        }
+
+    full, fast = report["modes"]["full"], report["modes"]["fast"]
+    print(f"{report['handoffs']} handoffs from {report['dataset']}\n")
+    print(f"{'Entity':<24} {'Full recall':>12} {'Fast recall':>12}")
+    print("-" * 50)
+    for entity_type in sorted(set(full["recall_by_entity"]) | set(fast["recall_by_entity"])):
+        print(
+            f"{entity_type:<24} {full['recall_by_entity'].get(entity_type, 0.0):>12.1%} "
+            f"{fast['recall_by_entity'].get(entity_type, 0.0):>12.1%}"
+        )
+    print("-" * 50)
+    for label, key, fmt in [
+        ("Overall recall", "recall", "{:>12.1%}"),
+        ("Precision", "precision", "{:>12.1%}"),
+        ("Latency p50 (ms)", "latency_ms_p50", "{:>12.2f}"),
+        ("Latency p95 (ms)", "latency_ms_p95", "{:>12.2f}"),
+    ]:
+        print(f"{label:<24} {fmt.format(full[key])} {fmt.format(fast[key])}")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
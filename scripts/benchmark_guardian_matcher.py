@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Guardian matcher benchmark: token matcher vs lookbehind regexes.
+
+Runs the Guardian Name Recognizer over synthetic handoffs (single and
+concatenated into longer transcripts) as the regex PatternRecognizer, the
+same patterns through the PatternScanner, and the token-based
+GuardianNameRecognizer. The spaCy Docs are parsed once up front, as the
+analyzer has them before any recognizer runs, so only matching is timed.
+Spans that differ between the regex and token matchers are counted and
+the first few printed.
+
+Usage:
+    python scripts/benchmark_guardian_matcher.py
+    python scripts/benchmark_guardian_matcher.py --join 1 20 100 --repeat 5 --show 20
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.deidentification import _get_analyzer
+from app.pattern_scanner import scan_pattern_recognizers
+from app.recognizers import GuardianNameRecognizer, get_pediatric_recognizers
+
+DATASETS = [
+    Path(__file__).parent.parent / "tests" / "synthetic_handoffs.json",
+    Path(__file__).parent.parent / "tests" / "adversarial_handoffs.json",
+]
+ENTITIES = ["GUARDIAN_NAME"]
+
+
+def load_transcripts(limit: int, join: int) -> List[str]:
+    texts = [h["text"] for path in DATASETS for h in json.loads(path.read_text())["handoffs"]][:limit]
+    return [" ".join(texts[i:i + join]) for i in range(0, len(texts), join)]
+
+
+def time_recognizers(recognizers, texts, artifacts, repeat: int) -> Tuple[float, List[List[Tuple]]]:
+    outputs = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        outputs = [
+            sorted(
+                (r.start, r.end, r.score)
+                for recognizer in recognizers
+                for r in recognizer.analyze(text, ENTITIES, nlp_artifacts)
+            )
+            for text, nlp_artifacts in zip(texts, artifacts)
+        ]
+    return (time.perf_counter() - start) / repeat, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark token vs regex guardian name matching")
+    parser.add_argument("--limit", type=int, default=1000, help="Handoffs to use")
+    parser.add_argument("--join", type=int, nargs="+", default=[1, 20, 100], help="Handoffs per transcript")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions")
+    parser.add_argument("--show", type=int, default=10, help="Differing spans printed")
+    args = parser.parse_args()
+
+    nlp_engine = _get_analyzer().nlp_engine
+    regex_recognizer = next(
+        r for r in get_pediatric_recognizers() if r.name == "Guardian Name Recognizer"
+    )
+    scanned = scan_pattern_recognizers([regex_recognizer])
+    token_recognizer = GuardianNameRecognizer()
+    print(f"{len(regex_recognizer.patterns)} guardian patterns vs "
+          f"{len(token_recognizer.relationship_scores)} relationship words\n")
+
+    differences = []
+    print(f"{'Join':>5} {'Texts':>6} {'Chars':>8} {'Regex ms':>9} {'Scanner ms':>11} {'Tokens ms':>10} "
+          f"{'vs regex':>9} {'vs scanner':>11}")
+    print("-" * 76)
+    for join in args.join:
+        texts = load_transcripts(args.limit, join)
+        docs = nlp_engine.nlp["en"].pipe(texts)
+        artifacts = [nlp_engine._doc_to_nlp_artifact(doc, "en") for doc in docs]
+
+        regex_seconds, regex_outputs = time_recognizers([regex_recognizer], texts, artifacts, args.repeat)
+        scanner_seconds, _ = time_recognizers(scanned, texts, artifacts, args.repeat)
+        token_seconds, token_outputs = time_recognizers([token_recognizer], texts, artifacts, args.repeat)
+
+        if join == args.join[0]:
+            for text, expected, actual in zip(texts, regex_outputs, token_outputs):
+                for start, end, score in sorted(set(expected) ^ set(actual)):
+                    side = "regex" if (start, end, score) in expected else "token"
+                    context = text[max(0, start - 20):end + 5].replace("\n", " ")
+                    differences.append(f"  {side:<5} {score:.2f} {text[start:end]!r:<16} ...{context}...")
+
+        print(
+            f"{join:>5} {len(texts):>6} {sum(len(t) for t in texts) // len(texts):>8} "
+            f"{regex_seconds * 1000:>9.1f} {scanner_seconds * 1000:>11.1f} {token_seconds * 1000:>10.1f} "
+            f"{regex_seconds / token_seconds:>8.1f}x {scanner_seconds / token_seconds:>10.1f}x"
+        )
+
+    print(f"\n{len(differences)} spans found by only one matcher")
+    for line in differences[:args.show]:
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
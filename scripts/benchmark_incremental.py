@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Incremental de-identification benchmark for growing live transcripts.
+
+Feeds a long transcript (synthetic handoffs joined) in small chunks, as a
+live transcript grows, to an IncrementalDeidentifier and to
+deidentify_text() on the whole transcript so far. Reports the mean time
+per update at increasing transcript lengths; the final texts must match.
+
+Usage:
+    python scripts/benchmark_incremental.py
+    python scripts/benchmark_incremental.py --handoffs 200 --chunk 40
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.deidentification import IncrementalDeidentifier, deidentify_text
+
+DATASET = Path(__file__).parent.parent / "tests" / "synthetic_handoffs.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental de-identification")
+    parser.add_argument("--handoffs", type=int, default=100, help="Handoffs joined into the transcript")
+    parser.add_argument("--chunk", type=int, default=50, help="Characters appended per update")
+    parser.add_argument("--buckets", type=int, default=5, help="Transcript length ranges reported")
+    args = parser.parse_args()
+
+    # Measure analysis, not caching or windowing
+    settings.sentence_cache_enabled = False
+    settings.deidentify_window_chars = 0
+
+    texts = [h["text"] for h in json.loads(DATASET.read_text())["handoffs"][:args.handoffs]]
+    transcript = " ".join(texts)
+    ends = list(range(args.chunk, len(transcript), args.chunk)) + [len(transcript)]
+    deidentify_text(texts[0])  # Load models outside the timing
+
+    session = IncrementalDeidentifier()
+    incremental_ms = []
+    for end in ends:
+        start = time.perf_counter()
+        session.update(transcript[:end])
+        incremental_ms.append((time.perf_counter() - start) * 1000)
+    result = session.finish()
+
+    full_ms = []
+    for end in ends:
+        start = time.perf_counter()
+        expected = deidentify_text(transcript[:end])
+        full_ms.append((time.perf_counter() - start) * 1000)
+
+    print(f"{len(transcript)} chars in {len(ends)} updates of {args.chunk} chars\n")
+    print(f"{'Transcript chars':>18} {'Full ms/update':>15} {'Incremental ms/update':>22}")
+    print("-" * 57)
+    size = -(-len(ends) // args.buckets)
+    for i in range(0, len(ends), size):
+        full = full_ms[i:i + size]
+        incremental = incremental_ms[i:i + size]
+        print(f"{ends[i]:>8}-{ends[min(i + size, len(ends)) - 1]:<9} {sum(full) / len(full):>15.2f} "
+              f"{sum(incremental) / len(incremental):>22.2f}")
+    print(f"\nTotal: full {sum(full_ms) / 1000:.2f}s, incremental {sum(incremental_ms) / 1000:.2f}s; "
+          f"final text {'matches' if result.clean_text == expected.clean_text else 'DIFFERS'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Long-transcript analysis benchmark: whole text vs overlapping windows.
+
+Synthetic handoffs are concatenated into transcripts of increasing length
+and de-identified with windowing disabled and enabled. Reports time per
+1,000 characters (flat = linear scaling) and whether the clean texts agree.
+
+Usage:
+    python scripts/benchmark_long_transcripts.py
+    python scripts/benchmark_long_transcripts.py --join 50 200 500 --workers 4
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.deidentification import deidentify_text
+from app.text_windows import shutdown_window_pool
+
+DATASET = Path(__file__).parent.parent / "tests" / "synthetic_handoffs.json"
+
+
+def timed(text: str, window_chars: int):
+    settings.deidentify_window_chars = window_chars
+    start = time.perf_counter()
+    result = deidentify_text(text)
+    return time.perf_counter() - start, result.clean_text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark windowed analysis of long transcripts")
+    parser.add_argument("--join", type=int, nargs="+", default=[20, 100, 300], help="Handoffs per transcript")
+    parser.add_argument("--window", type=int, default=5000, help="Window chars")
+    parser.add_argument("--workers", type=int, default=0, help="Window worker processes")
+    args = parser.parse_args()
+
+    settings.deidentify_window_workers = args.workers
+    handoffs = [h["text"] for h in json.loads(DATASET.read_text())["handoffs"]]
+    timed(" ".join(handoffs[:20]), args.window)  # Load engines (and workers) outside the timings
+
+    print(f"{'Join':>5} {'Chars':>8} {'Whole ms/kc':>12} {'Window ms/kc':>13} {'Same':>5}")
+    print("-" * 48)
+    for join in args.join:
+        text = " ".join(handoffs[:join])
+        whole_seconds, whole_text = timed(text, 0)
+        window_seconds, window_text = timed(text, args.window)
+        kilochars = len(text) / 1000
+        print(
+            f"{join:>5} {len(text):>8} {whole_seconds * 1000 / kilochars:>12.1f} "
+            f"{window_seconds * 1000 / kilochars:>13.1f} {str(whole_text == window_text):>5}"
+        )
+
+    shutdown_window_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Name propagation benchmark: recall and cost of redacting repeated names.
+
+Runs deidentify_text over synthetic handoffs (single and concatenated into
+longer transcripts) with name propagation off and on, and reports name
+recall (labeled PERSON/GUARDIAN_NAME spans overlapped by a detected
+entity), detected entity counts and latency. The propagation pass itself
+is also timed on its own, from the kept results of the "off" run.
+
+Usage:
+    python scripts/benchmark_name_propagation.py
+    python scripts/benchmark_name_propagation.py --join 1 10 50 --limit 500
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from presidio_analyzer import RecognizerResult
+
+from app.config import settings
+from app.deidentification import deidentify_text
+from app.name_propagation import PROPAGATED_ENTITIES, propagate_names
+
+DATASET = Path(__file__).parent.parent / "tests" / "synthetic_handoffs.json"
+
+
+def load_transcripts(limit: int, join: int) -> List[Tuple[str, List[Tuple[int, int]]]]:
+    """Joined transcripts with their labeled name spans (offsets into the joined text)."""
+    handoffs = json.loads(DATASET.read_text())["handoffs"][:limit]
+    transcripts = []
+    for i in range(0, len(handoffs), join):
+        parts, spans, offset = [], [], 0
+        for handoff in handoffs[i:i + join]:
+            parts.append(handoff["text"])
+            spans += [
+                (offset + span["start"], offset + span["end"])
+                for span in handoff["phi_spans"]
+                if span["entity_type"] in PROPAGATED_ENTITIES
+            ]
+            offset += len(handoff["text"]) + 1
+        transcripts.append((" ".join(parts), spans))
+    return transcripts
+
+
+def run(transcripts, enabled: bool):
+    settings.name_propagation_enabled = enabled
+    found = entities = 0
+    kept = []
+    start = time.perf_counter()
+    for text, spans in transcripts:
+        result = deidentify_text(text)
+        entities += result.entity_count
+        found += sum(
+            any(e.start < span_end and span_start < e.end for e in result.entities_found)
+            for span_start, span_end in spans
+        )
+        kept.append([
+            RecognizerResult(e.entity_type, e.start, e.end, e.score) for e in result.entities_found
+        ])
+    return time.perf_counter() - start, found, entities, kept
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark document-level name propagation")
+    parser.add_argument("--limit", type=int, default=500, help="Handoffs to use")
+    parser.add_argument("--join", type=int, nargs="+", default=[1, 10, 50], help="Handoffs per transcript")
+    args = parser.parse_args()
+
+    deidentify_text("warm up Mom Jessica")
+    print(f"{'Join':>5} {'Texts':>6} {'Names':>6} {'Recall off':>11} {'Recall on':>10} "
+          f"{'Entities +':>11} {'Off ms':>8} {'On ms':>8} {'Pass ms':>8}")
+    print("-" * 82)
+    for join in args.join:
+        transcripts = load_transcripts(args.limit, join)
+        names = sum(len(spans) for _, spans in transcripts)
+
+        off_seconds, off_found, off_entities, kept = run(transcripts, enabled=False)
+        on_seconds, on_found, on_entities, _ = run(transcripts, enabled=True)
+
+        start = time.perf_counter()
+        for (text, _), results in zip(transcripts, kept):
+            propagate_names(text, results)
+        pass_seconds = time.perf_counter() - start
+
+        count = len(transcripts)
+        print(
+            f"{join:>5} {count:>6} {names:>6} {off_found / max(names, 1):>10.1%} "
+            f"{on_found / max(names, 1):>9.1%} {on_entities - off_entities:>11} "
+            f"{off_seconds * 1000 / count:>8.1f} {on_seconds * 1000 / count:>8.1f} "
+            f"{pass_seconds * 1000 / count:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Pattern scanner benchmark: combined scans vs one finditer per pattern.
+
+Runs the custom medical and pediatric recognizers over synthetic handoffs
+(single and concatenated into longer transcripts) both as plain
+PatternRecognizers and through the PatternScanner. Results must be
+identical; only pattern matching is timed (no spaCy).
+
+Usage:
+    python scripts/benchmark_pattern_scanner.py
+    python scripts/benchmark_pattern_scanner.py --join 1 20 100 --repeat 5
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.pattern_scanner import scan_pattern_recognizers
+from app.recognizers import get_medical_recognizers, get_pediatric_recognizers
+
+DATASET = Path(__file__).parent.parent / "tests" / "synthetic_handoffs.json"
+
+
+def load_transcripts(limit: int, join: int) -> List[str]:
+    texts = [h["text"] for h in json.loads(DATASET.read_text())["handoffs"][:limit]]
+    return [" ".join(texts[i:i + join]) for i in range(0, len(texts), join)]
+
+
+def summarize(results) -> List[Tuple]:
+    return sorted(
+        (r.recognition_metadata["recognizer_name"], r.entity_type, r.start, r.end, r.score) for r in results
+    )
+
+
+def time_recognizers(recognizers, texts: List[str], repeat: int) -> Tuple[float, List[List[Tuple]]]:
+    entities = settings.phi_entities
+    outputs = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        outputs = [
+            summarize([r for recognizer in recognizers for r in recognizer.analyze(text, entities)])
+            for text in texts
+        ]
+    return (time.perf_counter() - start) / repeat, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark combined pattern scanning")
+    parser.add_argument("--limit", type=int, default=500, help="Handoffs to use")
+    parser.add_argument("--join", type=int, nargs="+", default=[1, 20, 100], help="Handoffs per transcript")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions")
+    args = parser.parse_args()
+
+    per_pattern = get_medical_recognizers() + get_pediatric_recognizers()
+    # As registered: scanned stand-ins (matching nothing) plus the scanner
+    scanned = scan_pattern_recognizers(get_medical_recognizers() + get_pediatric_recognizers())
+    patterns = sum(len(r.patterns) for r in per_pattern)
+
+    print(f"{patterns} patterns in {len(per_pattern)} recognizers\n")
+    print(f"{'Join':>5} {'Texts':>6} {'Chars':>8} {'Per-pattern ms':>15} {'Scanner ms':>11} {'Speedup':>8}")
+    print("-" * 59)
+    for join in args.join:
+        texts = load_transcripts(args.limit, join)
+        per_pattern_seconds, per_pattern_outputs = time_recognizers(per_pattern, texts, args.repeat)
+        scanner_seconds, scanner_outputs = time_recognizers(scanned, texts, args.repeat)
+        assert per_pattern_outputs == scanner_outputs, "Scanner disagrees with per-pattern matching"
+
+        print(
+            f"{join:>5} {len(texts):>6} {sum(len(t) for t in texts) // len(texts):>8} "
+            f"{per_pattern_seconds * 1000:>15.1f} {scanner_seconds * 1000:>11.1f} "
+            f"{per_pattern_seconds / scanner_seconds:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
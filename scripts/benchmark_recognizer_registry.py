@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Recognizer registry benchmark: full predefined registry vs configured entities.
+
+Builds the analyzer registry both ways on the same loaded spaCy pipeline
+and reports registry construction time, recognizer count and per-call
+analyze latency on the synthetic handoffs, checking that both registries
+produce identical results.
+
+Usage:
+    python scripts/benchmark_recognizer_registry.py
+    python scripts/benchmark_recognizer_registry.py --limit 50 --repeat 5
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
+
+from app.config import settings
+from app.deidentification import _build_registry, _get_analyzer
+from app.recognizers import get_medical_recognizers, get_pediatric_recognizers
+from tests.generate_test_data import load_dataset
+
+DATASET = Path(__file__).parent.parent / "tests" / "synthetic_handoffs.json"
+
+
+def full_registry(nlp_engine) -> RecognizerRegistry:
+    """The registry as built before: every predefined recognizer plus custom ones."""
+    registry = RecognizerRegistry()
+    registry.load_predefined_recognizers(nlp_engine=nlp_engine)
+    for recognizer in get_medical_recognizers() + get_pediatric_recognizers():
+        registry.add_recognizer(recognizer)
+    return registry
+
+
+def time_build(build, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        registry = build()
+        timings.append(time.perf_counter() - start)
+    return registry, statistics.median(timings)
+
+
+def analyze_all(analyzer: AnalyzerEngine, texts):
+    """Per-call latencies (ms) and results for each text."""
+    latencies, outputs = [], []
+    for text in texts:
+        start = time.perf_counter()
+        results = analyzer.analyze(text=text, language="en", entities=settings.phi_entities)
+        latencies.append((time.perf_counter() - start) * 1000)
+        outputs.append(sorted((r.entity_type, r.start, r.end, r.score) for r in results))
+    return latencies, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full vs configured recognizer registries")
+    parser.add_argument("--limit", type=int, default=200, help="Handoffs analyzed")
+    parser.add_argument("--repeat", type=int, default=10, help="Registry builds timed")
+    args = parser.parse_args()
+
+    nlp_engine = _get_analyzer().nlp_engine
+    texts = [h.text for h in load_dataset(DATASET)[:args.limit]]
+
+    rows = []
+    outputs = {}
+    for name, build in [
+        ("full", lambda: full_registry(nlp_engine)),
+        ("configured", lambda: _build_registry(nlp_engine, settings.phi_entities)),
+    ]:
+        registry, build_seconds = time_build(build, args.repeat)
+        analyzer = AnalyzerEngine(nlp_engine=nlp_engine, registry=registry)
+        analyze_all(analyzer, texts[:5])  # Warm up
+        latencies, outputs[name] = analyze_all(analyzer, texts)
+        rows.append((name, len(registry.recognizers), build_seconds, latencies))
+
+    print(f"{'Registry':<11} {'Recognizers':>11} {'Build ms':>9} {'p50 ms':>7} {'p95 ms':>7} {'Total s':>8}")
+    print("-" * 58)
+    for name, count, build_seconds, latencies in rows:
+        p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+        print(
+            f"{name:<11} {count:>11} {build_seconds * 1000:>9.1f} {statistics.median(latencies):>7.2f} "
+            f"{p95:>7.2f} {sum(latencies) / 1000:>8.2f}"
+        )
+    print(f"\nIdentical results: {outputs['full'] == outputs['configured']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+spaCy NER backend / pipeline trimming matrix.
+
+For every installed model (or --models) and trimming preset, a fresh
+process loads the Presidio analyzer and reports:
+
+- Cold-load time of the analyzer (spaCy model + recognizers)
+- Resident memory after loading and analyzing
+- De-identification throughput (chars/sec) on the synthetic handoffs
+- Overall and per-entity recall from tests/evaluate_presidio.py
+
+Each option runs in its own process so load time and RSS aren't skewed by
+models loaded earlier.
+
+Usage:
+    python scripts/benchmark_spacy_pipelines.py
+    python scripts/benchmark_spacy_pipelines.py --models sm lg --presets full trimmed --limit 100
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+DATASET = Path(__file__).parent.parent / "tests" / "synthetic_handoffs.json"
+
+# Trimming presets: (exclude, disable)
+PRESETS = {
+    "full": ([], []),
+    "trimmed": (["parser", "senter"], []),
+    # NER only: no lemmas, so Presidio's context words match surface forms only
+    "ner-only": (["parser", "senter", "tagger", "attribute_ruler", "lemmatizer"], []),
+}
+
+
+def rss_mb() -> float:
+    """Current resident set size (Linux), falling back to peak RSS."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(model: str, preset: str, limit: int) -> Dict[str, Any]:
+    """Load one configuration and measure it (runs in a child process)."""
+    from app.config import settings
+
+    settings.spacy_model = model
+    settings.spacy_exclude, settings.spacy_disable = PRESETS[preset]
+
+    from app.deidentification import _get_analyzer, deidentify_text
+    from tests.evaluate_presidio import PresidioEvaluator
+    from tests.generate_test_data import load_dataset
+
+    rss_before = rss_mb()
+    start = time.perf_counter()
+    analyzer = _get_analyzer()
+    load_seconds = time.perf_counter() - start
+
+    dataset = load_dataset(DATASET)[:limit]
+    start = time.perf_counter()
+    for handoff in dataset:
+        deidentify_text(handoff.text)
+    chars_per_second = sum(len(h.text) for h in dataset) / (time.perf_counter() - start)
+
+    metrics, _ = PresidioEvaluator().evaluate_dataset(dataset)
+    entity_recall = {
+        entity_type: stats["tp"] / (stats["tp"] + stats["fn"])
+        for entity_type, stats in metrics.entity_stats.items()
+        if stats["tp"] + stats["fn"]
+    }
+
+    return {
+        "model": model,
+        "preset": preset,
+        "components": analyzer.nlp_engine.nlp["en"].pipe_names,
+        "load_seconds": load_seconds,
+        "rss_mb": rss_mb() - rss_before,
+        "chars_per_second": chars_per_second,
+        "recall": metrics.recall,
+        "entity_recall": entity_recall,
+    }
+
+
+def run_child(model: str, preset: str, limit: int) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, __file__, "--child", model, preset, "--limit", str(limit)],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        return {"model": model, "preset": preset, "error": completed.stderr.strip().splitlines()[-1:]}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def print_matrix(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'Model':<18} {'Preset':<9} {'Load s':>7} {'RSS MB':>7} {'Chars/s':>9} {'Recall':>7}")
+    print("-" * 62)
+    for row in rows:
+        if "error" in row:
+            print(f"{row['model']:<18} {row['preset']:<9} failed: {' '.join(row['error'])}")
+            continue
+        print(
+            f"{row['model']:<18} {row['preset']:<9} {row['load_seconds']:>7.1f} {row['rss_mb']:>7.0f} "
+            f"{row['chars_per_second']:>9.0f} {row['recall']:>7.1%}"
+        )
+
+    entity_types = sorted({t for row in rows for t in row.get("entity_recall", {})})
+    if not entity_types:
+        return
+    print("\nPer-entity recall")
+    print(f"{'Model / preset':<28}" + "".join(f"{t[:12]:>13}" for t in entity_types))
+    for row in rows:
+        if "error" in row:
+            continue
+        cells = "".join(
+            f"{row['entity_recall'][t]:>13.1%}" if t in row["entity_recall"] else f"{'-':>13}"
+            for t in entity_types
+        )
+        print(f"{row['model'] + ' / ' + row['preset']:<28}{cells}")
+
+
+def main():
+    import spacy
+
+    parser = argparse.ArgumentParser(description="Compare spaCy NER backends and pipeline trimming")
+    parser.add_argument("--models", nargs="+", default=None, help="Models or aliases (default: all installed)")
+    parser.add_argument("--presets", nargs="+", default=list(PRESETS), choices=list(PRESETS))
+    parser.add_argument("--limit", type=int, default=200, help="Handoffs evaluated per option")
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON")
+    parser.add_argument("--child", nargs=2, metavar=("MODEL", "PRESET"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child[0], args.child[1], args.limit)))
+        return
+
+    models = args.models or spacy.util.get_installed_models()
+    rows = [run_child(model, preset, args.limit) for model in models for preset in args.presets]
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_matrix(rows)
+
+
+if __name__ == "__main__":
+    main()
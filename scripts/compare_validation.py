@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Incremental vs full-rescan validation comparison.
+
+De-identifies every handoff in the synthetic and adversarial datasets and
+validates the result twice: with a full rescan of the cleaned text, and
+incrementally (re-analyzing only around replacements). Reports how often
+the two disagree on whether PHI leaked, and the validation time of each.
+
+Handoffs are also concatenated into longer transcripts (--join), which is
+where incremental validation saves work.
+
+Usage:
+    python scripts/compare_validation.py
+    python scripts/compare_validation.py --join 20 --limit 200
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.deidentification import deidentify_text, validate_deidentification
+
+DATASETS = [
+    Path(__file__).parent.parent / "tests" / "synthetic_handoffs.json",
+    Path(__file__).parent.parent / "tests" / "adversarial_handoffs.json",
+]
+
+
+def load_texts(limit: int, join: int) -> List[str]:
+    texts = []
+    for path in DATASETS:
+        handoffs = json.loads(path.read_text())["handoffs"][:limit]
+        texts.extend(h["text"] for h in handoffs)
+    if join > 1:
+        texts = [" ".join(texts[i:i + join]) for i in range(0, len(texts), join)]
+    return texts
+
+
+def compare(texts: List[str]) -> Dict[str, float]:
+    disagreements = 0
+    missed_by_incremental = 0
+    full_seconds = incremental_seconds = 0.0
+
+    for text in texts:
+        result = deidentify_text(text)
+
+        settings.incremental_validation = False
+        start = time.perf_counter()
+        full_valid, full_warnings = validate_deidentification(text, result.clean_text, result)
+        full_seconds += time.perf_counter() - start
+
+        settings.incremental_validation = True
+        start = time.perf_counter()
+        valid, warnings = validate_deidentification(text, result.clean_text, result)
+        incremental_seconds += time.perf_counter() - start
+
+        if sorted(full_warnings) != sorted(warnings):
+            disagreements += 1
+        if valid and not full_valid:
+            missed_by_incremental += 1
+
+    return {
+        "texts": len(texts),
+        "warning_mismatches": disagreements,
+        "leaks_missed": missed_by_incremental,
+        "full_ms": full_seconds / len(texts) * 1000,
+        "incremental_ms": incremental_seconds / len(texts) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare incremental and full validation")
+    parser.add_argument("--limit", type=int, default=500, help="Handoffs per dataset")
+    parser.add_argument("--join", type=int, nargs="+", default=[1, 20], help="Handoffs per transcript")
+    args = parser.parse_args()
+
+    deidentify_text("warm up")  # Load engines outside the timings
+
+    print(f"{'Join':>5} {'Texts':>6} {'Mismatch':>9} {'Missed':>7} {'Full ms':>9} {'Incr ms':>9}")
+    print("-" * 50)
+    for join in args.join:
+        r = compare(load_texts(args.limit, join))
+        print(
+            f"{join:>5} {r['texts']:>6} {r['warning_mismatches']:>9} {r['leaks_missed']:>7} "
+            f"{r['full_ms']:>9.1f} {r['incremental_ms']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -73,20 +73,18 @@ def preload_spacy():
 
 
 def preload_presidio():
-    """Initialize Presidio engines to cache any lazy-loaded resources."""
+    """Initialize the Presidio analyzer to cache any lazy-loaded resources."""
     logger.info("Initializing Presidio engines...")
 
     try:
         from presidio_analyzer import AnalyzerEngine
-        from presidio_anonymizer import AnonymizerEngine
 
         analyzer = AnalyzerEngine()
-        anonymizer = AnonymizerEngine()
 
         # Run a test analysis to warm up
         analyzer.analyze(text="Test text for warmup", language="en")
         logger.info("Presidio engines initialized successfully")
-        del analyzer, anonymizer
+        del analyzer
 
     except Exception as e:
         logger.error(f"Failed to initialize Presidio: {e}")
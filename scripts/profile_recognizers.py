@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Offline per-recognizer cost/yield report.
+
+De-identifies the synthetic handoffs with recognizer instrumentation
+enabled and ranks recognizers (and spaCy parsing) by total time, with how
+many of their matches survived thresholds and deny lists. With
+--patterns, each regex of every pattern recognizer is also timed on its
+own, to find individual patterns that cost a lot and match little.
+
+With the pattern scanner enabled, custom recognizers' time is reported
+under "Pattern Scanner"; --no-scanner times each of them separately.
+
+Usage:
+    python scripts/profile_recognizers.py
+    python scripts/profile_recognizers.py --limit 100 --patterns --no-scanner
+    python scripts/profile_recognizers.py --json > recognizers.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import regex
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+
+DATASET = Path(__file__).parent.parent / "tests" / "synthetic_handoffs.json"
+
+
+def histogram_quantile(histogram: Dict[str, int], q: float) -> str:
+    """Bucket label holding the q-quantile observation."""
+    total = sum(histogram.values())
+    seen = 0
+    for label, count in histogram.items():
+        seen += count
+        if total and seen >= q * total:
+            return label
+    return "-"
+
+
+def profile_patterns(analyzer, texts: List[str]) -> List[Dict[str, Any]]:
+    """Time each regex of each pattern recognizer over all texts (compiled as Presidio does)."""
+    from presidio_analyzer import PatternRecognizer
+
+    rows = []
+    for recognizer in analyzer.registry.recognizers:
+        if not isinstance(recognizer, PatternRecognizer):
+            continue
+        flags = recognizer.global_regex_flags or 0
+        for pattern in recognizer.patterns:
+            compiled = regex.compile(pattern.regex, flags=flags)
+            matches = 0
+            start = time.perf_counter()
+            for text in texts:
+                matches += sum(1 for _ in compiled.finditer(text))
+            rows.append({
+                "recognizer": recognizer.name,
+                "pattern": pattern.name,
+                "seconds": time.perf_counter() - start,
+                "matches": matches,
+            })
+    return sorted(rows, key=lambda row: -row["seconds"])
+
+
+def print_report(stats: Dict[str, Any], total_chars: int) -> None:
+    nlp = stats["nlp"]
+    print(f"{'Recognizer':<28} {'Calls':>6} {'Total ms':>9} {'Mean ms':>8} {'p95 ms':>8} "
+          f"{'Matches':>8} {'Kept':>6} {'Thresh':>7} {'Deny':>6} {'ms/kept':>8}")
+    print("-" * 106)
+    print(f"{'spaCy nlp':<28} {nlp['calls']:>6} {nlp['seconds_total'] * 1000:>9.1f} "
+          f"{nlp['ms_mean'] or 0:>8.3f} {histogram_quantile(nlp['latency_ms_histogram'], 0.95):>8}")
+    for name, row in stats["recognizers"].items():
+        ms_per_kept = f"{row['seconds_total'] * 1000 / row['kept']:.3f}" if row["kept"] else "-"
+        print(
+            f"{name[:28]:<28} {row['calls']:>6} {row['seconds_total'] * 1000:>9.1f} {row['ms_mean'] or 0:>8.3f} "
+            f"{histogram_quantile(row['latency_ms_histogram'], 0.95):>8} {row['matches']:>8} {row['kept']:>6} "
+            f"{row['dropped_threshold']:>7} {row['dropped_deny_list']:>6} {ms_per_kept:>8}"
+        )
+    recognizer_seconds = sum(row["seconds_total"] for row in stats["recognizers"].values())
+    print(f"\n{total_chars} chars; nlp {nlp['seconds_total']:.2f}s, recognizers {recognizer_seconds:.2f}s")
+
+
+def print_patterns(rows: List[Dict[str, Any]], top: int) -> None:
+    print(f"\n{'Recognizer':<28} {'Pattern':<28} {'Total ms':>9} {'Matches':>8}")
+    print("-" * 76)
+    for row in rows[:top]:
+        print(f"{row['recognizer'][:28]:<28} {row['pattern'][:28]:<28} {row['seconds'] * 1000:>9.1f} {row['matches']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-recognizer latency and hit-rate report")
+    parser.add_argument("--limit", type=int, default=500, help="Handoffs de-identified")
+    parser.add_argument("--patterns", action="store_true", help="Also time each regex separately")
+    parser.add_argument("--top", type=int, default=25, help="Patterns listed with --patterns")
+    parser.add_argument("--json", action="store_true", help="Print raw statistics as JSON")
+    parser.add_argument("--no-scanner", action="store_true", help="Scan each custom pattern separately")
+    args = parser.parse_args()
+
+    # Instrument the analyzer when it loads; keep every call in this process
+    settings.recognizer_metrics_enabled = True
+    settings.sentence_cache_enabled = False
+    settings.deidentify_window_workers = 0
+    if args.no_scanner:
+        settings.pattern_scanner_enabled = False
+
+    from app.deidentification import _get_analyzer, deidentify_text
+    from app.recognizer_metrics import recognizer_metrics
+    from tests.generate_test_data import load_dataset
+
+    texts = [h.text for h in load_dataset(DATASET)[:args.limit]]
+    analyzer = _get_analyzer()
+    deidentify_text(texts[0])  # Warm up outside the statistics
+    recognizer_metrics.reset()
+
+    for text in texts:
+        deidentify_text(text)
+    stats = recognizer_metrics.stats()
+    patterns = profile_patterns(analyzer, texts) if args.patterns else None
+
+    if args.json:
+        print(json.dumps({"stats": stats, "patterns": patterns}, indent=2))
+        return
+    print_report(stats, sum(len(text) for text in texts))
+    if patterns:
+        print_patterns(patterns, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,7 @@ class HandoffTranscriber {
         // Processing steps
         this.stepTranscribe = document.getElementById('step-transcribe');
         this.stepDeidentify = document.getElementById('step-deidentify');
+        this.transcribeStepDesc = this.stepTranscribe.querySelector('.step-desc').textContent;
 
         // Results elements
         this.phiTotal = document.getElementById('phi-total');
@@ -209,30 +210,24 @@ class HandoffTranscriber {
             const formData = new FormData();
             formData.append('file', this.audioBlob, 'recording.webm');
 
-            // Use AbortController with 30-minute timeout for long recordings
-            const controller = new AbortController();
-            const timeoutId = setTimeout(() => controller.abort(), 30 * 60 * 1000);
-
-            const response = await fetch('/api/process', {
+            // Submit as a background job - returns immediately with a job ID
+            const response = await fetch('/api/jobs', {
                 method: 'POST',
-                body: formData,
-                signal: controller.signal
+                body: formData
             });
 
-            clearTimeout(timeoutId);
-
             if (!response.ok) {
                 const error = await response.json();
                 throw new Error(error.detail || 'Processing failed');
             }
 
-            this.setStepStatus('step-transcribe', 'complete');
-            this.setStepStatus('step-deidentify', 'active');
-
-            const result = await response.json();
+            const job = await response.json();
+            if (job.estimate) {
+                this.showEstimate(job.estimate);
+            }
+            const result = await this.followJob(job);
 
-            // Small delay to show deidentify step
-            await new Promise(resolve => setTimeout(resolve, 500));
+            this.setStepStatus('step-transcribe', 'complete');
             this.setStepStatus('step-deidentify', 'complete');
 
             // Show results
@@ -243,9 +238,115 @@ class HandoffTranscriber {
             alert(`Processing failed: ${error.message}`);
             this.processingPanel.classList.add('hidden');
             this.audioPreview.classList.remove('hidden');
+        } finally {
+            this.resetTranscribeProgress();
         }
     }
 
+    /**
+     * Follow a processing job until it completes.
+     * Uses Server-Sent Events for live progress, falling back to polling.
+     */
+    followJob(job) {
+        return new Promise((resolve, reject) => {
+            if (!window.EventSource) {
+                this.pollJob(job.status_url).then(resolve, reject);
+                return;
+            }
+
+            const events = new EventSource(job.events_url);
+            let finished = false;
+
+            events.addEventListener('stage', (event) => {
+                this.handleJobStage(JSON.parse(event.data).status);
+            });
+
+            events.addEventListener('progress', (event) => {
+                this.showTranscribeProgress(JSON.parse(event.data));
+            });
+
+            events.addEventListener('complete', (event) => {
+                finished = true;
+                events.close();
+                resolve(JSON.parse(event.data));
+            });
+
+            events.addEventListener('error', (event) => {
+                if (event.data) {
+                    // Job failed on the server
+                    finished = true;
+                    events.close();
+                    reject(new Error(JSON.parse(event.data).detail || 'Processing failed'));
+                } else if (!finished) {
+                    // Connection problem - fall back to polling
+                    events.close();
+                    this.pollJob(job.status_url).then(resolve, reject);
+                }
+            });
+        });
+    }
+
+    async pollJob(statusUrl) {
+        const pollIntervalMs = 2000;
+
+        while (true) {
+            const response = await fetch(statusUrl);
+            const data = await response.json();
+
+            if (!response.ok) {
+                throw new Error(data.detail || 'Processing failed');
+            }
+
+            if (data.status === 'complete') {
+                return data.result;
+            }
+            if (data.status === 'failed') {
+                throw new Error(data.error || 'Processing failed');
+            }
+
+            this.handleJobStage(data.status);
+            if (data.segments_decoded > 0) {
+                this.showTranscribeProgress(data);
+            }
+
+            await new Promise(resolve => setTimeout(resolve, pollIntervalMs));
+        }
+    }
+
+    handleJobStage(status) {
+        if (status === 'deidentifying' || status === 'validating') {
+            this.setStepStatus('step-transcribe', 'complete');
+            this.setStepStatus('step-deidentify', 'active');
+        }
+    }
+
+    showTranscribeProgress(progress) {
+        const desc = this.stepTranscribe.querySelector('.step-desc');
+        const position = this.formatSeconds(progress.audio_position_seconds);
+        const duration = progress.audio_duration_seconds
+            ? ` of ${this.formatSeconds(progress.audio_duration_seconds)}`
+            : '';
+        desc.textContent = `${progress.segments_decoded} segments decoded (${position}${duration})`;
+    }
+
+    showEstimate(estimate) {
+        const desc = this.stepTranscribe.querySelector('.step-desc');
+        const p50 = this.formatSeconds(estimate.p50_seconds);
+        const p90 = this.formatSeconds(estimate.p90_seconds);
+        desc.textContent = `Usually ${p50}, up to ${p90}`;
+    }
+
+    resetTranscribeProgress() {
+        const desc = this.stepTranscribe.querySelector('.step-desc');
+        desc.textContent = this.transcribeStepDesc;
+    }
+
+    formatSeconds(totalSeconds) {
+        const seconds = Math.floor(totalSeconds || 0);
+        const minutes = Math.floor(seconds / 60);
+        return `${minutes}:${(seconds % 60).toString().padStart(2, '0')}`;
+    }
+
     setStepStatus(stepId, status) {
         const step = document.getElementById(stepId);
         const icon = step.querySelector('.step-icon');
@@ -97,13 +97,12 @@ class ThresholdCalibrator:
         self.thresholds = thresholds or [0.30, 0.40, 0.50, 0.60]
         self.overlap_threshold = overlap_threshold
         self._analyzer = None
-        self._anonymizer = None
 
     def _load_presidio(self):
         """Lazy load Presidio engines."""
         if self._analyzer is None:
-            from app.deidentification import _get_engines
-            self._analyzer, self._anonymizer = _get_engines()
+            from app.deidentification import _get_analyzer
+            self._analyzer = _get_analyzer()
 
     def _analyze_text_raw(self, text: str, threshold: float = 0.0) -> list[dict]:
         """
@@ -119,6 +118,7 @@ class ThresholdCalibrator:
         self._load_presidio()
 
         from app.config import settings
+        from app.deny_list import get_deny_list_index
 
         results = self._analyzer.analyze(
             text=text,
@@ -127,20 +127,11 @@ class ThresholdCalibrator:
             score_threshold=threshold
         )
 
-        # Filter out deny-listed terms
+        # Filter out deny-listed terms (same index as production)
+        deny_list = get_deny_list_index()
         filtered = []
         for result in results:
-            detected_text = text[result.start:result.end].strip()
-
-            if result.entity_type == "LOCATION" and detected_text.lower() in [w.lower() for w in settings.deny_list_location]:
-                continue
-            if result.entity_type == "PERSON" and detected_text.lower() in [w.lower() for w in settings.deny_list_person]:
-                continue
-            if result.entity_type == "GUARDIAN_NAME" and detected_text.lower() in [w.lower() for w in settings.deny_list_guardian_name]:
-                continue
-            if result.entity_type == "PEDIATRIC_AGE" and detected_text.lower() in [w.lower() for w in settings.deny_list_pediatric_age]:
-                continue
-            if result.entity_type == "DATE_TIME" and detected_text.lower() in [w.lower() for w in settings.deny_list_date_time]:
+            if deny_list.is_denied(result.entity_type, text[result.start:result.end]):
                 continue
 
             filtered.append({
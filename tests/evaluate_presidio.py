@@ -233,14 +233,13 @@ class PresidioEvaluator:
         """
         self.overlap_threshold = overlap_threshold
         self._analyzer = None
-        self._anonymizer = None
 
     def _load_presidio(self):
         """Lazy load Presidio to avoid import overhead."""
         if self._analyzer is None:
             # Import here to avoid circular imports
-            from app.deidentification import _get_engines
-            self._analyzer, self._anonymizer = _get_engines()
+            from app.deidentification import _get_analyzer
+            self._analyzer = _get_analyzer()
 
     def _calculate_overlap(self, span1_start: int, span1_end: int,
                            span2_start: int, span2_end: int) -> float:
@@ -273,6 +272,7 @@ class PresidioEvaluator:
         self._load_presidio()
 
         from app.config import settings
+        from app.deny_list import get_deny_list_index
 
         results = self._analyzer.analyze(
             text=text,
@@ -281,20 +281,11 @@ class PresidioEvaluator:
             score_threshold=settings.phi_score_threshold
         )
 
-        # Filter out deny-listed terms
+        # Filter out deny-listed terms (same index as production)
+        deny_list = get_deny_list_index()
         filtered = []
         for result in results:
-            detected_text = text[result.start:result.end].strip()
-
-            if result.entity_type == "LOCATION" and detected_text.lower() in [w.lower() for w in settings.deny_list_location]:
-                continue
-            if result.entity_type == "PERSON" and detected_text.lower() in [w.lower() for w in settings.deny_list_person]:
-                continue
-            if result.entity_type == "GUARDIAN_NAME" and detected_text.lower() in [w.lower() for w in settings.deny_list_guardian_name]:
-                continue
-            if result.entity_type == "PEDIATRIC_AGE" and detected_text.lower() in [w.lower() for w in settings.deny_list_pediatric_age]:
-                continue
-            if result.entity_type == "DATE_TIME" and detected_text.lower() in [w.lower() for w in settings.deny_list_date_time]:
+            if deny_list.is_denied(result.entity_type, text[result.start:result.end]):
                 continue
 
             filtered.append({
@@ -0,0 +1,140 @@
+"""
+Tests for the span-splice anonymizer.
+
+Output is compared against Presidio's AnonymizerEngine (with the operators
+the app used before the anonymizer was replaced), which must agree byte
+for byte.
+
+Run with: pytest tests/test_anonymizer.py -v
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+from presidio_analyzer import RecognizerResult
+from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.entities import OperatorConfig
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.anonymizer import anonymize, type_marker
+from app.config import settings
+from app.deidentification import _analyze, _filter_results, _get_analyzer
+from tests.sample_transcripts import SAMPLE_TRANSCRIPTS
+
+STRATEGIES = ["type_marker", "redact", "mask", "unknown"]
+
+
+def presidio_operators(strategy):
+    """Operators equivalent to each strategy, for the reference engine."""
+    if strategy == "type_marker":
+        return {
+            entity_type: OperatorConfig("replace", {"new_value": type_marker(entity_type)})
+            for entity_type in settings.phi_entities
+        }
+    if strategy == "redact":
+        return {"DEFAULT": OperatorConfig("replace", {"new_value": "[REDACTED]"})}
+    if strategy == "mask":
+        return {"DEFAULT": OperatorConfig("mask", {
+            "type": "mask", "masking_char": "*", "chars_to_mask": 100, "from_end": False
+        })}
+    return {"DEFAULT": OperatorConfig("replace", {"new_value": "<PHI>"})}
+
+
+def presidio_anonymize(text, results, strategy):
+    # AnonymizerEngine mutates its input: give it copies
+    copies = [RecognizerResult(r.entity_type, r.start, r.end, r.score) for r in results]
+    return AnonymizerEngine().anonymize(
+        text=text, analyzer_results=copies, operators=presidio_operators(strategy)
+    )
+
+
+def assert_matches_presidio(text, results, strategy):
+    expected = presidio_anonymize(text, results, strategy)
+    actual = anonymize(text, results, strategy)
+
+    assert actual.text == expected.text
+    assert sorted((r.clean_start, r.clean_end, r.entity_type) for r in actual.replacements) == \
+        sorted((item.start, item.end, item.entity_type) for item in expected.items)
+
+
+class TestMatchesPresidio:
+    """Byte-identical output to AnonymizerEngine."""
+
+    @pytest.mark.parametrize("strategy", STRATEGIES)
+    def test_random_overlapping_spans(self, strategy):
+        rng = random.Random(0)
+        types = ["PERSON", "LOCATION", "PHONE_NUMBER", "GUARDIAN_NAME", "NOT_CONFIGURED"]
+        for _ in range(2000):
+            text = "".join(rng.choice("ab  c") for _ in range(rng.randint(5, 40)))
+            results = []
+            for _ in range(rng.randint(0, 6)):
+                start = rng.randrange(len(text))
+                end = rng.randint(start + 1, len(text))
+                results.append(RecognizerResult(rng.choice(types), start, end, rng.choice([0.3, 0.5, 0.9])))
+            assert_matches_presidio(text, results, strategy)
+
+    @pytest.mark.parametrize("strategy", STRATEGIES)
+    def test_analyzer_results_on_corpus(self, strategy):
+        handoffs = json.loads((Path(__file__).parent / "synthetic_handoffs.json").read_text())["handoffs"]
+        texts = [sample["text"] for sample in SAMPLE_TRANSCRIPTS] + [h["text"] for h in handoffs[:100]]
+        analyzer = _get_analyzer()
+
+        for text in texts:
+            raw_results = _analyze(analyzer, text)
+            assert_matches_presidio(text, _filter_results(text, raw_results), strategy)
+            # Unfiltered candidates overlap far more often
+            assert_matches_presidio(text, raw_results, strategy)
+
+
+class TestSpanSplice:
+    """Replacement semantics and offset maps."""
+
+    def test_replacements_map_original_to_clean(self):
+        text = "Call Jessica at 555-867-5309 today"
+        results = [
+            RecognizerResult("PHONE_NUMBER", 16, 28, 0.9),
+            RecognizerResult("PERSON", 5, 12, 0.85),
+        ]
+        anonymized = anonymize(text, results)
+
+        assert anonymized.text == "Call [NAME] at [PHONE] today"
+        for r in anonymized.replacements:
+            assert anonymized.text[r.clean_start:r.clean_end] == type_marker(r.entity_type)
+        assert [(r.original_start, r.original_end) for r in anonymized.replacements] == [(5, 12), (16, 28)]
+
+    def test_same_type_separated_by_spaces_replaced_once(self):
+        text = "Mom Jessica Smith called"
+        results = [RecognizerResult("PERSON", 4, 11, 0.8), RecognizerResult("PERSON", 12, 17, 0.8)]
+        assert anonymize(text, results).text == "Mom [NAME] called"
+
+    def test_contained_detection_dropped(self):
+        text = "at Boston Children's today"
+        results = [RecognizerResult("PERSON", 3, 9, 0.9), RecognizerResult("LOCATION", 3, 20, 0.6)]
+        anonymized = anonymize(text, results)
+
+        assert anonymized.text == "at [LOCATION] today"
+        replacement, = anonymized.replacements
+        assert (replacement.original_start, replacement.original_end) == (3, 20)
+
+    def test_partial_overlap_splits_original_span(self):
+        text = "seen by Dana Street today"
+        results = [RecognizerResult("PERSON", 8, 12, 0.9), RecognizerResult("LOCATION", 10, 19, 0.6)]
+        anonymized = anonymize(text, results)
+
+        assert anonymized.text == "seen by [NAME][LOCATION] today"
+        assert [(r.original_start, r.original_end) for r in anonymized.replacements] == [(8, 10), (10, 19)]
+
+    def test_mask_keeps_tail_beyond_limit(self):
+        text = "x" * 120
+        anonymized = anonymize(text, [RecognizerResult("PERSON", 0, 120, 0.9)], "mask")
+        assert anonymized.text == "*" * 100 + "x" * 20
+
+    def test_input_results_not_modified(self):
+        results = [RecognizerResult("PERSON", 0, 3, 0.5), RecognizerResult("PERSON", 2, 6, 0.7)]
+        anonymize("abcdefgh", results)
+        assert [(r.start, r.end, r.score) for r in results] == [(0, 3, 0.5), (2, 6, 0.7)]
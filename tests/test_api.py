@@ -0,0 +1,256 @@
+"""
+API-level tests for upload handling.
+
+Transcription is replaced with a stub so these run without Whisper models.
+
+Run with: pytest tests/test_api.py -v
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.main as main_module
+from app.config import settings
+from app.estimator import ProcessingTimeEstimator
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client with transcription stubbed out."""
+    received = {}
+
+    def fake_transcribe(audio, extension=".webm", on_segment=None, profile=None):
+        received["type"] = type(audio).__name__
+        received["size"] = len(audio.read()) if hasattr(audio, "read") else len(audio)
+        return "", {"duration": 1.0}
+
+    monkeypatch.setattr(main_module, "transcribe_audio", fake_transcribe)
+    with TestClient(main_module.app) as test_client:
+        test_client.received = received
+        yield test_client
+
+
+class TestStreamedUploads:
+    """Uploads are spooled in chunks and size-capped before processing."""
+
+    def test_upload_passed_as_file_object(self, client):
+        response = client.post("/api/process", files={"file": ("a.wav", b"\x00" * 2048)})
+        assert response.status_code == 200
+        assert client.received == {"type": "SpooledTemporaryFile", "size": 2048}
+
+    def test_synchronous_upload_not_copied(self, client, monkeypatch):
+        """The request's own spooled upload is transcribed; only jobs copy it."""
+        def no_copy(*args, **kwargs):
+            raise AssertionError("upload copied into a second spool file")
+
+        monkeypatch.setattr(main_module, "SpooledTemporaryFile", no_copy)
+        response = client.post("/api/process", files={"file": ("a.wav", b"\x00" * 2048)})
+        assert response.status_code == 200
+        assert client.received["size"] == 2048
+
+    def test_declared_oversize_body_rejected_before_reading(self, client):
+        """Content-Length above the cap is rejected without touching the body."""
+        oversize = str((settings.max_audio_size_mb + 1) * 1024 * 1024)
+        response = client.post(
+            "/api/process",
+            content=b"",
+            headers={"content-type": "multipart/form-data; boundary=x", "content-length": oversize},
+        )
+        assert response.status_code == 413
+        assert "type" not in client.received
+
+    def test_oversize_file_rejected_while_streaming(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "max_audio_size_mb", 1)
+        response = client.post(
+            "/api/transcribe", files={"file": ("a.wav", b"\x00" * (1024 * 1024 + 1))}
+        )
+        assert response.status_code == 413
+        assert "type" not in client.received
+
+    def test_missing_filename_rejected(self, client):
+        response = client.post("/api/process", files={"file": ("", b"\x00")})
+        assert response.status_code in (400, 422)
+
+
+class TestStreamingPipeline:
+    """Segments are de-identified while transcription is still running."""
+
+    def test_segments_deidentified_before_transcription_finishes(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "stream_deidentification", True)
+        deidentified_during_transcription = []
+
+        def deidentify_calls():
+            return main_module.processing_executor.stats()["deidentify"]["completed"]
+
+        def fake_transcribe(audio, extension=".webm", on_segment=None, profile=None):
+            calls_before = deidentify_calls()
+            texts = ["Call back at", "555-867-5309 for updates"]
+            for i, text in enumerate(texts):
+                on_segment({"start": i, "end": i + 1, "text": text}, 2.0)
+            # Give the event loop time to de-identify the queued segments
+            time.sleep(0.5)
+            deidentified_during_transcription.append(deidentify_calls() - calls_before)
+            return " ".join(texts), {"duration": 2.0}
+
+        monkeypatch.setattr(main_module, "transcribe_audio", fake_transcribe)
+        response = client.post("/api/process", files={"file": ("a.wav", b"\x00" * 16)})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["original_transcript"] == "Call back at 555-867-5309 for updates"
+        assert "555-867-5309" not in body["clean_transcript"]
+        assert deidentified_during_transcription[0] >= 1
+
+
+class TestJobs:
+    """Asynchronous jobs started with POST /api/jobs."""
+
+    def test_job_id_is_random_and_not_audited(self, client, monkeypatch):
+        audited = []
+        monkeypatch.setattr(
+            main_module.audit_logger, "log_request_start",
+            lambda request_id, *args, **kwargs: audited.append(request_id),
+        )
+        response = client.post("/api/jobs", files={"file": ("a.wav", b"\x00" * 16)})
+
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert len(job_id) >= 43
+        assert job_id not in audited
+        assert main_module.job_store.get(job_id).request_id == audited[0]
+
+    def test_failed_probe_leaves_no_job(self, client, monkeypatch):
+        spooled = []
+
+        def failing_probe(audio):
+            spooled.append(audio)
+            raise RuntimeError("probe failed")
+
+        monkeypatch.setattr(main_module, "probe_duration", failing_probe)
+        jobs_before = len(main_module.job_store)
+        with pytest.raises(RuntimeError):
+            client.post("/api/jobs", files={"file": ("a.wav", b"\x00" * 16)})
+
+        assert len(main_module.job_store) == jobs_before
+        assert spooled[0].closed
+
+
+class TestAdminStats:
+    """Capacity statistics are exposed without PHI."""
+
+    def test_stats_cover_executor_and_model_pool(self, client):
+        response = client.get("/api/admin/stats")
+        assert response.status_code == 200
+        body = response.json()
+        assert set(body["executor"]) == {"transcribe", "deidentify"}
+        assert body["whisper_pool"]["size"] == settings.whisper_pool_size
+        assert "utilization" in body["whisper_pool"]
+
+    def test_recognizer_stats_endpoint(self, client):
+        response = client.get("/api/admin/recognizers")
+        assert response.status_code == 200
+        body = response.json()
+        assert set(body) == {"enabled", "nlp", "recognizers"}
+
+
+class TestDecodeProfiles:
+    """Per-request decode profile selection."""
+
+    def test_unknown_profile_rejected_before_upload_is_processed(self, client):
+        response = client.post(
+            "/api/process?profile=turbo", files={"file": ("a.wav", b"\x00" * 16)}
+        )
+        assert response.status_code == 400
+        assert "type" not in client.received
+
+    def test_profile_passed_to_transcription_and_reported(self, client, monkeypatch):
+        def fake_transcribe(audio, extension=".webm", on_segment=None, profile=None):
+            return "", {"duration": 4.0, "profile": profile, "real_time_factor": 0.25}
+
+        monkeypatch.setattr(main_module, "transcribe_audio", fake_transcribe)
+        response = client.post(
+            "/api/process?profile=fast", files={"file": ("a.wav", b"\x00" * 16)}
+        )
+
+        assert response.status_code == 200
+        metadata = response.json()["metadata"]
+        assert metadata["profile"] == "fast"
+        assert metadata["real_time_factor"] == 0.25
+
+
+class TestProcessingEstimate:
+    """Processing-time estimates calibrated from completed requests."""
+
+    def test_estimate_uses_priors_then_measured_speed(self, client, monkeypatch):
+        estimator = ProcessingTimeEstimator()
+        monkeypatch.setattr(main_module, "processing_estimator", estimator)
+
+        prior = client.get("/api/estimate-time?duration_seconds=60").json()
+        assert prior["confidence"] == "low"
+        assert prior["duration_source"] == "client"
+        assert prior["p90_seconds"] > prior["p50_seconds"]
+
+        def fake_transcribe(audio, extension=".webm", on_segment=None, profile=None):
+            return "", {"duration": 10.0, "profile": "balanced", "real_time_factor": 2.0}
+
+        monkeypatch.setattr(main_module, "transcribe_audio", fake_transcribe)
+        for _ in range(5):
+            client.post("/api/process", files={"file": ("a.wav", b"\x00" * 16)})
+
+        measured = client.get("/api/estimate-time?duration_seconds=60").json()
+        assert measured["confidence"] == "medium"
+        assert measured["breakdown"]["transcription_p50_seconds"] == pytest.approx(120.0)
+        assert measured["estimated_seconds"] == measured["p50_seconds"]
+
+    def test_duration_derived_from_file_size(self, client):
+        response = client.get("/api/estimate-time?file_size_bytes=40000&extension=webm")
+        assert response.status_code == 200
+        assert response.json()["duration_source"] == "file_size"
+        assert response.json()["audio_duration_seconds"] == pytest.approx(10.0)
+
+    def test_requires_duration_or_size(self, client):
+        assert client.get("/api/estimate-time").status_code == 400
+
+
+class TestDeidentifyModes:
+    """Full and fast de-identification tiers."""
+
+    def test_mode_reported(self, client):
+        for mode in ("full", "fast"):
+            response = client.post("/api/deidentify", params={"text": "Mom Jessica, call 555-867-5309", "mode": mode})
+            assert response.status_code == 200
+            body = response.json()
+            assert body["mode"] == mode
+            assert "Jessica" not in body["clean_text"]
+            assert "555-867-5309" not in body["clean_text"]
+
+    def test_unknown_mode_rejected(self, client):
+        response = client.post("/api/deidentify", params={"text": "Mom Jessica", "mode": "turbo"})
+        assert response.status_code == 400
+
+
+class TestBatchDeidentify:
+    """JSON batch de-identification endpoint."""
+
+    def test_results_returned_in_order(self, client):
+        response = client.post(
+            "/api/deidentify/batch",
+            json={"texts": ["Call 555-867-5309", "Stable overnight"]},
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == 2
+        assert "555-867-5309" not in results[0]["clean_text"]
+        assert results[1]["clean_text"] == "Stable overnight"
+
+    def test_too_many_texts_rejected(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "deidentify_batch_max_texts", 2)
+        response = client.post("/api/deidentify/batch", json={"texts": ["a", "b", "c"]})
+        assert response.status_code == 413
@@ -0,0 +1,142 @@
+"""
+Tests for the cross-request Whisper batch scheduler.
+
+A fake pipeline stands in for CTranslate2 so these run without Whisper models.
+
+Run with: pytest tests/test_batching.py -v
+"""
+
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.batching import (
+    ScheduledBatchPipeline,
+    WhisperBatchScheduler,
+    get_batch_scheduler,
+    shutdown_batch_scheduler,
+)
+from app.model_pool import ModelPool
+
+
+class FakePipeline:
+    """Records batch sizes and echoes each chunk's marker value back."""
+
+    def __init__(self, fail: bool = False):
+        self.batch_sizes = []
+        self.fail = fail
+
+    def forward(self, features, tokenizer, chunks_metadata, options):
+        if self.fail:
+            raise RuntimeError("inference failed")
+        self.batch_sizes.append(len(features))
+        return [[{"text": str(int(chunk[0, 0]))}] for chunk in features]
+
+
+TOKENIZER = SimpleNamespace(tokenizer=object(), task=None, language=None)
+
+
+def _options(beam_size: int = 5) -> SimpleNamespace:
+    return SimpleNamespace(
+        beam_size=beam_size, patience=1, length_penalty=1, repetition_penalty=1,
+        no_repeat_ngram_size=0, temperatures=[0.0], initial_prompt=None, hotwords=None,
+        max_new_tokens=None, suppress_blank=True, suppress_tokens=[-1],
+        without_timestamps=True, multilingual=False, word_timestamps=False,
+    )
+
+
+def _chunk(marker: int) -> np.ndarray:
+    return np.full((80, 3000), marker, dtype=np.float32)
+
+
+class TestWhisperBatchScheduler:
+    """Chunks from concurrent requests share inference calls."""
+
+    def test_concurrent_requests_batched_and_routed(self):
+        pipeline = FakePipeline()
+        scheduler = WhisperBatchScheduler(pipeline, batch_size=8, max_wait_ms=200)
+        results = {}
+        start = threading.Barrier(4)
+
+        def request(request_number):
+            start.wait()
+            futures = [
+                scheduler.submit(_chunk(request_number * 10 + i), TOKENIZER, {}, _options())
+                for i in range(2)
+            ]
+            results[request_number] = [f.result(timeout=5)[0]["text"] for f in futures]
+
+        threads = [threading.Thread(target=request, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        scheduler.shutdown()
+
+        assert results == {n: [str(n * 10), str(n * 10 + 1)] for n in range(4)}
+        assert max(pipeline.batch_sizes) > 2  # Chunks from several requests shared a batch
+        assert scheduler.stats()["chunks"] == 8
+
+    def test_incompatible_options_not_batched_together(self):
+        pipeline = FakePipeline()
+        scheduler = WhisperBatchScheduler(pipeline, batch_size=8, max_wait_ms=100)
+        futures = [
+            scheduler.submit(_chunk(1), TOKENIZER, {}, _options(beam_size=5)),
+            scheduler.submit(_chunk(2), TOKENIZER, {}, _options(beam_size=1)),
+        ]
+        assert [f.result(timeout=5)[0]["text"] for f in futures] == ["1", "2"]
+        scheduler.shutdown()
+        assert pipeline.batch_sizes == [1, 1]
+
+    def test_inference_error_reaches_every_caller(self):
+        scheduler = WhisperBatchScheduler(FakePipeline(fail=True), batch_size=4, max_wait_ms=50)
+        future = scheduler.submit(_chunk(1), TOKENIZER, {}, _options())
+        with pytest.raises(RuntimeError, match="inference failed"):
+            future.result(timeout=5)
+        scheduler.shutdown()
+
+    def test_pipeline_yields_segments_in_chunk_order(self):
+        """Per-request pipeline keeps a bounded window of chunks in flight."""
+        pipeline = FakePipeline()
+        scheduler = WhisperBatchScheduler(pipeline, batch_size=2, max_wait_ms=10)
+        request_pipeline = ScheduledBatchPipeline(model=None, scheduler=scheduler)
+
+        def chunk_output(marker):
+            return {
+                "text": str(marker), "seek": 0, "start": 0.0, "end": 1.0, "tokens": [],
+                "avg_logprob": 0.0, "no_speech_prob": 0.0, "compression_ratio": 1.0,
+            }
+        pipeline.forward = lambda features, *args: [
+            [chunk_output(int(chunk[0, 0]))] for chunk in features
+        ]
+
+        request_pipeline.last_speech_timestamp = 12.5
+        segments = request_pipeline._batched_segments_generator(
+            [_chunk(i) for i in range(5)], TOKENIZER, [{}] * 5, 2, _options(), False
+        )
+        assert [s.text for s in segments] == ["0", "1", "2", "3", "4"]
+        assert request_pipeline.last_speech_timestamp == 0.0  # Reset as upstream does
+        scheduler.shutdown()
+
+
+class TestSharedScheduler:
+    """One scheduler, on one pool instance, serves every batched request."""
+
+    def test_scheduler_holds_one_pool_instance_until_shutdown(self):
+        pool = ModelPool(lambda index: f"model-{index}", size=2, name="fake")
+        scheduler = get_batch_scheduler(pool)
+        try:
+            assert get_batch_scheduler(pool) is scheduler
+            assert scheduler.model == "model-0"
+            assert pool.stats()["in_use"] == 1
+            assert pool.stats()["loaded"] == 1  # No instance per request
+        finally:
+            shutdown_batch_scheduler()
+        assert pool.stats()["in_use"] == 0
@@ -0,0 +1,95 @@
+"""
+Tests for parallel chunked transcription (planning and stitching).
+
+A fake Whisper model stands in for the worker models so these run without
+downloading weights.
+
+Run with: pytest tests/test_chunking.py -v
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.chunking as chunking
+from app.chunking import AudioChunk, ChunkSegment, plan_chunks, stitch_segments
+
+SR = 16000
+
+
+def _speech(*regions_seconds):
+    return [{"start": int(s * SR), "end": int(e * SR)} for s, e in regions_seconds]
+
+
+class TestPlanChunks:
+    """Chunks are cut in silences, or force-split with overlap."""
+
+    def test_cuts_in_middle_of_silence(self):
+        speech = _speech((0, 50), (60, 110), (120, 170), (180, 230))
+        chunks = plan_chunks(speech, 240 * SR, SR, target_seconds=100, overlap_seconds=2)
+
+        assert chunks == [
+            AudioChunk(0, 115 * SR),
+            AudioChunk(115 * SR, 240 * SR),
+        ]
+
+    def test_short_recording_is_one_chunk(self):
+        assert plan_chunks(_speech((1, 5)), 10 * SR, SR, 100, 2) == [AudioChunk(0, 10 * SR)]
+
+    def test_continuous_speech_force_split_with_overlap(self):
+        chunks = plan_chunks(_speech((0, 300)), 300 * SR, SR, target_seconds=100, overlap_seconds=2)
+
+        assert chunks == [
+            AudioChunk(0, 100 * SR, False),
+            AudioChunk(98 * SR, 200 * SR, True),
+            AudioChunk(198 * SR, 300 * SR, True),
+        ]
+
+
+class TestStitchSegments:
+    """Words transcribed twice in an overlap are dropped."""
+
+    def test_removes_repeated_overlap_words(self):
+        tail = "patient is stable on room air".split()
+        segments = [ChunkSegment(98.0, 101.0, "on room air, plan to"), ChunkSegment(101.0, 104.0, "discharge tomorrow")]
+
+        stitched = stitch_segments(tail, segments, overlaps_previous=True)
+        assert [s.text for s in stitched] == ["plan to", "discharge tomorrow"]
+
+    def test_silence_cut_chunks_untouched(self):
+        segments = [ChunkSegment(0.0, 1.0, "room air")]
+        assert stitch_segments(["room", "air"], segments, overlaps_previous=False) == segments
+
+
+class TestTranscribeChunked:
+    """Chunks run in parallel and come back in order with global timestamps."""
+
+    def test_segments_in_order_with_recording_timestamps(self, monkeypatch):
+        class FakeModel:
+            def transcribe(self, pcm, **kwargs):
+                seconds = len(pcm) / SR
+                return (
+                    [SimpleNamespace(start=0.5, end=seconds - 0.5, text=f" {seconds:.0f}s chunk")],
+                    SimpleNamespace(language="en", language_probability=0.99),
+                )
+
+        pool = ThreadPoolExecutor(max_workers=2)
+        monkeypatch.setattr(chunking, "_worker_model", FakeModel())
+        monkeypatch.setattr(chunking, "_get_pool", lambda: pool)
+        monkeypatch.setattr(chunking, "get_speech_timestamps", lambda *a, **k: _speech((0, 50), (60, 110), (120, 170)))
+        monkeypatch.setattr(chunking.settings, "parallel_chunk_seconds", 50)
+
+        segments, info = chunking.transcribe_chunked(np.zeros(180 * SR, dtype=np.float32), SR, {})
+        segments = list(segments)
+        pool.shutdown()
+
+        assert info.chunks == 3
+        assert info.language == "en"
+        assert [s.text for s in segments] == ["55s chunk", "60s chunk", "65s chunk"]
+        assert [s.start for s in segments] == [0.5, 55.5, 115.5]
@@ -0,0 +1,129 @@
+"""
+Tests for the forked de-identification worker pool.
+
+Run with: pytest tests/test_deidentify_pool.py -v
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import deidentify_pool as pool_module
+from app.deidentification import deidentify_text
+from app.deidentify_pool import DeidentificationPool, WorkerCrashedError, deidentify_pooled
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="Worker pool requires fork"
+)
+
+SHORT = "Mom Jessica called 555-123-4567 about the patient in room 4B."
+LONG = "Patient stable overnight on room air. " * 20 + "Dad Mike is at bedside."
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def make(**kwargs):
+        options = {"workers": 2, "short_chars": 100}
+        options.update(kwargs)
+        pool = DeidentificationPool(**options)
+        pool.start()
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.shutdown()
+
+
+class TestDeidentificationPool:
+
+    def test_results_match_in_process(self, make_pool):
+        pool = make_pool()
+        texts = [SHORT, LONG, SHORT.upper(), "No PHI here."]
+        futures = [pool.submit(text, "redact") for text in texts]
+
+        for text, future in zip(texts, futures):
+            assert future.result(timeout=30).clean_text == deidentify_text(text, "redact").clean_text
+        assert pool.stats()["completed"] == 4
+
+    def test_first_worker_keeps_to_short_texts(self, make_pool):
+        pool = make_pool()
+        for future in [pool.submit(LONG) for _ in range(4)]:
+            future.result(timeout=30)
+
+        workers = pool.stats()["workers"]
+        assert workers[0]["tasks_done"] == 0
+        assert workers[1]["tasks_done"] == 4
+
+    def test_crashed_worker_replaced_and_text_retried(self, make_pool, monkeypatch):
+        def crash_on_marker(text, strategy="type_marker"):
+            if "CRASH" in text:
+                os._exit(1)
+            return deidentify_text(text, strategy)
+
+        # Inherited by the forked workers
+        monkeypatch.setattr(pool_module, "deidentify_text", crash_on_marker)
+        pool = make_pool()
+
+        with pytest.raises(WorkerCrashedError):
+            pool.deidentify("CRASH " + SHORT)
+        assert pool.stats()["restarts"]["crash"] == 2
+        assert "Jessica" not in pool.deidentify(SHORT).clean_text
+
+    def test_workers_retired_on_memory_and_task_limits(self, make_pool):
+        pool = make_pool(max_worker_mb=1)
+        pool.deidentify(SHORT)
+        assert pool.stats()["restarts"]["memory"] == 1
+
+        pool = make_pool(max_tasks=2)
+        for _ in range(4):
+            pool.deidentify(SHORT)
+        assert pool.stats()["restarts"]["tasks"] == 2
+        assert all(w["tasks_done"] == 0 for w in pool.stats()["workers"])
+
+    def test_stuck_retiring_worker_does_not_block_pool(self, make_pool, monkeypatch):
+        worker_main = pool_module._worker_main
+
+        def slow_exit(conn):
+            worker_main(conn)
+            time.sleep(3)
+
+        # Inherited by the forked workers
+        monkeypatch.setattr(pool_module, "_worker_main", slow_exit)
+        pool = make_pool(max_tasks=1)
+
+        start = time.monotonic()
+        for _ in range(3):
+            pool.deidentify(SHORT)
+        assert pool.stats()["restarts"]["tasks"] == 3
+        assert time.monotonic() - start < 2
+
+    def test_shutdown_stops_workers(self, make_pool):
+        pool = make_pool()
+        pids = [w["pid"] for w in pool.stats()["workers"]]
+        pool.shutdown()
+
+        assert not pool.running
+        with pytest.raises(RuntimeError):
+            pool.submit(SHORT)
+        for pid in pids:
+            with pytest.raises(ChildProcessError):
+                os.waitpid(pid, os.WNOHANG)
+
+    def test_in_process_without_pool(self):
+        assert not pool_module.deidentify_pool.running
+        assert deidentify_pooled(SHORT).clean_text == deidentify_text(SHORT).clean_text
+
+    def test_single_worker_not_started(self):
+        pool = DeidentificationPool(workers=1, short_chars=100)
+        pool.start()
+        assert not pool.running
@@ -0,0 +1,75 @@
+"""
+Tests for the compiled deny-list index.
+
+Run with: pytest tests/test_deny_list.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.deny_list import AhoCorasick, DenyListIndex, get_deny_list_index
+
+
+class TestAhoCorasick:
+    """Single-pass multi-pattern substring matching."""
+
+    def test_matches_naive_substring_search(self):
+        rng = random.Random(0)
+        patterns = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(20)]
+        automaton = AhoCorasick(patterns)
+
+        for _ in range(500):
+            text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 12)))
+            assert automaton.contains_any(text) == any(p in text for p in patterns), text
+
+    def test_pattern_ending_inside_longer_pattern(self):
+        # "he" only reachable via the failure link from "she"
+        automaton = AhoCorasick(["she", "he", "hers"])
+        assert automaton.contains_any("ushe")
+        assert automaton.contains_any("xhex")
+        assert not automaton.contains_any("hrs")
+
+    def test_empty_pattern_list(self):
+        assert not AhoCorasick([]).contains_any("anything")
+
+    def test_find_all_matches_naive_search(self):
+        rng = random.Random(1)
+        patterns = ["".join(rng.choice("ab") for _ in range(rng.randint(1, 3))) for _ in range(8)]
+        automaton = AhoCorasick(patterns)
+
+        for _ in range(200):
+            text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 12)))
+            expected = {
+                (i, i + len(p)) for p in set(patterns) for i in range(len(text)) if text.startswith(p, i)
+            }
+            assert sorted(automaton.find_all(text)) == sorted(expected), text
+
+
+class TestDenyListIndex:
+    """Exact and substring deny lists, matching the original filter."""
+
+    def test_exact_lists_are_case_insensitive_whole_matches(self):
+        index = DenyListIndex(exact={"PERSON": ["Foley"]}, substring={})
+        assert index.is_denied("PERSON", " foley ")
+        assert not index.is_denied("PERSON", "Foley Smith")
+
+    def test_substring_lists_match_within_entity(self):
+        index = DenyListIndex(exact={}, substring={"DATE_TIME": ["months old"]})
+        assert index.is_denied("DATE_TIME", "5 Months Old")
+        assert not index.is_denied("DATE_TIME", "March 3rd")
+
+    def test_types_are_independent(self):
+        index = DenyListIndex(exact={"PERSON": ["mom"]}, substring={"DATE_TIME": ["day"]})
+        assert not index.is_denied("GUARDIAN_NAME", "mom")
+        assert not index.is_denied("PERSON", "day 3")
+
+    def test_configured_lists(self):
+        index = get_deny_list_index()
+        assert index.is_denied("DATE_TIME", "hospital day 3")
+        assert index.is_denied("GUARDIAN_NAME", settings.deny_list_guardian_name[0].upper())
+        assert not index.is_denied("PERSON", "Jessica Smith")
@@ -0,0 +1,93 @@
+"""
+Tests for the self-calibrating processing-time estimator.
+
+Run with: pytest tests/test_estimator.py -v
+"""
+
+import io
+import sys
+import wave
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.estimator import (
+    PRIOR_MODEL_RTF,
+    ProcessingTimeEstimator,
+    duration_from_size,
+    probe_duration,
+)
+
+
+def _wav_bytes(seconds: float, sample_rate: int = 16000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\x00\x00" * int(seconds * sample_rate))
+    return buffer.getvalue()
+
+
+class TestDuration:
+    """Audio duration from the container header, with a size fallback."""
+
+    def test_probe_reads_header(self):
+        assert probe_duration(_wav_bytes(3.0)) == pytest.approx(3.0, abs=0.01)
+
+    def test_probe_restores_file_position(self):
+        upload = io.BytesIO(_wav_bytes(1.0))
+        upload.seek(10)
+        probe_duration(upload)
+        assert upload.tell() == 10
+
+    def test_probe_returns_none_for_unreadable_audio(self):
+        assert probe_duration(b"not audio" * 50) is None
+
+    def test_size_fallback_uses_format_bitrate(self):
+        assert duration_from_size(32000 * 5, ".wav") == pytest.approx(5.0)
+        assert duration_from_size(1024 * 1024) == pytest.approx(60.0)
+
+
+class TestProcessingTimeEstimator:
+    """Priors until measured, then EWMA and sliding-window quantiles."""
+
+    def test_priors_before_any_measurement(self):
+        estimate = ProcessingTimeEstimator().estimate(100.0)
+        expected_rtf = PRIOR_MODEL_RTF.get(settings.whisper_model, 0.5)
+
+        assert estimate["confidence"] == "low"
+        assert estimate["samples"] == 0
+        assert estimate["real_time_factor_p50"] == pytest.approx(expected_rtf)
+        assert estimate["p90_seconds"] > estimate["p50_seconds"]
+
+    def test_converges_to_measured_speed(self):
+        estimator = ProcessingTimeEstimator(alpha=0.5)
+        for _ in range(30):
+            estimator.record_transcription(60.0, 30.0, transcript_chars=600)
+            estimator.record_deidentification(600, 0.5)
+
+        estimate = estimator.estimate(120.0)
+        assert estimate["confidence"] == "high"
+        assert estimate["real_time_factor_p50"] == pytest.approx(0.5)
+        assert estimate["transcription_p50_seconds"] == pytest.approx(60.0)
+        assert estimate["deidentification_p50_seconds"] == pytest.approx(1.0)
+
+    def test_p90_reflects_slow_tail(self):
+        estimator = ProcessingTimeEstimator()
+        for i in range(20):
+            estimator.record_transcription(10.0, 20.0 if i % 5 == 0 else 5.0, transcript_chars=150)
+
+        estimate = estimator.estimate(10.0)
+        assert estimate["real_time_factor_p90"] > estimate["real_time_factor_p50"]
+
+    def test_profiles_tracked_separately(self):
+        estimator = ProcessingTimeEstimator()
+        estimator.record_transcription(10.0, 1.0, transcript_chars=150, profile="fast")
+
+        assert estimator.estimate(10.0, "fast")["samples"] == 1
+        assert estimator.estimate(10.0, "accurate")["samples"] == 0
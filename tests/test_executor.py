@@ -0,0 +1,107 @@
+"""
+Tests for the bounded processing executor.
+
+Run with: pytest tests/test_executor.py -v
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.executor import ExecutorBusyError, ProcessingExecutor
+
+
+def _blocking_wait(event: threading.Event) -> str:
+    event.wait(timeout=5)
+    return "done"
+
+
+class TestProcessingExecutor:
+    """Test off-loop execution, concurrency limits and backpressure."""
+
+    def test_runs_blocking_call_off_event_loop(self):
+        """Event loop keeps running while a blocking call is in flight."""
+        executor = ProcessingExecutor({"transcribe": 1}, queue_size=0)
+
+        async def scenario():
+            loop_thread = threading.get_ident()
+            worker_thread = await executor.run("transcribe", threading.get_ident)
+            return loop_thread, worker_thread
+
+        loop_thread, worker_thread = asyncio.run(scenario())
+        executor.shutdown()
+        assert loop_thread != worker_thread
+
+    def test_rejects_when_queue_full(self):
+        """Work beyond concurrency + queue size raises ExecutorBusyError."""
+        executor = ProcessingExecutor({"transcribe": 1}, queue_size=1, retry_after_seconds=7)
+        release = threading.Event()
+
+        async def scenario():
+            first = asyncio.ensure_future(executor.run("transcribe", _blocking_wait, release))
+            second = asyncio.ensure_future(executor.run("transcribe", _blocking_wait, release))
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(ExecutorBusyError) as exc_info:
+                await executor.run("transcribe", _blocking_wait, release)
+
+            release.set()
+            return await asyncio.gather(first, second), exc_info.value
+
+        results, error = asyncio.run(scenario())
+        executor.shutdown()
+
+        assert results == ["done", "done"]
+        assert error.retry_after_seconds == 7
+        assert executor.stats()["transcribe"]["rejected"] == 1
+
+    def test_follow_on_stage_not_rejected(self):
+        """admit=False bypasses the queue limit for already-admitted work."""
+        executor = ProcessingExecutor({"deidentify": 1}, queue_size=0)
+        release = threading.Event()
+
+        async def scenario():
+            first = asyncio.ensure_future(executor.run("deidentify", _blocking_wait, release))
+            await asyncio.sleep(0.05)
+            assert executor.is_full("deidentify")
+
+            follow_on = asyncio.ensure_future(
+                executor.run("deidentify", _blocking_wait, release, admit=False)
+            )
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(first, follow_on)
+
+        assert asyncio.run(scenario()) == ["done", "done"]
+        executor.shutdown()
+
+    def test_stages_limit_independently(self):
+        """A full transcription stage does not block de-identification."""
+        executor = ProcessingExecutor({"transcribe": 1, "deidentify": 1}, queue_size=0)
+        release = threading.Event()
+
+        async def scenario():
+            busy = asyncio.ensure_future(executor.run("transcribe", _blocking_wait, release))
+            await asyncio.sleep(0.05)
+            start = time.perf_counter()
+            value = await executor.run("deidentify", str.upper, "ok")
+            elapsed = time.perf_counter() - start
+            release.set()
+            await busy
+            return value, elapsed
+
+        value, elapsed = asyncio.run(scenario())
+        executor.shutdown()
+        assert value == "OK"
+        assert elapsed < 1.0
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            ProcessingExecutor({"transcribe": 1}, queue_size=0, backend="gpu")
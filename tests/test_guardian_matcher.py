@@ -0,0 +1,90 @@
+"""
+Tests for the token-based guardian name recognizer.
+
+Its matches are compared against the lookbehind regex recognizer it
+replaces, on the edge cases and the handoff datasets.
+
+Run with: pytest tests/test_guardian_matcher.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.deidentification import _get_analyzer
+from app.recognizers import GuardianNameRecognizer, get_pediatric_recognizers
+
+TESTS_DIR = Path(__file__).parent
+ENTITIES = ["GUARDIAN_NAME"]
+
+
+@pytest.fixture(scope="module")
+def nlp_engine():
+    return _get_analyzer().nlp_engine
+
+
+def regex_recognizer():
+    return next(r for r in get_pediatric_recognizers() if r.name == "Guardian Name Recognizer")
+
+
+def matches(recognizer, nlp_engine, text):
+    nlp_artifacts = nlp_engine.process_text(text, "en")
+    return sorted((text[r.start:r.end], r.score) for r in recognizer.analyze(text, ENTITIES, nlp_artifacts))
+
+
+class TestGuardianNameRecognizer:
+
+    @pytest.mark.parametrize("text", [
+        "Mom Jessica is at bedside",
+        "MOM JESSICA is at bedside",
+        "Jessica is mom",
+        "Mike is dad",
+        "(Mom Jessica)",
+        "Contact: Mom Jessica",
+        "Guardian Pat signed consent",
+        "Mary-Jane is grandma, aunt maria's number is on file",
+        "mom  Jessica, mom\\nJessica, Mom, Jessica",  # Not single-spaced: no match
+    ])
+    def test_matches_regex_recognizer(self, nlp_engine, text):
+        assert matches(GuardianNameRecognizer(), nlp_engine, text) == matches(regex_recognizer(), nlp_engine, text)
+
+    def test_only_names_matched(self, nlp_engine):
+        # The regex patterns also match "uh" and the second "mom" as names
+        assert matches(GuardianNameRecognizer(), nlp_engine, "dad uh um Rosa, mom mom Jessica, Mom uh Ann") == [
+            ("Ann", 0.75), ("Jessica", 0.85), ("Rosa", 0.75)
+        ]
+
+    def test_relationship_word_must_be_a_token(self, nlp_engine):
+        assert matches(GuardianNameRecognizer(), nlp_engine, "banana bread for breakfast") == []
+        assert matches(regex_recognizer(), nlp_engine, "banana bread for breakfast") == [("bread", 0.85)]
+
+    def test_without_nlp_artifacts(self):
+        assert GuardianNameRecognizer().analyze("Mom Jessica", ENTITIES) == []
+
+    def test_handoff_datasets_match_regex_names(self, nlp_engine):
+        texts = [h["text"] for h in json.loads((TESTS_DIR / "synthetic_handoffs.json").read_text())["handoffs"]]
+        token, regex = GuardianNameRecognizer(), regex_recognizer()
+        missed = [
+            (text, name)
+            for text in texts[:200]
+            for name in set(matches(regex, nlp_engine, text)) - set(matches(token, nlp_engine, text))
+            if name[0].lower() not in {"guardian", "mom", "dad", "uh", "um"}
+        ]
+        assert missed == []
+
+
+class TestRegistry:
+
+    def test_token_recognizer_registered(self):
+        guardian = next(r for r in _get_analyzer().registry.recognizers if r.name == "Guardian Name Recognizer")
+        assert isinstance(guardian, GuardianNameRecognizer)
+        assert guardian.context  # Context words still used for enhancement
+
+    def test_regex_recognizer_selectable(self):
+        guardian = get_pediatric_recognizers(guardian_token_matcher=False)[0]
+        assert len(guardian.patterns) > 30
@@ -0,0 +1,123 @@
+"""
+Tests for the asynchronous job store.
+
+Run with: pytest tests/test_jobs.py -v
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.jobs import (
+    JOB_COMPLETE,
+    JOB_FAILED,
+    JOB_TRANSCRIBING,
+    JobStore,
+    JobStoreFullError,
+)
+
+
+class TestJobStore:
+    """Test bounded storage and TTL eviction."""
+
+    def test_create_and_get(self):
+        store = JobStore(max_jobs=4, ttl_seconds=60)
+        job = store.create("job-1")
+        assert store.get("job-1") is job
+        assert store.get("missing") is None
+
+    def test_full_store_rejects_unfinished_jobs(self):
+        """Unfinished jobs are never evicted to make room."""
+        store = JobStore(max_jobs=2, ttl_seconds=60, retry_after_seconds=5)
+        store.create("a")
+        store.create("b")
+
+        with pytest.raises(JobStoreFullError) as exc_info:
+            store.create("c")
+        assert exc_info.value.retry_after_seconds == 5
+
+    def test_full_store_evicts_oldest_finished(self):
+        store = JobStore(max_jobs=2, ttl_seconds=60)
+
+        async def scenario():
+            first = store.create("a")
+            store.create("b")
+            first.complete({"clean_transcript": ""})
+            store.create("c")
+
+        asyncio.run(scenario())
+        assert store.get("a") is None
+        assert store.get("b") is not None
+        assert store.get("c") is not None
+
+    def test_finished_jobs_expire_after_ttl(self):
+        store = JobStore(max_jobs=4, ttl_seconds=0)
+
+        async def scenario():
+            store.create("a").fail("boom")
+
+        asyncio.run(scenario())
+        assert store.get("a") is None
+
+
+class TestJobEvents:
+    """Test event recording and SSE formatting."""
+
+    def test_events_recorded_in_order(self):
+        store = JobStore(max_jobs=4, ttl_seconds=60)
+
+        async def scenario():
+            job = store.create("a")
+            job.set_stage(JOB_TRANSCRIBING)
+            job.record_segment(4.5, 30.0)
+            job.complete({"clean_transcript": "[NAME] at bedside"})
+            return job
+
+        job = asyncio.run(scenario())
+        assert [e.event_type for e in job.events] == ["stage", "progress", "complete"]
+        assert job.status == JOB_COMPLETE
+        assert job.snapshot()["segments_decoded"] == 1
+
+    def test_progress_events_contain_no_transcript_text(self):
+        store = JobStore(max_jobs=4, ttl_seconds=60)
+
+        async def scenario():
+            job = store.create("a")
+            job.record_segment(2.0, 10.0)
+            return job
+
+        job = asyncio.run(scenario())
+        assert set(job.events[0].data) == {
+            "segments_decoded", "audio_position_seconds", "audio_duration_seconds"
+        }
+
+    def test_sse_frame_format(self):
+        store = JobStore(max_jobs=4, ttl_seconds=60)
+
+        async def scenario():
+            job = store.create("a")
+            job.fail("Transcription failed")
+            return job
+
+        job = asyncio.run(scenario())
+        assert job.status == JOB_FAILED
+        assert job.events[0].to_sse() == (
+            'id: 0\nevent: error\ndata: {"detail": "Transcription failed"}\n\n'
+        )
+
+    def test_wait_for_event_wakes_listener(self):
+        store = JobStore(max_jobs=4, ttl_seconds=60)
+
+        async def scenario():
+            job = store.create("a")
+            waiter = asyncio.ensure_future(job.wait_for_event(0, timeout=5))
+            await asyncio.sleep(0)
+            job.set_stage(JOB_TRANSCRIBING)
+            return await waiter
+
+        assert asyncio.run(scenario()) is True
@@ -0,0 +1,84 @@
+"""
+Tests for the model instance pool.
+
+Run with: pytest tests/test_model_pool.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.model_pool import ModelPool, ModelPoolTimeout
+
+
+class TestModelPool:
+    """Lazy creation, bounded checkouts and statistics."""
+
+    def test_instances_created_lazily_up_to_size(self):
+        created = []
+        pool = ModelPool(lambda i: created.append(i) or f"model-{i}", size=3)
+
+        with pool.checkout() as first:
+            with pool.checkout() as second:
+                assert {first, second} == {"model-0", "model-1"}
+        with pool.checkout():
+            pass
+
+        assert created == [0, 1]  # Idle instance reused instead of loading a third
+        assert pool.stats()["loaded"] == 2
+
+    def test_concurrent_checkouts_bounded_by_size(self):
+        pool = ModelPool(lambda i: object(), size=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def worker():
+            with pool.checkout():
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.05)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = pool.stats()
+        assert max(peak) == 2
+        assert stats["checkouts"] == 6
+        assert stats["wait_seconds_max"] > 0
+        assert stats["in_use"] == 0
+
+    def test_checkout_timeout(self):
+        pool = ModelPool(lambda i: object(), size=1)
+        with pool.checkout():
+            with pytest.raises(ModelPoolTimeout):
+                with pool.checkout(timeout=0.05):
+                    pass
+
+    def test_failed_load_frees_slot(self):
+        attempts = []
+
+        def flaky_factory(index):
+            attempts.append(index)
+            if len(attempts) == 1:
+                raise RuntimeError("out of memory")
+            return "model"
+
+        pool = ModelPool(flaky_factory, size=1)
+        with pytest.raises(RuntimeError):
+            with pool.checkout():
+                pass
+        with pool.checkout() as model:
+            assert model == "model"
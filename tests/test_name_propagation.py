@@ -0,0 +1,87 @@
+"""
+Tests for document-level name propagation.
+
+Run with: pytest tests/test_name_propagation.py -v
+"""
+
+import sys
+from pathlib import Path
+
+from presidio_analyzer import RecognizerResult
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.deidentification import deidentify_text
+from app.name_propagation import RECOGNIZER_NAME, propagate_names
+
+
+def seed(text: str, name: str, entity_type: str = "PERSON", score: float = 0.85) -> RecognizerResult:
+    start = text.index(name)
+    return RecognizerResult(entity_type=entity_type, start=start, end=start + len(name), score=score)
+
+
+def propagated(text: str, results: list[RecognizerResult]) -> list[tuple[str, str, float]]:
+    return [(text[r.start:r.end], r.entity_type, r.score) for r in propagate_names(text, results)]
+
+
+class TestPropagateNames:
+
+    def test_other_occurrences_found_case_insensitively(self):
+        text = "Mom Jessica at bedside. jessica called back, JESSICA again"
+        results = propagate_names(text, [seed(text, "Jessica", "GUARDIAN_NAME")])
+
+        assert [text[r.start:r.end] for r in results] == ["jessica", "JESSICA"]
+        assert all(r.entity_type == "GUARDIAN_NAME" and r.score == 0.85 for r in results)
+        assert results[0].recognition_metadata[RecognizerResult.RECOGNIZER_NAME_KEY] == RECOGNIZER_NAME
+
+    def test_word_boundaries_respected(self):
+        text = "Mom Ann here. Anna, annotated, Ann's"
+        assert propagated(text, [seed(text, "Ann")]) == [("Ann", "PERSON", 0.85)]
+
+    def test_low_score_and_other_entities_not_seeds(self):
+        text = "Jessica in room 4. jessica ok"
+        assert propagated(text, [seed(text, "Jessica", score=0.5)]) == []
+        assert propagated(text, [seed(text, "Jessica", "LOCATION")]) == []
+
+    def test_multi_word_name_words_propagated(self):
+        text = "Patient Sarah Johnson stable. johnson family updated. sarah ate. Sarah Johnson discharged"
+        assert [name for name, _, _ in propagated(text, [seed(text, "Sarah Johnson")])] == [
+            "johnson", "sarah", "Sarah Johnson"
+        ]
+
+    def test_short_stop_and_deny_listed_words_not_propagated(self):
+        text = "Jo Will Nurse seen. jo, will, nurse"
+        assert "nurse" in settings.deny_list_person
+        assert propagated(text, [seed(text, "Jo Will Nurse")]) == []
+
+    def test_titles_not_propagated(self):
+        text = "Dr. Patel saw him. Dr. Lee will follow up, patel agrees"
+        assert propagated(text, [seed(text, "Dr. Patel")]) == [("patel", "PERSON", 0.85)]
+
+    def test_ner_hits_not_seeds(self):
+        """A single NER false positive doesn't redact every use of the word."""
+        text = "Grace period for meds ended. Said grace before feeds"
+        hit = seed(text, "Grace")
+        assert propagated(text, [hit]) == [("grace", "PERSON", 0.85)]
+
+        hit.recognition_metadata = {RecognizerResult.RECOGNIZER_NAME_KEY: "SpacyRecognizer"}
+        assert propagated(text, [hit]) == []
+
+    def test_covered_spans_not_duplicated(self):
+        text = "Dad Mike here. mike left"
+        results = [seed(text, "Mike", "GUARDIAN_NAME"), seed(text, "mike", score=0.4)]
+        assert propagated(text, results) == []
+
+
+class TestDeidentifyText:
+
+    def test_bare_repeat_of_guardian_name_redacted(self):
+        result = deidentify_text("Mom Jessica at bedside. jessica called back.")
+        assert result.clean_text == "Mom [NAME] at bedside. [NAME] called back."
+        assert [e.start for e in result.entities_found] == sorted(e.start for e in result.entities_found)
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "name_propagation_enabled", False)
+        assert "jessica called" in deidentify_text("Mom Jessica at bedside. jessica called back.").clean_text
@@ -0,0 +1,126 @@
+"""
+Tests for combined pattern scanning.
+
+The scanner's results are compared against the plain PatternRecognizers,
+which must agree exactly (recognizer, entity, span and score).
+
+Run with: pytest tests/test_pattern_scanner.py -v
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+from presidio_analyzer import Pattern, PatternRecognizer
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.deidentification import _get_analyzer
+from app.pattern_scanner import (
+    PatternScanner,
+    ScannedPatternRecognizer,
+    _family_key,
+    scan_pattern_recognizers,
+)
+from app.recognizers import get_medical_recognizers, get_pediatric_recognizers
+
+TESTS_DIR = Path(__file__).parent
+ENTITIES = settings.phi_entities + ["PERSON", "LOCATION"]
+
+
+def summarize(results):
+    return sorted(
+        (r.recognition_metadata["recognizer_name"], r.entity_type, r.start, r.end, r.score) for r in results
+    )
+
+
+def assert_equivalent(recognizers, scanned, texts):
+    scanner = scanned[-1]
+    for text in texts:
+        expected = summarize([r for recognizer in recognizers for r in recognizer.analyze(text, ENTITIES)])
+        assert summarize(scanner.analyze(text, ENTITIES)) == expected, text
+
+
+def custom_recognizers():
+    return get_medical_recognizers() + get_pediatric_recognizers()
+
+
+class TestFamilies:
+
+    def test_lookbehind_and_lookahead_families(self):
+        behind, part = _family_key(r"(?i)(?<=mom )[a-z][a-z]+\b", 0)
+        assert behind[1:] == ("behind", r"[a-z][a-z]+\b") and part == "mom "
+
+        ahead, part = _family_key(r"(?i)\b[a-z][a-z]+(?= is (?:dad|father)\b)", 0)
+        assert ahead[1:] == ("ahead", r"\b[a-z][a-z]+") and part == r" is (?:dad|father)\b"
+
+        whole, _ = _family_key(r"\b\d{10}\b", 0)
+        assert whole[1] == "whole"
+
+    def test_guardian_patterns_share_one_scan(self):
+        scanner = scan_pattern_recognizers(custom_recognizers())[-1]
+        assert max(len(family.indices) for family in scanner._families) >= 30
+
+
+class TestEquivalence:
+    """Scanner results equal per-pattern results."""
+
+    def test_handoff_datasets(self):
+        texts = [h["text"] for h in json.loads((TESTS_DIR / "synthetic_handoffs.json").read_text())["handoffs"]]
+        texts += [h["text"] for h in json.loads((TESTS_DIR / "adversarial_handoffs.json").read_text())["handoffs"]]
+        assert_equivalent(custom_recognizers(), scan_pattern_recognizers(custom_recognizers()), texts)
+
+    def test_random_texts(self):
+        words = (
+            "mom mom dad uh baby boy room rm bed 12 3-4 #1234567 MRN 1234567 555.123.4567 "
+            "(617)555-1234 picu nicu icu is Jessica Mom mother Elementary School goes to \n aunt"
+        ).split(" ")
+        rng = random.Random(7)
+        texts = [
+            rng.choice(["", " ", "x"]).join(rng.choice(words) for _ in range(rng.randint(1, 30)))
+            for _ in range(1000)
+        ]
+        assert_equivalent(custom_recognizers(), scan_pattern_recognizers(custom_recognizers()), texts)
+
+    def test_overlapping_and_empty_matches(self):
+        # Members matching overlapping text, and one that can match empty
+        def recognizers():
+            return [PatternRecognizer(
+                supported_entity="ROOM",
+                name="Test Recognizer",
+                patterns=[
+                    Pattern("a", r"(?<=a )\w+\s\w+", 0.5),
+                    Pattern("b", r"(?<=b )\w+\s\w+", 0.6),
+                    Pattern("c", r"(?<=c )x*", 0.7),
+                ],
+            )]
+
+        texts = ["a b c d e f", "c xx c c x a a a b b", "b a one two three", ""]
+        assert_equivalent(recognizers(), scan_pattern_recognizers(recognizers()), texts)
+
+
+class TestRegistry:
+
+    def test_custom_recognizers_registered_as_scanned(self):
+        recognizers = _get_analyzer().registry.recognizers
+        names = [r.name for r in recognizers]
+
+        assert "Pattern Scanner" in names
+        baby = next(r for r in recognizers if r.name == "Baby Name Recognizer")
+        assert isinstance(baby, ScannedPatternRecognizer)
+        assert baby.context  # Context words still used for enhancement
+
+    def test_results_attributed_to_original_recognizers(self):
+        scanned = scan_pattern_recognizers(custom_recognizers())
+        scanner = scanned[-1]
+        assert isinstance(scanner, PatternScanner)
+
+        results = scanner.analyze("Mom Jessica is at bedside in room 4B.", ENTITIES)
+        owners = {r.recognition_metadata["recognizer_identifier"] for r in results}
+        assert owners <= {r.id for r in scanned[:-1]}
+        assert {r.recognition_metadata["recognizer_name"] for r in results} == {
+            "Guardian Name Recognizer", "Room Number Recognizer"
+        }
@@ -0,0 +1,74 @@
+"""
+Tests for per-recognizer instrumentation.
+
+Run with: pytest tests/test_recognizer_metrics.py -v
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+from presidio_analyzer import AnalyzerEngine
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import deidentification
+from app import recognizer_metrics as metrics_module
+from app.config import settings
+from app.deidentification import _build_registry, _get_analyzer, deidentify_text
+from app.recognizer_metrics import Histogram, RecognizerMetrics, instrument_analyzer
+
+TEXT = "Call mom at 555-867-5309 tomorrow. Patient is in room 4B on RA."
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Fresh metrics and an instrumented analyzer in place of the shared one."""
+    shared = _get_analyzer()  # Loaded uninstrumented before enabling metrics
+    fresh = RecognizerMetrics()
+    monkeypatch.setattr(metrics_module, "recognizer_metrics", fresh)
+    monkeypatch.setattr(deidentification, "recognizer_metrics", fresh)
+    monkeypatch.setattr(settings, "recognizer_metrics_enabled", True)
+
+    nlp_engine = copy.copy(shared.nlp_engine)
+    analyzer = AnalyzerEngine(nlp_engine=nlp_engine, registry=_build_registry(nlp_engine, settings.phi_entities))
+    instrument_analyzer(analyzer)
+    monkeypatch.setattr(deidentification, "_analyzer", analyzer)
+    return fresh
+
+
+class TestHistogram:
+
+    def test_values_counted_in_first_bucket_at_or_above(self):
+        histogram = Histogram((1, 5))
+        for value in (0.5, 1, 3, 5, 7):
+            histogram.observe(value)
+        assert histogram.stats() == {"<=1": 2, "<=5": 2, ">5": 1}
+
+
+class TestInstrumentedAnalyzer:
+
+    def test_output_unchanged(self, metrics):
+        instrumented = deidentify_text(TEXT)
+        assert instrumented.clean_text == "Call mom at [PHONE] tomorrow. Patient is in [ROOM] on RA."
+
+    def test_calls_matches_and_outcomes_recorded(self, metrics):
+        deidentify_text(TEXT)
+        stats = metrics.stats()
+
+        assert stats["nlp"]["calls"] == 1
+        room = stats["recognizers"]["Room Number Recognizer"]
+        assert room["calls"] == 1
+        assert room["matches"] >= 1
+        assert room["kept"] >= 1
+        assert sum(room["latency_ms_histogram"].values()) == 1
+        # Every registered recognizer is reported, matched or not
+        assert set(stats["recognizers"]) == {r.name for r in deidentification._analyzer.registry.recognizers}
+
+    def test_reset_keeps_recognizers(self, metrics):
+        deidentify_text(TEXT)
+        metrics.reset()
+        room = metrics.stats()["recognizers"]["Room Number Recognizer"]
+        assert room["calls"] == 0 and room["kept"] == 0
@@ -0,0 +1,87 @@
+"""
+Tests for the sentence-level analyzer result cache.
+
+Run with: pytest tests/test_sentence_cache.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.deidentification import deidentify_text
+from app.sentence_cache import SentenceCache, get_sentence_cache
+
+
+class TestSentenceCache:
+    """Bounded LRU of keyed digests."""
+
+    def test_keys_are_keyed_digests(self):
+        cache = SentenceCache(10)
+        key = cache.key("Afebrile overnight.", b"config")
+
+        assert len(key) == 32
+        assert b"Afebrile" not in key
+        assert cache.key("Afebrile overnight.", b"config") == key
+        assert cache.key("Afebrile overnight.", b"other config") != key
+        # A different process (secret) produces unrelated digests
+        assert SentenceCache(10).key("Afebrile overnight.", b"config") != key
+
+    def test_least_recently_used_evicted(self):
+        cache = SentenceCache(2)
+        cache.put(b"a", ())
+        cache.put(b"b", ())
+        cache.get(b"a")
+        cache.put(b"c", ())
+
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") == ()
+        assert len(cache) == 2
+        assert cache.evictions == 1
+
+    def test_counts_hits_and_misses(self):
+        cache = SentenceCache(10)
+        cache.get(b"a")
+        cache.put(b"a", (("PERSON", 0, 4, 0.85, None),))
+        cache.get(b"a")
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+class TestCachedDeidentification:
+    """deidentify_text with settings.sentence_cache_enabled."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, monkeypatch):
+        monkeypatch.setattr(settings, "sentence_cache_enabled", True)
+        get_sentence_cache().clear()
+
+    def test_results_rebased_onto_document(self):
+        text = "Afebrile overnight. Call back at 555-867-5309 for updates."
+        result = deidentify_text(text)
+
+        phone, = [e for e in result.entities_found if e.entity_type == "PHONE_NUMBER"]
+        assert text[phone.start:phone.end] == "555-867-5309"
+        assert "[PHONE]" in result.clean_text
+
+    def test_repeated_sentences_hit_the_cache(self):
+        text = "Afebrile overnight. Tolerating PO. Call back at 555-867-5309."
+        first = deidentify_text(text)
+        hits = get_sentence_cache().hits
+
+        second = deidentify_text(text)
+        assert get_sentence_cache().hits == hits + 3
+        assert second.clean_text == first.clean_text
+
+    def test_config_change_misses(self, monkeypatch):
+        deidentify_text("Afebrile overnight.")
+        misses = get_sentence_cache().misses
+
+        monkeypatch.setattr(settings, "deny_list_person", settings.deny_list_person + ["afebrile"])
+        deidentify_text("Afebrile overnight.")
+        assert get_sentence_cache().misses == misses + 1
@@ -0,0 +1,113 @@
+"""
+Tests for windowed analysis of long transcripts.
+
+Run with: pytest tests/test_text_windows.py -v
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import text_windows
+from app.config import settings
+from app.deidentification import _get_analyzer, deidentify_text
+from app.text_windows import merge_window_results, plan_windows, sentence_spans
+
+LONG_TEXT = " ".join(
+    f"Patient {i} afebrile overnight. Call mom at 555-867-{i:04d} with updates. Tolerating PO well."
+    for i in range(40)
+)
+
+
+class TestSentenceSplitting:
+
+    def test_splits_on_terminal_punctuation_and_newlines(self):
+        text = "Afebrile overnight.  Mom at bedside!\nCall back tomorrow"
+        assert [text[start:end] for start, end in sentence_spans(text)] == [
+            "Afebrile overnight.", "Mom at bedside!", "Call back tomorrow"
+        ]
+
+    def test_keeps_titles_and_decimals_together(self):
+        text = "Seen by Dr. Patel. Temp 38.5 today."
+        assert [text[start:end] for start, end in sentence_spans(text)] == [
+            "Seen by Dr. Patel.", "Temp 38.5 today."
+        ]
+
+
+class TestPlanWindows:
+
+    def test_windows_cover_text_and_overlap(self):
+        windows = plan_windows(LONG_TEXT, 500, 100)
+
+        assert windows[0][0] == 0 and windows[-1][1] == len(LONG_TEXT)
+        assert all(end - start <= 500 for start, end in windows)
+        for (_, previous_end), (start, _) in zip(windows, windows[1:]):
+            assert start < previous_end
+            # Windows start on sentence boundaries
+            assert LONG_TEXT[start - 2:start] == ". "
+
+    def test_short_text_is_one_window(self):
+        assert plan_windows("Afebrile overnight.", 500, 100) == [(0, 19)]
+
+    def test_long_sentence_force_split_with_overlap(self):
+        text = " ".join(["word"] * 300)
+        windows = plan_windows(text, 200, 50)
+
+        assert windows[-1][1] == len(text)
+        assert all(end - start <= 200 for start, end in windows)
+        assert all(start < previous_end for (_, previous_end), (start, _) in zip(windows, windows[1:]))
+
+
+class TestMergeWindowResults:
+
+    def test_seam_entity_taken_once(self):
+        # Both windows see the phone number in their overlap [50, 100)
+        windows = [(0, 100), (50, 150)]
+        results = [
+            [("PHONE_NUMBER", 60, 72, 0.9, None)],
+            [("PHONE_NUMBER", 10, 22, 0.9, None), ("PERSON", 60, 65, 0.8, None)],
+        ]
+        merged = merge_window_results(windows, results)
+
+        assert sorted((r.entity_type, r.start, r.end) for r in merged) == [
+            ("PERSON", 110, 115), ("PHONE_NUMBER", 60, 72)
+        ]
+
+    def test_contained_duplicates_removed(self):
+        windows = [(0, 100), (50, 150)]
+        results = [
+            [("PERSON", 70, 77, 0.85, None), ("PERSON", 70, 83, 0.85, None)],
+            [],
+        ]
+        merged = merge_window_results(windows, results)
+        assert [(r.start, r.end) for r in merged] == [(70, 83)]
+
+
+class TestWindowedDeidentification:
+    """deidentify_text on texts longer than deidentify_window_chars."""
+
+    def test_matches_whole_text_analysis(self, monkeypatch):
+        whole = deidentify_text(LONG_TEXT)
+
+        monkeypatch.setattr(settings, "deidentify_window_chars", 400)
+        monkeypatch.setattr(settings, "deidentify_window_overlap_chars", 100)
+        windowed = deidentify_text(LONG_TEXT)
+
+        assert windowed.clean_text == whole.clean_text
+        assert windowed.entity_counts_by_type == whole.entity_counts_by_type
+
+    def test_parallel_windows_match_in_process(self, monkeypatch):
+        monkeypatch.setattr(settings, "deidentify_window_chars", 400)
+        in_process = deidentify_text(LONG_TEXT)
+
+        pool = ThreadPoolExecutor(max_workers=2)
+        monkeypatch.setattr(settings, "deidentify_window_workers", 2)
+        monkeypatch.setattr(text_windows, "_get_pool", lambda: pool)
+        monkeypatch.setattr(text_windows, "_worker_analyzer", _get_analyzer())
+        parallel = deidentify_text(LONG_TEXT)
+        pool.shutdown()
+
+        assert parallel.clean_text == in_process.clean_text
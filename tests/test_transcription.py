@@ -0,0 +1,138 @@
+"""
+Tests for audio decoding ahead of transcription.
+
+These exercise PyAV decoding only; no Whisper model is loaded.
+
+Run with: pytest tests/test_transcription.py -v
+"""
+
+import io
+import sys
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.transcription as transcription
+from app.config import settings
+from app.model_pool import ModelPool
+from app.transcription import (
+    WHISPER_SAMPLE_RATE,
+    DecodeProfileError,
+    load_audio,
+    resolve_decode_profile,
+    transcribe_audio,
+)
+
+
+def _wav_bytes(seconds: float = 0.5, sample_rate: int = 22050) -> bytes:
+    samples = (0.2 * np.sin(np.arange(int(seconds * sample_rate)) / 10) * 32767).astype(np.int16)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+class TestLoadAudio:
+    """In-memory decode with temp-file fallback."""
+
+    def test_decodes_bytes_in_memory(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "temp_dir", str(tmp_path))
+        pcm, path = load_audio(_wav_bytes(), ".wav")
+
+        assert path == "memory"
+        assert pcm.dtype == np.float32
+        assert len(pcm) == pytest.approx(WHISPER_SAMPLE_RATE * 0.5, abs=WHISPER_SAMPLE_RATE * 0.01)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_file_object_matches_bytes(self):
+        audio = _wav_bytes()
+        from_bytes, _ = load_audio(audio, ".wav")
+        from_file, _ = load_audio(io.BytesIO(audio), ".wav")
+        np.testing.assert_array_equal(from_bytes, from_file)
+
+    def test_falls_back_to_temp_file(self, tmp_path, monkeypatch):
+        """A failed in-memory decode rewinds the upload and retries from disk."""
+        monkeypatch.setattr(settings, "temp_dir", str(tmp_path))
+        upload = io.BytesIO(_wav_bytes())
+
+        def failing_decode(audio, sampling_rate):
+            audio.read(100)
+            raise ValueError("unsupported container")
+
+        monkeypatch.setattr(transcription, "_decode_in_memory", failing_decode)
+        pcm, path = load_audio(upload, ".wav")
+
+        assert path == "temp_file"
+        assert len(pcm) > 0
+        assert list(tmp_path.iterdir()) == []  # Temp file removed
+
+    def test_in_memory_decode_can_be_disabled(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "temp_dir", str(tmp_path))
+        monkeypatch.setattr(settings, "audio_decode_in_memory", False)
+        _, path = load_audio(_wav_bytes(), ".wav")
+        assert path == "temp_file"
+
+
+class TestDecodeProfiles:
+    """Named decode profiles resolve to transcribe() arguments."""
+
+    def test_default_profile_matches_original_decoding(self):
+        name, kwargs = resolve_decode_profile()
+        assert name == "balanced"
+        assert kwargs["beam_size"] == 5
+        assert kwargs["temperature"] == [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
+        assert kwargs["vad_parameters"] == {"min_silence_duration_ms": 500, "threshold": 0.5}
+
+    def test_fast_profile_is_greedy(self):
+        _, kwargs = resolve_decode_profile("fast")
+        assert kwargs["beam_size"] == 1
+        assert kwargs["temperature"] == [0.0]
+
+    def test_returns_independent_copy(self):
+        _, kwargs = resolve_decode_profile("balanced")
+        kwargs["vad_parameters"]["threshold"] = 0.9
+        assert settings.decode_profiles["balanced"]["vad_parameters"]["threshold"] == 0.5
+
+    def test_unknown_profile(self):
+        with pytest.raises(DecodeProfileError, match="Available"):
+            resolve_decode_profile("turbo")
+
+
+class TestHallucinationCleanup:
+    """Per-segment cleanup keeps the whole-transcript meaning of anchored patterns."""
+
+    @pytest.fixture
+    def transcribe_segments(self, monkeypatch):
+        def transcribe(texts):
+            class FakeModel:
+                def transcribe(self, pcm, **kwargs):
+                    segments = (SimpleNamespace(start=i, end=i + 1, text=t) for i, t in enumerate(texts))
+                    return segments, SimpleNamespace(
+                        duration=float(len(texts)), language="en", language_probability=1.0
+                    )
+
+            monkeypatch.setattr(transcription, "whisper_pool", ModelPool(lambda index: FakeModel(), size=1, name="fake"))
+            monkeypatch.setattr(settings, "whisper_batching", False)
+            streamed = []
+            text, _ = transcribe_audio(_wav_bytes(), ".wav", on_segment=lambda s, d: streamed.append(s["text"]))
+            return text, streamed
+
+        return transcribe
+
+    def test_bye_kept_mid_transcript(self, transcribe_segments):
+        text, streamed = transcribe_segments([" Tell mom to say bye.", " you", " Thanks for watching. Bye."])
+        assert text == "Tell mom to say bye. you"
+        assert streamed == ["Tell mom to say bye.", "you", ""]
+
+    def test_standalone_you_removed_only_as_whole_transcript(self, transcribe_segments):
+        assert transcribe_segments([" Thanks for watching!", " you"]) == ("", ["", ""])
+        assert transcribe_segments([" Stable overnight.", " you"])[0] == "Stable overnight. you"